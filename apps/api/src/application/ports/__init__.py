@@ -1,14 +1,34 @@
 from src.application.ports.whisper_service import WhisperService
 from src.application.ports.video_downloader import VideoDownloader
-from src.application.ports.transcription_repository import TranscriptionRepository
+from src.application.ports.transcription_repository import (
+    TranscriptionPage,
+    TranscriptionQuery,
+    TranscriptionRepository,
+    TranscriptionSummary,
+)
 from src.application.ports.profile_video_lister import ProfileVideoLister, ProfileVideoInfo
+from src.application.ports.playlist_video_lister import PlaylistVideoLister
 from src.application.ports.batch_repository import BatchTranscriptionRepository
+from src.application.ports.inference_scheduler import InferenceScheduler, InferenceSlot
+from src.application.ports.job_queue import Job, JobQueue
+from src.application.ports.media_downloader import MediaDownloader
+from src.application.ports.caption_source import CaptionSource
 
 __all__ = [
     "WhisperService",
     "VideoDownloader",
     "TranscriptionRepository",
+    "TranscriptionQuery",
+    "TranscriptionPage",
+    "TranscriptionSummary",
     "ProfileVideoLister",
     "ProfileVideoInfo",
+    "PlaylistVideoLister",
     "BatchTranscriptionRepository",
+    "InferenceScheduler",
+    "InferenceSlot",
+    "Job",
+    "JobQueue",
+    "MediaDownloader",
+    "CaptionSource",
 ]
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.application.ports.whisper_service import WhisperResult
+
+
+class CaptionSource(ABC):
+    """Transcripts a platform already publishes for a video, such as YouTube subtitles."""
+
+    @abstractmethod
+    async def get_captions(
+        self,
+        url: str,
+        language: Optional[str] = None,
+        include_automatic: bool = False,
+    ) -> Optional[WhisperResult]:
+        """Returns captions in the language (the video's own when None), or None if missing.
+
+        include_automatic also accepts the platform's speech-recognition captions.
+        """
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncContextManager
+
+
+@dataclass(frozen=True)
+class InferenceSlot:
+    """The right to run one transcription on a device until the slot is released."""
+
+    device: str
+    index: int
+    num_threads: int
+
+
+class InferenceScheduler(ABC):
+    @abstractmethod
+    def acquire(self) -> AsyncContextManager[InferenceSlot]:
+        """Waits for a free slot and holds it for the duration of the context."""
+        pass
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Collection, Optional
+from uuid import UUID
+
+
+@dataclass
+class Job:
+    id: UUID
+    kind: str
+    payload: dict[str, Any]
+    attempts: int
+    """How many times the job has been claimed, including this one."""
+
+
+class JobQueue(ABC):
+    """Durable work queue with claim/ack semantics.
+
+    A claimed job stays invisible to other workers until its visibility timeout runs out;
+    a job that is neither acked nor extended by then is handed out again.
+    """
+
+    @abstractmethod
+    async def enqueue(self, kind: str, payload: dict[str, Any], priority: int = 0) -> UUID:
+        """Adds a job; higher priority jobs are claimed first, then oldest first."""
+        pass
+
+    @abstractmethod
+    async def claim(
+        self, visibility_timeout: float, kinds: Optional[Collection[str]] = None
+    ) -> Optional[Job]:
+        """Takes the next claimable job, only of the given kinds when kinds is set."""
+        pass
+
+    @abstractmethod
+    async def extend(self, job_id: UUID, visibility_timeout: float) -> None:
+        pass
+
+    @abstractmethod
+    async def ack(self, job_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    async def fail(self, job_id: UUID, error: str) -> None:
+        """Gives up on a job for good; recent failures are kept for inspection, never claimed."""
+        pass
+
+    @abstractmethod
+    async def recover(self) -> int:
+        """Makes every in-flight job claimable again. Called once at startup."""
+        pass
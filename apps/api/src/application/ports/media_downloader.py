@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from src.application.ports.whisper_service import AudioSource
+
+
+class MediaDownloader(ABC):
+    """Fetches media files from direct links (e.g. CDN URLs), as opposed to page URLs."""
+
+    @abstractmethod
+    async def fetch(
+        self,
+        url: str,
+        output_path: str,
+        max_memory_bytes: int = 0,
+        on_progress: Optional[Callable[[float], None]] = None,
+    ) -> AudioSource:
+        """Returns the media as bytes if it fits max_memory_bytes, else writes output_path."""
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+from src.application.ports.profile_video_lister import ProfileVideoInfo
+
+
+class PlaylistVideoLister(ABC):
+    """Expands playlist and channel URLs into their videos."""
+
+    @abstractmethod
+    def is_playlist_url(self, url: str) -> bool:
+        """True if the URL names a playlist or channel rather than a single video."""
+        pass
+
+    @abstractmethod
+    def stream_videos(
+        self,
+        playlist_url: str,
+        max_videos: Optional[int] = None,
+    ) -> AsyncIterator[ProfileVideoInfo]:
+        """Yields videos page by page, so work can start before the listing is done."""
+        pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 
 @dataclass
@@ -26,6 +26,15 @@ class ProfileVideoLister(ABC):
     ) -> list[ProfileVideoInfo]:
         pass
 
+    async def stream_videos(
+        self,
+        profile_url: str,
+        max_videos: Optional[int] = None,
+    ) -> AsyncIterator[ProfileVideoInfo]:
+        """Yields videos as they are found, so work can start before the listing is done."""
+        for video in await self.list_videos(profile_url, max_videos):
+            yield video
+
     @abstractmethod
     async def validate_profile_url(self, url: str) -> str:
         """Validates the URL and returns the username. Raises ValueError on invalid URLs."""
@@ -1,8 +1,91 @@
+import base64
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from src.domain.entities import Transcription
+from src.domain.entities.transcription import SourceType, TranscriptionStatus
+
+
+@dataclass
+class TranscriptionSummary:
+    """Listing projection of a Transcription: everything except the transcript itself."""
+
+    id: UUID
+    status: TranscriptionStatus
+    source_type: SourceType
+    source_name: Optional[str]
+    progress: float
+    language: Optional[str]
+    error_message: Optional[str]
+    model_used: str
+    batch_id: Optional[UUID]
+    views_count: Optional[int]
+    likes_count: Optional[int]
+    comments_count: Optional[int]
+    created_at: datetime
+    completed_at: Optional[datetime]
+
+    @classmethod
+    def of(cls, t: Transcription) -> "TranscriptionSummary":
+        if t.source.type == SourceType.INSTAGRAM and t.source.owner_username:
+            name = f"@{t.source.owner_username}"
+        else:
+            name = t.source.filename or t.source.title
+
+        return cls(
+            id=t.id,
+            status=t.status,
+            source_type=t.source.type,
+            source_name=name,
+            progress=t.progress,
+            language=t.result.language if t.result else None,
+            error_message=t.error_message,
+            model_used=t.model_used,
+            batch_id=t.batch_id,
+            views_count=t.source.views_count,
+            likes_count=t.source.likes_count,
+            comments_count=t.source.comments_count,
+            created_at=t.created_at,
+            completed_at=t.completed_at,
+        )
+
+
+@dataclass
+class TranscriptionQuery:
+    limit: int = 50
+    cursor: Optional[str] = None
+    status: Optional[TranscriptionStatus] = None
+    source_type: Optional[SourceType] = None
+    batch_id: Optional[UUID] = None
+
+    def matches(self, t: Transcription) -> bool:
+        return (
+            (self.status is None or t.status == self.status)
+            and (self.source_type is None or t.source.type == self.source_type)
+            and (self.batch_id is None or t.batch_id == self.batch_id)
+        )
+
+
+@dataclass
+class TranscriptionPage:
+    items: list[TranscriptionSummary]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Opaque keyset cursor: pages are ordered newest first by (created_at, id)."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
 
 
 class TranscriptionRepository(ABC):
@@ -18,6 +101,11 @@ class TranscriptionRepository(ABC):
     async def list_all(self) -> list[Transcription]:
         pass
 
+    @abstractmethod
+    async def list_summaries(self, query: TranscriptionQuery) -> TranscriptionPage:
+        """Returns one page of summaries, newest first, filtered by the query."""
+        pass
+
     @abstractmethod
     async def delete(self, id: UUID) -> bool:
         pass
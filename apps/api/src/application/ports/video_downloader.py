@@ -11,6 +11,10 @@ class VideoInfo:
 
 
 class VideoDownloader(ABC):
+    def canonical_url(self, url: str) -> str:
+        """Returns one stable URL per video so equivalent links can share work."""
+        return url.strip()
+
     @abstractmethod
     async def get_info(self, url: str) -> VideoInfo:
         pass
@@ -22,4 +26,5 @@ class VideoDownloader(ABC):
         output_path: str,
         on_progress: Optional[Callable[[float], None]] = None,
     ) -> str:
+        """Downloads the audio and returns the path written, whose extension may differ."""
         pass
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Optional
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Optional, Union
 
+from src.application.ports.inference_scheduler import InferenceSlot
 from src.domain.entities import TranscriptionSegment
 
+# A path to a media file, or the encoded media itself (e.g. a download kept in memory)
+AudioSource = Union[str, bytes]
+
 
 class WhisperResult:
     def __init__(self, text: str, segments: list[TranscriptionSegment], language: str):
@@ -11,14 +16,64 @@ class WhisperResult:
         self.language = language
 
 
+@dataclass
+class LanguageDetection:
+    language: str
+    probability: float
+
+
+@dataclass
+class DecodeProgress:
+    percent: float
+    audio_seconds_done: float
+    audio_seconds_total: float
+    elapsed_seconds: float
+
+    @property
+    def realtime_factor(self) -> Optional[float]:
+        """Processing seconds spent per second of audio decoded so far."""
+        if self.audio_seconds_done <= 0:
+            return None
+        return self.elapsed_seconds / self.audio_seconds_done
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        if self.realtime_factor is None:
+            return None
+        return (self.audio_seconds_total - self.audio_seconds_done) * self.realtime_factor
+
+
 class WhisperService(ABC):
     @abstractmethod
     async def transcribe(
         self,
-        audio_path: str,
+        audio: AudioSource,
         language: Optional[str] = None,
+        model_size: Optional[str] = None,
         on_progress: Optional[Callable[[float], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+        slot: Optional[InferenceSlot] = None,
     ) -> WhisperResult:
+        """Runs on the slot's device and thread budget when one is given."""
+        pass
+
+    @abstractmethod
+    def transcribe_stream(
+        self,
+        audio: AudioSource,
+        language: Optional[str] = None,
+        model_size: Optional[str] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_language: Optional[Callable[[str], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+        slot: Optional[InferenceSlot] = None,
+    ) -> AsyncIterator[TranscriptionSegment]:
+        """Yields segments as each ~30 s window is decoded. on_language fires once detected."""
+        pass
+
+    @abstractmethod
+    async def detect_language(self, audio: AudioSource) -> LanguageDetection:
+        """Identifies the spoken language from the first 30 s only, on the smallest model."""
         pass
 
     @abstractmethod
@@ -0,0 +1,39 @@
+import logging
+import time
+from typing import Optional
+
+from src.application.ports import CaptionSource
+from src.application.use_cases.coalescing import SharedTranscription
+
+logger = logging.getLogger(__name__)
+
+CAPTIONS_DEVICE = "captions"
+
+
+async def caption_transcription(
+    source: Optional[CaptionSource],
+    url: str,
+    language: Optional[str],
+    include_automatic: bool,
+    duration_seconds: Optional[float],
+) -> Optional[SharedTranscription]:
+    """Returns the video's published captions as the transcription, or None to run Whisper."""
+    if source is None:
+        return None
+
+    start_time = time.time()
+    try:
+        result = await source.get_captions(url, language, include_automatic)
+    except Exception as e:
+        logger.warning(f"Could not read captions for {url}, falling back to Whisper: {e}")
+        return None
+    if result is None or not result.segments:
+        return None
+
+    logger.info(f"Using {result.language} captions for {url}, skipping download and inference")
+    return SharedTranscription(
+        result=result,
+        device=CAPTIONS_DEVICE,
+        processing_time=time.time() - start_time,
+        duration_seconds=duration_seconds or result.segments[-1].end,
+    )
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from src.application.ports.whisper_service import WhisperResult
+from src.application.use_cases.single_flight import SingleFlight
+from src.domain.entities import Transcription
+
+
+@dataclass
+class SharedTranscription:
+    """Outcome of one download + inference run, shared by every coalesced job."""
+
+    result: WhisperResult
+    device: str
+    processing_time: float
+    duration_seconds: float
+
+
+TranscriptionFlights = SingleFlight[SharedTranscription, Transcription]
+
+
+def coalescing_key(canonical_url: str, model_size: str, language: Optional[str]) -> tuple:
+    return (canonical_url, model_size, language or "auto")
+
+
+async def run_coalesced(
+    flights: Optional[TranscriptionFlights],
+    key: tuple,
+    transcription: Transcription,
+    work: Callable[[list[Transcription]], Awaitable[SharedTranscription]],
+) -> SharedTranscription:
+    """Runs work for this transcription, or joins an identical run that is already in flight."""
+    if flights is None:
+        return await work([transcription])
+
+    in_flight = flights.participants(key)
+    if in_flight:
+        transcription.follow(in_flight[0])
+    return await flights.do(key, work, transcription)
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Sequence
+from uuid import UUID
+
+from src.application.ports import Job, JobQueue
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Job], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class JobLane:
+    """Workers reserved for some job kinds, which the other workers never claim."""
+
+    kinds: frozenset[str]
+    workers: int
+
+
+class JobWorkers:
+    """Drains a JobQueue with a fixed number of concurrent workers.
+
+    Idle workers are woken by enqueue() and otherwise poll the queue every poll_interval.
+    While a job runs its lease is extended, so only jobs whose worker died are handed out
+    again. A handler that raises fails its job; handlers mark their own entities failed.
+    Each lane gets its own workers, so long jobs in a lane cannot hold every worker.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: dict[str, JobHandler],
+        workers: int,
+        visibility_timeout: float,
+        poll_interval: float = 1.0,
+        lanes: Sequence[JobLane] = (),
+    ):
+        self._queue = queue
+        self._handlers = handlers
+        self._visibility_timeout = visibility_timeout
+        self._poll_interval = poll_interval
+        reserved = frozenset().union(*(lane.kinds for lane in lanes))
+        # The default workers claim every kind no lane reserves; with no lanes, any kind
+        default_kinds = frozenset(handlers) - reserved if lanes else None
+        self._lanes: list[tuple[Optional[frozenset[str]], int]] = [
+            (default_kinds, workers),
+            *((lane.kinds, lane.workers) for lane in lanes),
+        ]
+        self._wakeups = [asyncio.Event() for _ in self._lanes]
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        recovered = await self._queue.recover()
+        if recovered:
+            logger.info(f"Requeued {recovered} jobs interrupted by the last shutdown")
+        self._tasks = [
+            asyncio.create_task(self._run(kinds, wakeup), name=f"job-worker-{lane}-{i}")
+            for lane, ((kinds, workers), wakeup) in enumerate(zip(self._lanes, self._wakeups))
+            for i in range(workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancels running jobs; they stay leased and are requeued on the next start()."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def enqueue(self, kind: str, payload: dict[str, Any], priority: int = 0) -> UUID:
+        job_id = await self._queue.enqueue(kind, payload, priority)
+        lane = next((i for i, (kinds, _) in enumerate(self._lanes) if kinds and kind in kinds), 0)
+        self._wakeups[lane].set()
+        return job_id
+
+    async def _run(self, kinds: Optional[frozenset[str]], wakeup: asyncio.Event) -> None:
+        while True:
+            job: Optional[Job] = await self._queue.claim(self._visibility_timeout, kinds)
+            if job is None:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+                continue
+            await self._process(job)
+
+    async def _process(self, job: Job) -> None:
+        handler = self._handlers.get(job.kind)
+        if handler is None:
+            await self._queue.fail(job.id, f"No handler for job kind {job.kind}")
+            return
+
+        heartbeat = asyncio.create_task(self._keep_leased(job.id))
+        try:
+            await handler(job)
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+            await self._queue.fail(job.id, str(e))
+        else:
+            await self._queue.ack(job.id)
+        finally:
+            heartbeat.cancel()
+
+    async def _keep_leased(self, job_id: UUID) -> None:
+        while True:
+            await asyncio.sleep(self._visibility_timeout / 3)
+            try:
+                await self._queue.extend(job_id, self._visibility_timeout)
+            except Exception as e:
+                logger.warning(f"Could not extend lease of job {job_id}: {e}")
@@ -0,0 +1,61 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.application.ports import WhisperService
+from src.application.ports.whisper_service import AudioSource
+
+logger = logging.getLogger(__name__)
+
+
+class UnsupportedLanguageError(Exception):
+    pass
+
+
+@dataclass
+class LanguageRouting:
+    """Which model transcribes each spoken language, and which languages are accepted.
+
+    An empty allowed_languages accepts every language.
+    """
+
+    models: dict[str, str] = field(default_factory=dict)
+    allowed_languages: list[str] = field(default_factory=list)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.models or self.allowed_languages)
+
+    def route(self, language: str, model_size: str) -> str:
+        if self.allowed_languages and language not in self.allowed_languages:
+            raise UnsupportedLanguageError(f"Language '{language}' is not supported")
+        return self.models.get(language, model_size)
+
+
+async def route_language(
+    whisper_service: WhisperService,
+    routing: Optional[LanguageRouting],
+    audio: AudioSource,
+    language: Optional[str],
+    model_size: str,
+) -> tuple[Optional[str], str]:
+    """Returns the (language, model_size) to transcribe with.
+
+    Auto-language jobs whose route depends on the language detect it first. Call it before
+    acquiring an inference slot, so detection never holds one. A detected language is
+    pinned, so the transcription does not detect it again. Raises UnsupportedLanguageError
+    for languages the routing does not accept.
+    """
+    if not routing or not routing.enabled:
+        return language, model_size
+
+    if not language:
+        try:
+            detected = await whisper_service.detect_language(audio)
+        except Exception as e:
+            logger.warning(f"Language detection failed, transcribing with auto-detect: {e}")
+            return language, model_size
+        logger.info(f"Detected language '{detected.language}' (p={detected.probability:.2f})")
+        language = detected.language
+
+    return language, routing.route(language, model_size)
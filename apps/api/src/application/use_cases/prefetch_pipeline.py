@@ -0,0 +1,96 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, TypeVar, Union
+
+from src.application.ports.whisper_service import AudioSource
+
+T = TypeVar("T")
+
+
+class PrefetchTicket:
+    """A place in the ready-audio buffer, from before the download until inference starts."""
+
+    def __init__(self, pipeline: "PrefetchPipeline"):
+        self._pipeline = pipeline
+        self._bytes = 0
+        self._released = False
+
+    def hold(self, audio: AudioSource) -> None:
+        """Counts the downloaded media, on disk or in memory, against the buffer's budget."""
+        if isinstance(audio, str):
+            try:
+                size = os.path.getsize(audio)
+            except OSError:
+                return
+        else:
+            size = len(audio)
+        self._pipeline._buffered_bytes += size - self._bytes
+        self._bytes = size
+
+    async def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        async with self._pipeline._room:
+            self._pipeline._buffered -= 1
+            self._pipeline._buffered_bytes -= self._bytes
+            self._pipeline._room.notify_all()
+
+
+class PrefetchPipeline:
+    """Stages batch work so inference never waits on the network and disk use stays bounded.
+
+    Each video takes a ticket before it downloads and gives it back once an inference slot
+    picks it up. At most buffer_depth videos are downloading or waiting with audio on disk,
+    new downloads wait while the waiting audio exceeds max_buffered_bytes, and at most
+    download_concurrency downloads run at once. One pipeline is shared by every batch.
+    """
+
+    def __init__(self, download_concurrency: int, buffer_depth: int, max_buffered_bytes: int):
+        self._downloads = asyncio.Semaphore(download_concurrency)
+        self._buffer_depth = max(buffer_depth, 1)
+        self._max_buffered_bytes = max_buffered_bytes
+        self._buffered = 0
+        self._buffered_bytes = 0
+        self._room = asyncio.Condition()
+
+    def _has_room(self) -> bool:
+        if self._buffered >= self._buffer_depth:
+            return False
+        # Always admit one video so a single oversized file cannot stall the pipeline
+        return self._buffered == 0 or self._buffered_bytes < self._max_buffered_bytes
+
+    @asynccontextmanager
+    async def reserve(self) -> AsyncIterator[PrefetchTicket]:
+        async with self._room:
+            await self._room.wait_for(self._has_room)
+            self._buffered += 1
+        ticket = PrefetchTicket(self)
+        try:
+            yield ticket
+        finally:
+            await ticket.release()
+
+    @asynccontextmanager
+    async def downloading(self) -> AsyncIterator[None]:
+        async with self._downloads:
+            yield
+
+
+async def process_all(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    process: Callable[[T], Awaitable[None]],
+) -> None:
+    """Starts process for every item as soon as the source yields it and waits for them all."""
+    tasks: list[asyncio.Task] = []
+    try:
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                tasks.append(asyncio.ensure_future(process(item)))
+        else:
+            tasks = [asyncio.ensure_future(process(item)) for item in items]
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
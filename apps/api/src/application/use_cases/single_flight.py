@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+P = TypeVar("P")
+
+
+class _Flight(Generic[T, P]):
+    def __init__(self, participants: list[P]):
+        self.participants = participants
+        self.task: Optional[asyncio.Future[T]] = None
+
+
+class SingleFlight(Generic[T, P]):
+    """Coalesces concurrent calls for the same key into one shared execution.
+
+    The first caller starts the work; later callers with the same key join it and await
+    the same result. The work receives the live list of participants so it can report
+    progress to every caller, including ones that join after it started. The shared task
+    outlives any single caller being cancelled.
+    """
+
+    def __init__(self):
+        self._flights: dict[Hashable, _Flight[T, P]] = {}
+
+    def participants(self, key: Hashable) -> list[P]:
+        flight = self._flights.get(key)
+        return list(flight.participants) if flight else []
+
+    def _forget(self, key: Hashable, flight: _Flight[T, P]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    async def do(
+        self,
+        key: Hashable,
+        work: Callable[[list[P]], Awaitable[T]],
+        participant: P,
+    ) -> T:
+        flight = self._flights.get(key)
+        if flight:
+            flight.participants.append(participant)
+        else:
+            flight = _Flight([participant])
+            self._flights[key] = flight
+            flight.task = asyncio.ensure_future(work(flight.participants))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+
+        return await asyncio.shield(flight.task)
@@ -0,0 +1,64 @@
+from contextlib import nullcontext
+from typing import AsyncContextManager, Callable, Optional
+
+from src.application.ports import (
+    InferenceScheduler,
+    InferenceSlot,
+    TranscriptionRepository,
+    WhisperService,
+)
+from src.application.ports.whisper_service import AudioSource, DecodeProgress, WhisperResult
+from src.domain.entities import Transcription, TranscriptionSegment
+
+
+def acquire_slot(
+    scheduler: Optional[InferenceScheduler],
+) -> AsyncContextManager[Optional[InferenceSlot]]:
+    """Waits for an inference slot; without a scheduler, inference is not limited."""
+    return scheduler.acquire() if scheduler else nullcontext(None)
+
+
+async def transcribe_incrementally(
+    whisper_service: WhisperService,
+    repository: TranscriptionRepository,
+    transcriptions: list[Transcription],
+    audio: AudioSource,
+    language: Optional[str],
+    model_size: str,
+    on_progress: Optional[Callable[[float], None]] = None,
+    slot: Optional[InferenceSlot] = None,
+) -> WhisperResult:
+    """Streams segments into the transcriptions as they are decoded and returns the full result.
+
+    The list may grow while decoding when other jobs join a coalesced run.
+    """
+    detected_language = language or "unknown"
+
+    def on_language(value: str) -> None:
+        nonlocal detected_language
+        detected_language = value
+
+    def on_metrics(progress: DecodeProgress) -> None:
+        for transcription in transcriptions:
+            transcription.update_decode_metrics(progress.eta_seconds, progress.realtime_factor)
+
+    segments: list[TranscriptionSegment] = []
+    async for segment in whisper_service.transcribe_stream(
+        audio=audio,
+        language=language,
+        model_size=model_size,
+        on_progress=on_progress,
+        on_language=on_language,
+        on_metrics=on_metrics,
+        slot=slot,
+    ):
+        segments.append(segment)
+        for transcription in transcriptions:
+            transcription.append_segment(segment)
+            await repository.save(transcription)
+
+    return WhisperResult(
+        text=" ".join(segment.text for segment in segments),
+        segments=segments,
+        language=detected_language,
+    )
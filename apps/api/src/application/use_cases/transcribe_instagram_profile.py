@@ -1,29 +1,36 @@
-import asyncio
 import logging
 import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID, uuid4
 
-import httpx
-
 from src.application.ports import (
     BatchTranscriptionRepository,
+    InferenceScheduler,
+    MediaDownloader,
+    ProfileVideoInfo,
     ProfileVideoLister,
     TranscriptionRepository,
     VideoDownloader,
     WhisperService,
 )
+from src.application.ports.whisper_service import AudioSource
+from src.application.use_cases.coalescing import (
+    SharedTranscription,
+    TranscriptionFlights,
+    coalescing_key,
+    run_coalesced,
+)
+from src.application.use_cases.language_routing import LanguageRouting, route_language
+from src.application.use_cases.prefetch_pipeline import PrefetchPipeline, process_all
+from src.application.use_cases.streaming import acquire_slot, transcribe_incrementally
 from src.domain.entities import Transcription, TranscriptionResult
 from src.domain.entities.transcription import SourceType, VideoSource
 
 logger = logging.getLogger(__name__)
 
-# Global lock: MPS (Apple GPU) crashes on concurrent Whisper inference
-_whisper_lock = asyncio.Lock()
-
 
 @dataclass
 class TranscribeInstagramProfileInput:
@@ -38,17 +45,31 @@ class TranscribeInstagramProfileUseCase:
         self,
         profile_video_lister: ProfileVideoLister,
         video_downloader: VideoDownloader,
+        media_downloader: MediaDownloader,
         whisper_service: WhisperService,
         transcription_repository: TranscriptionRepository,
         batch_repository: BatchTranscriptionRepository,
         upload_dir: str,
+        flights: Optional[TranscriptionFlights] = None,
+        scheduler: Optional[InferenceScheduler] = None,
+        pipeline: Optional[PrefetchPipeline] = None,
+        memory_budget_bytes: int = 0,
+        language_routing: Optional[LanguageRouting] = None,
     ):
         self._lister = profile_video_lister
         self._downloader = video_downloader
+        self._media_downloader = media_downloader
         self._whisper = whisper_service
         self._transcription_repo = transcription_repository
         self._batch_repo = batch_repository
         self._upload_dir = upload_dir
+        self._flights = flights
+        self._scheduler = scheduler
+        self._pipeline = pipeline or PrefetchPipeline(
+            download_concurrency=3, buffer_depth=3, max_buffered_bytes=2**40
+        )
+        self._memory_budget_bytes = memory_budget_bytes
+        self._language_routing = language_routing
 
     async def execute(self, batch_id: UUID, input_data: TranscribeInstagramProfileInput) -> None:
         batch = await self._batch_repo.get(batch_id)
@@ -59,59 +80,67 @@ class TranscribeInstagramProfileUseCase:
             batch.start_enumeration()
             await self._batch_repo.save(batch)
 
-            videos = await self._lister.list_videos(
-                input_data.profile_url, input_data.max_videos
-            )
-
-            if not videos:
-                batch.fail("No videos found on this profile")
+            listing_error: Optional[str] = None
+
+            async def enumerate_videos() -> AsyncIterator[tuple[ProfileVideoInfo, UUID]]:
+                nonlocal listing_error
+                # Each video is handed to the pipeline as soon as the lister finds it
+                try:
+                    async for video in self._lister.stream_videos(
+                        input_data.profile_url, input_data.max_videos
+                    ):
+                        transcription = Transcription(
+                            source=VideoSource(
+                                type=SourceType.INSTAGRAM,
+                                url=video.url,
+                                title=video.title,
+                                owner_username=video.owner_username,
+                                duration_seconds=video.duration_seconds,
+                                views_count=video.views_count,
+                                likes_count=video.likes_count,
+                                comments_count=video.comments_count,
+                            ),
+                            model_used=input_data.model_size,
+                            batch_id=batch_id,
+                        )
+                        await self._transcription_repo.save(transcription)
+                        batch.add_video(transcription.id)
+                        await self._batch_repo.save(batch)
+                        yield video, transcription.id
+                except Exception as e:
+                    # Videos already listed still run; the batch fails only if nothing was found
+                    logger.error(f"Failed to list profile {input_data.profile_url}: {e}")
+                    listing_error = str(e)
+
+                batch.finish_enumeration()
                 await self._batch_repo.save(batch)
-                return
 
-            transcription_ids: list[UUID] = []
-            for video in videos:
-                transcription = Transcription(
-                    source=VideoSource(
-                        type=SourceType.INSTAGRAM,
-                        url=video.url,
-                        title=video.title,
-                        owner_username=video.owner_username,
-                        duration_seconds=video.duration_seconds,
-                        views_count=video.views_count,
-                        likes_count=video.likes_count,
-                        comments_count=video.comments_count,
-                    ),
-                    model_used=input_data.model_size,
-                )
-                await self._transcription_repo.save(transcription)
-                transcription_ids.append(transcription.id)
+            async def _process_one(item: tuple[ProfileVideoInfo, UUID]) -> None:
+                video, t_id = item
+                transcription = await self._transcription_repo.get(t_id)
+                if not transcription:
+                    return
+
+                try:
+                    download_url = video.direct_video_url or video.url
+                    await self._process_single_video(
+                        transcription, download_url, input_data.language, input_data.model_size
+                    )
+                    batch.video_completed()
+                except Exception as e:
+                    logger.error(f"Failed to process video {video.url}: {e}")
+                    transcription.fail(str(e))
+                    await self._transcription_repo.save(transcription)
+                    batch.video_failed()
 
-            batch.start_processing(total=len(videos), ids=transcription_ids)
-            await self._batch_repo.save(batch)
-
-            semaphore = asyncio.Semaphore(3)
-
-            async def _process_one(video, t_id: UUID) -> None:
-                async with semaphore:
-                    transcription = await self._transcription_repo.get(t_id)
-                    if not transcription:
-                        return
-
-                    try:
-                        download_url = video.direct_video_url or video.url
-                        await self._process_single_video(transcription, download_url, input_data.language)
-                        batch.video_completed()
-                    except Exception as e:
-                        logger.error(f"Failed to process video {video.url}: {e}")
-                        transcription.fail(str(e))
-                        await self._transcription_repo.save(transcription)
-                        batch.video_failed()
+                await self._batch_repo.save(batch)
 
-                    await self._batch_repo.save(batch)
+            await process_all(enumerate_videos(), _process_one)
 
-            await asyncio.gather(
-                *(_process_one(video, t_id) for video, t_id in zip(videos, transcription_ids))
-            )
+            if not batch.total_videos:
+                batch.fail(listing_error or "No videos found on this profile")
+                await self._batch_repo.save(batch)
+                return
 
             batch.complete()
             await self._batch_repo.save(batch)
@@ -121,80 +150,125 @@ class TranscribeInstagramProfileUseCase:
             batch.fail(str(e))
             await self._batch_repo.save(batch)
 
-    async def _download_cdn_video(self, url: str, output_path: str) -> str:
-        """Download video directly from CDN URL."""
-        async with httpx.AsyncClient(timeout=120, follow_redirects=True) as client:
-            async with client.stream("GET", url) as response:
-                response.raise_for_status()
-                with open(output_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(8192):
-                        f.write(chunk)
-        return output_path
-
     async def _process_single_video(
         self,
         transcription: Transcription,
         url: str,
         language: Optional[str],
+        model_size: str,
     ) -> None:
-        # Phase 1: Download (parallel-safe)
-        transcription.start_download()
-        await self._transcription_repo.save(transcription)
-
-        is_cdn_url = "cdninstagram.com" in url or "fbcdn.net" in url
-        video_info = None
-        output_path = os.path.join(self._upload_dir, f"{uuid4()}.mp4")
-
-        if is_cdn_url:
-            audio_path = await self._download_cdn_video(url, output_path)
-            transcription.update_progress(30)
-        else:
-            try:
-                video_info = await self._downloader.get_info(url)
-                transcription.source.title = video_info.title
-                transcription.source.duration_seconds = video_info.duration_seconds
-            except Exception:
-                pass
-
-            def download_progress(progress: float) -> None:
-                transcription.update_progress(progress * 0.3)
+        # Coalesce on the post URL: CDN URLs are signed per request and never match
+        source_url = self._downloader.canonical_url(transcription.source.url or url)
 
-            audio_path = await self._downloader.download_audio(
-                url=url,
-                output_path=output_path,
-                on_progress=download_progress,
-            )
+        async def work(group: list[Transcription]) -> SharedTranscription:
+            return await self._download_and_transcribe(group, url, language, model_size)
 
-        # Phase 2: Whisper transcription (serialized — GPU can't handle concurrent inference)
-        async with _whisper_lock:
-            transcription.start_transcription()
-            await self._transcription_repo.save(transcription)
+        shared = await run_coalesced(
+            self._flights, coalescing_key(source_url, model_size, language), transcription, work
+        )
 
-            start_time = time.time()
+        transcription.complete(
+            result=TranscriptionResult(
+                text=shared.result.text,
+                segments=shared.result.segments,
+                language=shared.result.language,
+                duration_seconds=shared.duration_seconds,
+            ),
+            device=shared.device,
+            processing_time=shared.processing_time,
+        )
+        await self._transcription_repo.save(transcription)
 
-            def transcribe_progress(progress: float) -> None:
-                transcription.update_progress(30 + (progress * 0.7))
+    async def _download_and_transcribe(
+        self,
+        group: list[Transcription],
+        url: str,
+        language: Optional[str],
+        model_size: str,
+    ) -> SharedTranscription:
+        video_info = None
+        audio: Optional[AudioSource] = None
+        async with self._pipeline.reserve() as ticket:
+            try:
+                # Phase 1: Download, limited separately so inference never waits on it
+                async with self._pipeline.downloading():
+                    for transcription in group:
+                        transcription.start_download()
+                        await self._transcription_repo.save(transcription)
 
-            result = await self._whisper.transcribe(
-                audio_path=audio_path,
-                language=language,
-                on_progress=transcribe_progress,
-            )
+                    is_cdn_url = "cdninstagram.com" in url or "fbcdn.net" in url
+                    output_path = os.path.join(self._upload_dir, f"{uuid4()}.mp4")
+
+                    def download_progress(progress: float) -> None:
+                        for transcription in group:
+                            transcription.update_progress(progress * 0.3)
+
+                    if is_cdn_url:
+                        audio = await self._media_downloader.fetch(
+                            url,
+                            output_path,
+                            max_memory_bytes=self._memory_budget_bytes,
+                            on_progress=download_progress,
+                        )
+                    else:
+                        try:
+                            video_info = await self._downloader.get_info(url)
+                            for transcription in group:
+                                transcription.source.title = video_info.title
+                                transcription.source.duration_seconds = (
+                                    video_info.duration_seconds
+                                )
+                        except Exception:
+                            pass
+
+                        audio = await self._downloader.download_audio(
+                            url=url,
+                            output_path=output_path,
+                            on_progress=download_progress,
+                        )
+                ticket.hold(audio)
+
+                # Language detection runs while the audio waits in the prefetch buffer
+                language, model_size = await route_language(
+                    self._whisper, self._language_routing, audio, language, model_size
+                )
 
-            processing_time = time.time() - start_time
-            device = self._whisper.get_device()
+                # Phase 2: Whisper transcription, once the scheduler grants an inference slot
+                async with acquire_slot(self._scheduler) as slot:
+                    await ticket.release()
+                    for transcription in group:
+                        transcription.model_used = model_size
+                        transcription.start_transcription()
+                        await self._transcription_repo.save(transcription)
 
-        transcription.complete(
-            result=TranscriptionResult(
-                text=result.text,
-                segments=result.segments,
-                language=result.language,
-                duration_seconds=video_info.duration_seconds if video_info and video_info.duration_seconds else 0,
-            ),
+                    start_time = time.time()
+
+                    def transcribe_progress(progress: float) -> None:
+                        for transcription in group:
+                            transcription.update_progress(30 + (progress * 0.7))
+
+                    result = await transcribe_incrementally(
+                        self._whisper,
+                        self._transcription_repo,
+                        group,
+                        audio=audio,
+                        language=language,
+                        model_size=model_size,
+                        on_progress=transcribe_progress,
+                        slot=slot,
+                    )
+
+                    processing_time = time.time() - start_time
+                    device = slot.device if slot else self._whisper.get_device()
+            finally:
+                if isinstance(audio, str) and os.path.exists(audio):
+                    os.remove(audio)
+
+        return SharedTranscription(
+            result=result,
             device=device,
             processing_time=processing_time,
+            duration_seconds=(
+                video_info.duration_seconds if video_info and video_info.duration_seconds else 0
+            ),
         )
-        await self._transcription_repo.save(transcription)
-
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
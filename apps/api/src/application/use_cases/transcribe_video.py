@@ -1,11 +1,20 @@
 import os
+import shutil
 import time
 from dataclasses import dataclass
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from src.application.ports import TranscriptionRepository, WhisperService
-from src.domain.entities import TranscriptionResult
+from src.application.ports import InferenceScheduler, TranscriptionRepository, WhisperService
+from src.application.use_cases.coalescing import (
+    SharedTranscription,
+    TranscriptionFlights,
+    coalescing_key,
+    run_coalesced,
+)
+from src.application.use_cases.language_routing import LanguageRouting, route_language
+from src.application.use_cases.streaming import acquire_slot, transcribe_incrementally
+from src.domain.entities import Transcription, TranscriptionResult
 
 
 @dataclass
@@ -15,6 +24,12 @@ class TranscribeVideoInput:
     file_size: int
     language: Optional[str] = None
     model_size: str = "base"
+    content_hash: Optional[str] = None
+
+
+def _remove_upload(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
 
 
 class TranscribeVideoUseCase:
@@ -22,9 +37,15 @@ class TranscribeVideoUseCase:
         self,
         whisper_service: WhisperService,
         repository: TranscriptionRepository,
+        flights: Optional[TranscriptionFlights] = None,
+        scheduler: Optional[InferenceScheduler] = None,
+        language_routing: Optional[LanguageRouting] = None,
     ):
         self._whisper = whisper_service
         self._repository = repository
+        self._flights = flights
+        self._scheduler = scheduler
+        self._language_routing = language_routing
 
     async def execute(self, transcription_id: UUID, input_data: TranscribeVideoInput) -> None:
         transcription = await self._repository.get(transcription_id)
@@ -32,39 +53,91 @@ class TranscribeVideoUseCase:
             raise ValueError(f"Transcription {transcription_id} not found")
 
         try:
-            transcription.start_transcription()
-            await self._repository.save(transcription)
-
-            start_time = time.time()
-
-            def progress_callback(progress: float) -> None:
-                transcription.update_progress(progress)
+            async def work(group: list[Transcription]) -> SharedTranscription:
+                return await self._transcribe(input_data, group)
 
-            result = await self._whisper.transcribe(
-                audio_path=input_data.file_path,
-                language=input_data.language,
-                on_progress=progress_callback,
+            # Identical uploads in flight share one inference run
+            flights = self._flights if input_data.content_hash else None
+            key = coalescing_key(
+                f"sha256:{input_data.content_hash}", input_data.model_size, input_data.language
             )
-
-            processing_time = time.time() - start_time
-            device = self._whisper.get_device()
+            shared = await run_coalesced(flights, key, transcription, work)
 
             transcription.complete(
                 result=TranscriptionResult(
-                    text=result.text,
-                    segments=result.segments,
-                    language=result.language,
-                    duration_seconds=0,
+                    text=shared.result.text,
+                    segments=shared.result.segments,
+                    language=shared.result.language,
+                    duration_seconds=shared.duration_seconds,
                 ),
-                device=device,
-                processing_time=processing_time,
+                device=shared.device,
+                processing_time=shared.processing_time,
             )
             await self._repository.save(transcription)
 
-            if os.path.exists(input_data.file_path):
-                os.remove(input_data.file_path)
-
         except Exception as e:
             transcription.fail(str(e))
             await self._repository.save(transcription)
+            _remove_upload(input_data.file_path)
             raise
+
+        # Not on cancellation: a worker shutting down re-queues the job, which needs the upload
+        _remove_upload(input_data.file_path)
+
+    async def _transcribe(
+        self, input_data: TranscribeVideoInput, group: list[Transcription]
+    ) -> SharedTranscription:
+        # The run reads its own hard link to the upload: every job in the group removes its
+        # own file when it finishes, whichever job started the run
+        base, ext = os.path.splitext(input_data.file_path)
+        audio = f"{base}.{uuid4().hex[:8]}{ext}"
+        try:
+            os.link(input_data.file_path, audio)
+        except OSError:
+            # No hard links on this filesystem (or the path crosses devices): pay for a copy
+            shutil.copyfile(input_data.file_path, audio)
+        try:
+            return await self._transcribe_file(audio, input_data, group)
+        finally:
+            _remove_upload(audio)
+
+    async def _transcribe_file(
+        self, audio: str, input_data: TranscribeVideoInput, group: list[Transcription]
+    ) -> SharedTranscription:
+        # The upload is complete before the job is queued, so there is no download to overlap
+        language, model_size = await route_language(
+            self._whisper,
+            self._language_routing,
+            audio,
+            input_data.language,
+            input_data.model_size,
+        )
+        async with acquire_slot(self._scheduler) as slot:
+            for transcription in group:
+                transcription.model_used = model_size
+                transcription.start_transcription()
+                await self._repository.save(transcription)
+
+            start_time = time.time()
+
+            def progress_callback(progress: float) -> None:
+                for transcription in group:
+                    transcription.update_progress(progress)
+
+            result = await transcribe_incrementally(
+                self._whisper,
+                self._repository,
+                group,
+                audio=audio,
+                language=language,
+                model_size=model_size,
+                on_progress=progress_callback,
+                slot=slot,
+            )
+
+        return SharedTranscription(
+            result=result,
+            device=slot.device if slot else self._whisper.get_device(),
+            processing_time=time.time() - start_time,
+            duration_seconds=0,
+        )
@@ -4,8 +4,23 @@ from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID, uuid4
 
-from src.application.ports import TranscriptionRepository, VideoDownloader, WhisperService
-from src.domain.entities import TranscriptionResult
+from src.application.ports import (
+    CaptionSource,
+    InferenceScheduler,
+    TranscriptionRepository,
+    VideoDownloader,
+    WhisperService,
+)
+from src.application.use_cases.captions import caption_transcription
+from src.application.use_cases.coalescing import (
+    SharedTranscription,
+    TranscriptionFlights,
+    coalescing_key,
+    run_coalesced,
+)
+from src.application.use_cases.language_routing import LanguageRouting, route_language
+from src.application.use_cases.streaming import acquire_slot, transcribe_incrementally
+from src.domain.entities import Transcription, TranscriptionResult
 
 
 @dataclass
@@ -22,11 +37,21 @@ class TranscribeYoutubeUseCase:
         video_downloader: VideoDownloader,
         repository: TranscriptionRepository,
         upload_dir: str,
+        flights: Optional[TranscriptionFlights] = None,
+        scheduler: Optional[InferenceScheduler] = None,
+        caption_source: Optional[CaptionSource] = None,
+        include_automatic_captions: bool = False,
+        language_routing: Optional[LanguageRouting] = None,
     ):
         self._whisper = whisper_service
         self._downloader = video_downloader
         self._repository = repository
         self._upload_dir = upload_dir
+        self._flights = flights
+        self._scheduler = scheduler
+        self._captions = caption_source
+        self._include_automatic_captions = include_automatic_captions
+        self._language_routing = language_routing
 
     async def execute(self, transcription_id: UUID, input_data: TranscribeYoutubeInput) -> None:
         transcription = await self._repository.get(transcription_id)
@@ -34,57 +59,110 @@ class TranscribeYoutubeUseCase:
             raise ValueError(f"Transcription {transcription_id} not found")
 
         try:
-            transcription.start_download()
-            await self._repository.save(transcription)
-
-            video_info = await self._downloader.get_info(input_data.url)
-            transcription.source.title = video_info.title
-            transcription.source.duration_seconds = video_info.duration_seconds
+            url = self._downloader.canonical_url(input_data.url)
+            key = coalescing_key(url, input_data.model_size, input_data.language)
 
-            output_path = os.path.join(self._upload_dir, f"{uuid4()}.mp3")
+            async def work(group: list[Transcription]) -> SharedTranscription:
+                return await self._download_and_transcribe(url, input_data, group)
 
-            def download_progress(progress: float) -> None:
-                transcription.update_progress(progress * 0.3)
+            shared = await run_coalesced(self._flights, key, transcription, work)
 
-            audio_path = await self._downloader.download_audio(
-                url=input_data.url,
-                output_path=output_path,
-                on_progress=download_progress,
+            transcription.complete(
+                result=TranscriptionResult(
+                    text=shared.result.text,
+                    segments=shared.result.segments,
+                    language=shared.result.language,
+                    duration_seconds=shared.duration_seconds,
+                ),
+                device=shared.device,
+                processing_time=shared.processing_time,
             )
+            await self._repository.save(transcription)
 
-            transcription.start_transcription()
+        except Exception as e:
+            transcription.fail(str(e))
             await self._repository.save(transcription)
+            raise
 
-            start_time = time.time()
+    async def _download_and_transcribe(
+        self,
+        url: str,
+        input_data: TranscribeYoutubeInput,
+        group: list[Transcription],
+    ) -> SharedTranscription:
+        for transcription in group:
+            transcription.start_download()
+            await self._repository.save(transcription)
 
-            def transcribe_progress(progress: float) -> None:
-                transcription.update_progress(30 + (progress * 0.7))
+        video_info = await self._downloader.get_info(url)
+        for transcription in group:
+            transcription.source.title = video_info.title
+            transcription.source.duration_seconds = video_info.duration_seconds
 
-            result = await self._whisper.transcribe(
-                audio_path=audio_path,
-                language=input_data.language,
-                on_progress=transcribe_progress,
-            )
+        # Published captions, when enabled and available, replace download and inference
+        captions = await caption_transcription(
+            self._captions,
+            url,
+            input_data.language,
+            self._include_automatic_captions,
+            video_info.duration_seconds,
+        )
+        if captions:
+            return captions
+
+        output_path = os.path.join(self._upload_dir, f"{uuid4()}.mp3")
+
+        def download_progress(progress: float) -> None:
+            for transcription in group:
+                transcription.update_progress(progress * 0.3)
 
-            processing_time = time.time() - start_time
-            device = self._whisper.get_device()
+        audio_path = await self._downloader.download_audio(
+            url=url,
+            output_path=output_path,
+            on_progress=download_progress,
+        )
 
-            transcription.complete(
-                result=TranscriptionResult(
-                    text=result.text,
-                    segments=result.segments,
-                    language=result.language,
-                    duration_seconds=video_info.duration_seconds,
-                ),
-                device=device,
-                processing_time=processing_time,
+        try:
+            # Detection waits for the whole file: yt-dlp's .part file is not decodable
+            # mid-download (m4a keeps its index at the end). Batches overlap it with the
+            # next videos' downloads instead.
+            language, model_size = await route_language(
+                self._whisper,
+                self._language_routing,
+                audio_path,
+                input_data.language,
+                input_data.model_size,
             )
-            await self._repository.save(transcription)
-
+            async with acquire_slot(self._scheduler) as slot:
+                for transcription in group:
+                    transcription.model_used = model_size
+                    transcription.start_transcription()
+                    await self._repository.save(transcription)
+
+                start_time = time.time()
+
+                def transcribe_progress(progress: float) -> None:
+                    for transcription in group:
+                        transcription.update_progress(30 + (progress * 0.7))
+
+                result = await transcribe_incrementally(
+                    self._whisper,
+                    self._repository,
+                    group,
+                    audio=audio_path,
+                    language=language,
+                    model_size=model_size,
+                    on_progress=transcribe_progress,
+                    slot=slot,
+                )
+                processing_time = time.time() - start_time
+        finally:
             if os.path.exists(audio_path):
                 os.remove(audio_path)
 
-        except Exception as e:
-            transcription.fail(str(e))
-            await self._repository.save(transcription)
-            raise
+        return SharedTranscription(
+            result=result,
+            device=slot.device if slot else self._whisper.get_device(),
+            processing_time=processing_time,
+            duration_seconds=video_info.duration_seconds,
+        )
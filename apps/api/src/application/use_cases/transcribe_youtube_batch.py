@@ -1,31 +1,43 @@
-import asyncio
 import logging
 import os
 import time
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Optional
 from uuid import UUID, uuid4
 
 from src.application.ports import (
     BatchTranscriptionRepository,
+    CaptionSource,
+    InferenceScheduler,
+    PlaylistVideoLister,
+    ProfileVideoInfo,
     TranscriptionRepository,
     VideoDownloader,
     WhisperService,
 )
+from src.application.use_cases.captions import caption_transcription
+from src.application.use_cases.coalescing import (
+    SharedTranscription,
+    TranscriptionFlights,
+    coalescing_key,
+    run_coalesced,
+)
+from src.application.use_cases.language_routing import LanguageRouting, route_language
+from src.application.use_cases.prefetch_pipeline import PrefetchPipeline, process_all
+from src.application.use_cases.streaming import acquire_slot, transcribe_incrementally
 from src.domain.entities import Transcription, TranscriptionResult
 from src.domain.entities.transcription import SourceType, VideoSource
 
 logger = logging.getLogger(__name__)
 
-# Shared with instagram use case — MPS can't handle concurrent Whisper
-from src.application.use_cases.transcribe_instagram_profile import _whisper_lock
-
 
 @dataclass
 class TranscribeYoutubeBatchInput:
     urls: list[str]
     language: Optional[str] = None
     model_size: str = "base"
+    max_videos: Optional[int] = None
 
 
 class TranscribeYoutubeBatchUseCase:
@@ -36,12 +48,28 @@ class TranscribeYoutubeBatchUseCase:
         transcription_repository: TranscriptionRepository,
         batch_repository: BatchTranscriptionRepository,
         upload_dir: str,
+        flights: Optional[TranscriptionFlights] = None,
+        scheduler: Optional[InferenceScheduler] = None,
+        pipeline: Optional[PrefetchPipeline] = None,
+        playlist_lister: Optional[PlaylistVideoLister] = None,
+        caption_source: Optional[CaptionSource] = None,
+        include_automatic_captions: bool = False,
+        language_routing: Optional[LanguageRouting] = None,
     ):
         self._downloader = video_downloader
         self._whisper = whisper_service
         self._transcription_repo = transcription_repository
         self._batch_repo = batch_repository
         self._upload_dir = upload_dir
+        self._flights = flights
+        self._scheduler = scheduler
+        self._pipeline = pipeline or PrefetchPipeline(
+            download_concurrency=3, buffer_depth=3, max_buffered_bytes=2**40
+        )
+        self._playlist_lister = playlist_lister
+        self._captions = caption_source
+        self._include_automatic_captions = include_automatic_captions
+        self._language_routing = language_routing
 
     async def execute(self, batch_id: UUID, input_data: TranscribeYoutubeBatchInput) -> None:
         batch = await self._batch_repo.get(batch_id)
@@ -52,43 +80,80 @@ class TranscribeYoutubeBatchUseCase:
             batch.start_enumeration()
             await self._batch_repo.save(batch)
 
-            transcription_ids: list[UUID] = []
-            for url in input_data.urls:
-                transcription = Transcription(
-                    source=VideoSource(
-                        type=SourceType.YOUTUBE,
-                        url=url,
-                    ),
-                    model_used=input_data.model_size,
-                )
-                await self._transcription_repo.save(transcription)
-                transcription_ids.append(transcription.id)
+            listing_errors: list[str] = []
 
-            batch.start_processing(total=len(input_data.urls), ids=transcription_ids)
-            await self._batch_repo.save(batch)
+            async def expand(url: str) -> AsyncIterator[ProfileVideoInfo]:
+                if not (self._playlist_lister and self._playlist_lister.is_playlist_url(url)):
+                    yield ProfileVideoInfo(url=url, title="")
+                    return
+                remaining = input_data.max_videos and input_data.max_videos - batch.total_videos
+                try:
+                    async for video in self._playlist_lister.stream_videos(url, remaining):
+                        yield video
+                except Exception as e:
+                    # Videos already listed still run; the batch fails only if nothing was found
+                    logger.error(f"Failed to list playlist {url}: {e}")
+                    listing_errors.append(f"{url}: {e}")
 
-            semaphore = asyncio.Semaphore(3)
+            async def enumerate_videos() -> AsyncIterator[tuple[str, UUID]]:
+                # Playlist entries are handed to the pipeline page by page as they are listed.
+                # Repeated videos are kept: each gets its own transcription, and the flights
+                # coalesce them into one download and inference run.
+                for url in input_data.urls:
+                    if input_data.max_videos and batch.total_videos >= input_data.max_videos:
+                        break
+                    async with aclosing(expand(url)) as videos:
+                        async for video in videos:
+                            if (
+                                input_data.max_videos
+                                and batch.total_videos >= input_data.max_videos
+                            ):
+                                break
+                            transcription = Transcription(
+                                source=VideoSource(
+                                    type=SourceType.YOUTUBE,
+                                    url=video.url,
+                                    title=video.title or None,
+                                    owner_username=video.owner_username,
+                                    duration_seconds=video.duration_seconds,
+                                    views_count=video.views_count,
+                                ),
+                                model_used=input_data.model_size,
+                                batch_id=batch_id,
+                            )
+                            await self._transcription_repo.save(transcription)
+                            batch.add_video(transcription.id)
+                            await self._batch_repo.save(batch)
+                            yield video.url, transcription.id
 
-            async def _process_one(url: str, t_id: UUID) -> None:
-                async with semaphore:
-                    transcription = await self._transcription_repo.get(t_id)
-                    if not transcription:
-                        return
+                batch.finish_enumeration()
+                await self._batch_repo.save(batch)
 
-                    try:
-                        await self._process_single_video(transcription, url, input_data.language)
-                        batch.video_completed()
-                    except Exception as e:
-                        logger.error(f"Failed to process video {url}: {e}")
-                        transcription.fail(str(e))
-                        await self._transcription_repo.save(transcription)
-                        batch.video_failed()
+            async def _process_one(item: tuple[str, UUID]) -> None:
+                url, t_id = item
+                transcription = await self._transcription_repo.get(t_id)
+                if not transcription:
+                    return
+
+                try:
+                    await self._process_single_video(
+                        transcription, url, input_data.language, input_data.model_size
+                    )
+                    batch.video_completed()
+                except Exception as e:
+                    logger.error(f"Failed to process video {url}: {e}")
+                    transcription.fail(str(e))
+                    await self._transcription_repo.save(transcription)
+                    batch.video_failed()
+
+                await self._batch_repo.save(batch)
 
-                    await self._batch_repo.save(batch)
+            await process_all(enumerate_videos(), _process_one)
 
-            await asyncio.gather(
-                *(_process_one(url, t_id) for url, t_id in zip(input_data.urls, transcription_ids))
-            )
+            if not batch.total_videos:
+                batch.fail("; ".join(listing_errors) or "No videos found")
+                await self._batch_repo.save(batch)
+                return
 
             batch.complete()
             await self._batch_repo.save(batch)
@@ -103,58 +168,118 @@ class TranscribeYoutubeBatchUseCase:
         transcription: Transcription,
         url: str,
         language: Optional[str],
+        model_size: str,
     ) -> None:
-        transcription.start_download()
+        url = self._downloader.canonical_url(url)
+
+        async def work(group: list[Transcription]) -> SharedTranscription:
+            return await self._download_and_transcribe(group, url, language, model_size)
+
+        shared = await run_coalesced(
+            self._flights, coalescing_key(url, model_size, language), transcription, work
+        )
+
+        transcription.complete(
+            result=TranscriptionResult(
+                text=shared.result.text,
+                segments=shared.result.segments,
+                language=shared.result.language,
+                duration_seconds=shared.duration_seconds,
+            ),
+            device=shared.device,
+            processing_time=shared.processing_time,
+        )
         await self._transcription_repo.save(transcription)
 
+    async def _download_and_transcribe(
+        self,
+        group: list[Transcription],
+        url: str,
+        language: Optional[str],
+        model_size: str,
+    ) -> SharedTranscription:
         video_info = None
-        try:
-            video_info = await self._downloader.get_info(url)
-            transcription.source.title = video_info.title
-            transcription.source.duration_seconds = video_info.duration_seconds
-        except Exception:
-            pass
+        audio_path = None
+        async with self._pipeline.reserve() as ticket:
+            try:
+                # Phase 1: Download, limited separately so inference never waits on it
+                async with self._pipeline.downloading():
+                    for transcription in group:
+                        transcription.start_download()
+                        await self._transcription_repo.save(transcription)
 
-        output_path = os.path.join(self._upload_dir, f"{uuid4()}.mp3")
+                    try:
+                        video_info = await self._downloader.get_info(url)
+                        for transcription in group:
+                            transcription.source.title = video_info.title
+                            transcription.source.duration_seconds = video_info.duration_seconds
+                    except Exception:
+                        pass
 
-        def download_progress(progress: float) -> None:
-            transcription.update_progress(progress * 0.3)
+                    captions = await caption_transcription(
+                        self._captions,
+                        url,
+                        language,
+                        self._include_automatic_captions,
+                        video_info.duration_seconds if video_info else None,
+                    )
+                    if captions:
+                        return captions
 
-        audio_path = await self._downloader.download_audio(
-            url=url,
-            output_path=output_path,
-            on_progress=download_progress,
-        )
+                    output_path = os.path.join(self._upload_dir, f"{uuid4()}.mp3")
+
+                    def download_progress(progress: float) -> None:
+                        for transcription in group:
+                            transcription.update_progress(progress * 0.3)
+
+                    audio_path = await self._downloader.download_audio(
+                        url=url,
+                        output_path=output_path,
+                        on_progress=download_progress,
+                    )
+                ticket.hold(audio_path)
 
-        async with _whisper_lock:
-            transcription.start_transcription()
-            await self._transcription_repo.save(transcription)
+                # Language detection runs while the audio waits in the prefetch buffer
+                language, model_size = await route_language(
+                    self._whisper, self._language_routing, audio_path, language, model_size
+                )
 
-            start_time = time.time()
+                # Phase 2: Whisper transcription, once the scheduler grants an inference slot
+                async with acquire_slot(self._scheduler) as slot:
+                    await ticket.release()
+                    for transcription in group:
+                        transcription.model_used = model_size
+                        transcription.start_transcription()
+                        await self._transcription_repo.save(transcription)
 
-            def transcribe_progress(progress: float) -> None:
-                transcription.update_progress(30 + (progress * 0.7))
+                    start_time = time.time()
 
-            result = await self._whisper.transcribe(
-                audio_path=audio_path,
-                language=language,
-                on_progress=transcribe_progress,
-            )
+                    def transcribe_progress(progress: float) -> None:
+                        for transcription in group:
+                            transcription.update_progress(30 + (progress * 0.7))
 
-            processing_time = time.time() - start_time
-            device = self._whisper.get_device()
+                    result = await transcribe_incrementally(
+                        self._whisper,
+                        self._transcription_repo,
+                        group,
+                        audio=audio_path,
+                        language=language,
+                        model_size=model_size,
+                        on_progress=transcribe_progress,
+                        slot=slot,
+                    )
 
-        transcription.complete(
-            result=TranscriptionResult(
-                text=result.text,
-                segments=result.segments,
-                language=result.language,
-                duration_seconds=video_info.duration_seconds if video_info and video_info.duration_seconds else 0,
-            ),
+                    processing_time = time.time() - start_time
+                    device = slot.device if slot else self._whisper.get_device()
+            finally:
+                if audio_path and os.path.exists(audio_path):
+                    os.remove(audio_path)
+
+        return SharedTranscription(
+            result=result,
             device=device,
             processing_time=processing_time,
+            duration_seconds=(
+                video_info.duration_seconds if video_info and video_info.duration_seconds else 0
+            ),
         )
-        await self._transcription_repo.save(transcription)
-
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
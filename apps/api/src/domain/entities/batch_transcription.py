@@ -42,6 +42,14 @@ class BatchTranscription:
         self.total_videos = total
         self.transcription_ids = ids
 
+    def add_video(self, transcription_id: UUID) -> None:
+        """Registers a video found while the profile is still being enumerated."""
+        self.transcription_ids.append(transcription_id)
+        self.total_videos += 1
+
+    def finish_enumeration(self) -> None:
+        self.status = BatchStatus.PROCESSING
+
     def video_completed(self) -> None:
         self.completed_videos += 1
 
@@ -56,5 +64,14 @@ class BatchTranscription:
         self.status = BatchStatus.FAILED
         self.error_message = error
 
+    def restart(self) -> None:
+        """Discards the progress of an interrupted run so the job can be run again."""
+        self.status = BatchStatus.PENDING
+        self.transcription_ids = []
+        self.total_videos = 0
+        self.completed_videos = 0
+        self.failed_videos = 0
+        self.error_message = None
+
     def cancel(self) -> None:
         self.status = BatchStatus.CANCELLED
@@ -54,8 +54,12 @@ class Transcription:
     result: Optional[TranscriptionResult] = None
     error_message: Optional[str] = None
     model_used: str = "base"
+    batch_id: Optional[UUID] = None
     device_used: Optional[str] = None
     processing_time_seconds: Optional[float] = None
+    partial_segments: list[TranscriptionSegment] = field(default_factory=list)
+    eta_seconds: Optional[float] = None
+    realtime_factor: Optional[float] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
 
@@ -75,13 +79,47 @@ class Transcription:
         self.processing_time_seconds = processing_time
         self.completed_at = datetime.utcnow()
         self.progress = 100.0
+        self.partial_segments = []
+        self.eta_seconds = None
 
     def fail(self, error: str) -> None:
         self.status = TranscriptionStatus.FAILED
         self.error_message = error
 
+    def restart(self) -> None:
+        """Discards the progress of an interrupted run so the job can be run again."""
+        self.status = TranscriptionStatus.PENDING
+        self.progress = 0.0
+        self.error_message = None
+        self.partial_segments = []
+        self.eta_seconds = None
+        self.realtime_factor = None
+
     def cancel(self) -> None:
         self.status = TranscriptionStatus.CANCELLED
 
+    def follow(self, other: "Transcription") -> None:
+        """Catches up with another job for the same source whose work this one now shares."""
+        self.status = other.status
+        self.progress = other.progress
+        self.partial_segments = list(other.partial_segments)
+        self.source.title = self.source.title or other.source.title
+        self.source.duration_seconds = self.source.duration_seconds or other.source.duration_seconds
+
+    def append_segment(self, segment: TranscriptionSegment) -> None:
+        self.partial_segments.append(segment)
+
+    @property
+    def partial_text(self) -> Optional[str]:
+        if not self.partial_segments:
+            return None
+        return " ".join(segment.text for segment in self.partial_segments)
+
+    def update_decode_metrics(
+        self, eta_seconds: Optional[float], realtime_factor: Optional[float]
+    ) -> None:
+        self.eta_seconds = eta_seconds
+        self.realtime_factor = realtime_factor
+
     def update_progress(self, progress: float) -> None:
         self.progress = min(progress, 100.0)
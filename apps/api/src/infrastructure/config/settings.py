@@ -8,18 +8,86 @@ _BASE_DIR = Path(__file__).resolve().parents[3]
 
 
 class Settings(BaseSettings):
+    whisper_backend: str = "openai"
     whisper_model_size: str = "base"
+    whisper_compute_type: str = "int8"
+    whisper_model_memory_budget_mb: int = 4096
+    whisper_inference_mode: str = "thread"
+    whisper_workers: int = 2
+    whisper_long_form_min_seconds: float = 600
+    whisper_chunk_seconds: float = 300
+    whisper_chunk_overlap_seconds: float = 2
+    whisper_long_form_max_parallel: int = 2
+    whisper_stream_window_seconds: float = 30
+    whisper_detect_model_size: str = "tiny"
+    whisper_language_models: str = ""
+    whisper_allowed_languages: str = ""
+    inference_cuda_slot_mb: int = 2048
+    inference_max_slots_per_gpu: int = 4
+    whisper_cache_enabled: bool = True
+    whisper_cache_max_mb: int = 1024
+    export_cache_max_mb: int = 64
     cors_origins: str = "http://localhost:3000"
     log_level: str = "INFO"
     upload_dir: str = str(_BASE_DIR / "uploads")
+    upload_max_mb: int = 4096
+    upload_chunk_size_kb: int = 1024
+    media_memory_budget_mb: int = 64
+    download_chunk_size_kb: int = 1024
+    download_range_parts: int = 4
+    download_range_min_mb: int = 8
+    download_per_host_connections: int = 6
+    download_max_retries: int = 3
     data_dir: str = str(_BASE_DIR / "data")
     models_dir: str = str(_BASE_DIR / "models")
     apify_api_token: Optional[str] = None
+    apify_base_url: str = "https://api.apify.com/v2"
+    apify_cache_ttl_seconds: float = 3600
+    apify_poll_interval_seconds: float = 2.0
+    youtube_audio_format: str = "original"
+    youtube_info_cache_ttl_seconds: float = 1800
+    youtube_info_cache_size: int = 512
+    youtube_use_captions: bool = False
+    youtube_use_automatic_captions: bool = False
+    persistence_backend: str = "sqlite"
+    job_workers: int = 4
+    job_batch_workers: int = 2
+    job_visibility_timeout_seconds: float = 120
+    job_max_attempts: int = 3
+    job_poll_interval_seconds: float = 1.0
+    batch_download_concurrency: int = 3
+    batch_prefetch_depth: int = 4
+    batch_prefetch_max_mb: int = 2048
+    sqlite_cache_size: int = 1000
+    sqlite_flush_interval_ms: int = 500
+    progress_throttle_ms: int = 250
+    progress_subscriber_buffer: int = 1000
+    batch_event_history: int = 5000
+    batch_event_retention_seconds: float = 300
 
     @property
     def cors_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    @property
+    def whisper_language_models_map(self) -> dict[str, str]:
+        """Parses "en=small.en,pt=medium" into {"en": "small.en", "pt": "medium"}."""
+        models = {}
+        for item in self.whisper_language_models.split(","):
+            if not item.strip():
+                continue
+            language, _, model = item.partition("=")
+            if not language.strip() or not model.strip():
+                raise ValueError(
+                    f"WHISPER_LANGUAGE_MODELS entry '{item.strip()}' is not language=model"
+                )
+            models[language.strip()] = model.strip()
+        return models
+
+    @property
+    def whisper_allowed_languages_list(self) -> list[str]:
+        return [lang.strip() for lang in self.whisper_allowed_languages.split(",") if lang.strip()]
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,25 @@
+from src.infrastructure.events.event_bus import (
+    InProcessEventBus,
+    Subscription,
+    SubscriptionOverflowError,
+    batch_topic,
+    transcription_topic,
+)
+from src.infrastructure.events.event_journal import EventJournal, JournalGapError, JournalReader
+from src.infrastructure.events.publishing_repository import (
+    PublishingBatchTranscriptionRepository,
+    PublishingTranscriptionRepository,
+)
+
+__all__ = [
+    "InProcessEventBus",
+    "Subscription",
+    "SubscriptionOverflowError",
+    "batch_topic",
+    "transcription_topic",
+    "EventJournal",
+    "JournalGapError",
+    "JournalReader",
+    "PublishingTranscriptionRepository",
+    "PublishingBatchTranscriptionRepository",
+]
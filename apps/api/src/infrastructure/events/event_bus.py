@@ -0,0 +1,114 @@
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Hashable, Iterable, Iterator, Optional
+
+
+class SubscriptionOverflowError(Exception):
+    pass
+
+
+class Subscription:
+    """Pending updates for one consumer, keyed by entity so only the latest state is kept.
+
+    A consumer that falls behind sees fewer, newer updates rather than a growing backlog.
+    If more than max_pending distinct entities are waiting, they are dropped and the next
+    get() raises SubscriptionOverflowError so the consumer can resynchronize.
+    """
+
+    def __init__(self, topic: str, max_pending: int):
+        self.topic = topic
+        self._max_pending = max_pending
+        self._pending: OrderedDict[Hashable, Any] = OrderedDict()
+        self._ready = asyncio.Event()
+        self._overflowed = False
+
+    def _offer(self, items: dict[Hashable, Any]) -> None:
+        for key, item in items.items():
+            self._pending[key] = item
+            self._pending.move_to_end(key)
+        if len(self._pending) > self._max_pending:
+            self._overflowed = True
+            self._pending.clear()
+        self._ready.set()
+
+    async def get(self) -> list[Any]:
+        """Waits for and returns every update that arrived since the last call, oldest first."""
+        await self._ready.wait()
+        self._ready.clear()
+        if self._overflowed:
+            self._overflowed = False
+            raise SubscriptionOverflowError(f"Subscriber to {self.topic} fell too far behind")
+        items = list(self._pending.values())
+        self._pending.clear()
+        return items
+
+
+class InProcessEventBus:
+    """Fans entity updates out to subscribers of a topic, at most once per throttle_interval.
+
+    Updates published between deliveries are coalesced per entity key, and topics nobody
+    subscribes to cost nothing. Items are delivered as published (usually the live entity),
+    so consumers render the state current at delivery time.
+    """
+
+    def __init__(self, throttle_interval: float, max_pending: int):
+        self._throttle_interval = throttle_interval
+        self._max_pending = max_pending
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._pending: dict[str, dict[Hashable, Any]] = {}
+        self._last_delivery: dict[str, float] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+
+    def publish(self, topics: Iterable[str], key: Hashable, item: Any) -> None:
+        for topic in topics:
+            if topic not in self._subscribers:
+                continue
+            self._pending.setdefault(topic, {})[key] = item
+            if topic in self._timers:
+                continue
+            delay = self._last_delivery.get(topic, 0.0) + self._throttle_interval - time.monotonic()
+            if delay <= 0:
+                self._deliver(topic)
+            else:
+                loop = asyncio.get_running_loop()
+                self._timers[topic] = loop.call_later(delay, self._deliver, topic)
+
+    def _deliver(self, topic: str) -> None:
+        self._timers.pop(topic, None)
+        items = self._pending.pop(topic, None)
+        self._last_delivery[topic] = time.monotonic()
+        if not items:
+            return
+        for subscription in self._subscribers.get(topic, ()):
+            subscription._offer(items)
+
+    @contextmanager
+    def subscribe(self, topic: str) -> Iterator[Subscription]:
+        subscription = Subscription(topic, self._max_pending)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    self._forget(topic)
+
+    def _forget(self, topic: str) -> None:
+        del self._subscribers[topic]
+        self._pending.pop(topic, None)
+        self._last_delivery.pop(topic, None)
+        timer: Optional[asyncio.TimerHandle] = self._timers.pop(topic, None)
+        if timer:
+            timer.cancel()
+
+
+def transcription_topic(transcription_id: Any) -> str:
+    return f"transcription:{transcription_id}"
+
+
+def batch_topic(batch_id: Any) -> str:
+    return f"batch:{batch_id}"
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import uuid
+from collections import deque
+from contextlib import ExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Optional
+
+from src.infrastructure.events.event_bus import (
+    InProcessEventBus,
+    Subscription,
+    SubscriptionOverflowError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JournalGapError(Exception):
+    """The reader's last seen event is no longer retained; it must start from a snapshot."""
+
+
+class _TopicJournal:
+    def __init__(self, capacity: int):
+        # Event ids are "<epoch>-<seq>"; a new epoch means ids from before cannot be resumed
+        self.epoch = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self.floor = 0
+        self.events: deque[tuple[int, dict]] = deque(maxlen=capacity)
+        self.changed = asyncio.Condition()
+        self.readers = 0
+        self.subscription = ExitStack()
+        self.pump: Optional[asyncio.Task] = None
+        self.expiry: Optional[asyncio.TimerHandle] = None
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def parse(self, event_id: Optional[str]) -> Optional[int]:
+        if not event_id:
+            return None
+        epoch, _, seq = event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit() or int(seq) > self.seq:
+            return None
+        return int(seq)
+
+
+class JournalReader:
+    def __init__(self, journal: _TopicJournal, after: int):
+        self._journal = journal
+        self._after = after
+
+    @property
+    def position(self) -> str:
+        return self._journal.event_id(self._after)
+
+    async def next(self, timeout: float) -> list[tuple[str, dict]]:
+        """Returns the events after the reader's position, waiting up to timeout for one.
+
+        Raises JournalGapError if the reader fell behind the retained history.
+        """
+        journal = self._journal
+        async with journal.changed:
+            if journal.seq == self._after:
+                try:
+                    await asyncio.wait_for(journal.changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    return []
+            if self._after < journal.floor or (
+                journal.events and journal.events[0][0] > self._after + 1
+            ):
+                self._after = journal.seq
+                raise JournalGapError()
+            events = [
+                (journal.event_id(seq), event) for seq, event in journal.events if seq > self._after
+            ]
+            self._after = journal.seq
+            return events
+
+
+class EventJournal:
+    """Numbered, replayable history of the rendered events of bus topics.
+
+    A topic is recorded while it has readers and for retention_seconds afterwards, so a
+    client that reconnects with its last event id receives only what it missed. Events are
+    rendered once when the bus delivers them, so every reader shares the same history.
+    """
+
+    def __init__(
+        self,
+        bus: InProcessEventBus,
+        render: Callable[[Any], dict],
+        capacity: int,
+        retention_seconds: float,
+    ):
+        self._bus = bus
+        self._render = render
+        self._capacity = capacity
+        self._retention_seconds = retention_seconds
+        self._journals: dict[str, _TopicJournal] = {}
+
+    @asynccontextmanager
+    async def open(self, topic: str, last_event_id: Optional[str]) -> AsyncIterator[JournalReader]:
+        """Yields a reader positioned after last_event_id.
+
+        Raises JournalGapError before yielding if that event cannot be resumed from; the caller
+        should send a snapshot and open again without an event id.
+        """
+        journal = self._journals.get(topic)
+        if journal is None:
+            journal = _TopicJournal(self._capacity)
+            # Subscribe now, not when the task first runs, so nothing after open() is missed
+            subscription = journal.subscription.enter_context(self._bus.subscribe(topic))
+            journal.pump = asyncio.ensure_future(self._record(topic, journal, subscription))
+            self._journals[topic] = journal
+        if journal.expiry:
+            journal.expiry.cancel()
+            journal.expiry = None
+
+        journal.readers += 1
+        try:
+            if last_event_id is None:
+                after = journal.seq
+            else:
+                after = journal.parse(last_event_id)
+                oldest = journal.events[0][0] if journal.events else journal.seq + 1
+                if after is None or after < journal.floor or after + 1 < oldest:
+                    raise JournalGapError()
+            yield JournalReader(journal, after)
+        finally:
+            journal.readers -= 1
+            if journal.readers == 0:
+                loop = asyncio.get_running_loop()
+                journal.expiry = loop.call_later(
+                    self._retention_seconds, self._expire, topic, journal
+                )
+
+    def _expire(self, topic: str, journal: _TopicJournal) -> None:
+        if journal.readers or self._journals.get(topic) is not journal:
+            return
+        del self._journals[topic]
+        if journal.pump:
+            journal.pump.cancel()
+        journal.subscription.close()
+
+    async def _record(
+        self, topic: str, journal: _TopicJournal, subscription: Subscription
+    ) -> None:
+        while True:
+            try:
+                items = await subscription.get()
+            except SubscriptionOverflowError:
+                logger.warning(f"Event journal for {topic} lost updates; readers will resync")
+                async with journal.changed:
+                    journal.seq += 1
+                    journal.floor = journal.seq
+                    journal.changed.notify_all()
+                continue
+            async with journal.changed:
+                for item in items:
+                    journal.seq += 1
+                    journal.events.append((journal.seq, self._render(item)))
+                journal.changed.notify_all()
@@ -0,0 +1,59 @@
+from typing import Optional
+from uuid import UUID
+
+from src.application.ports import (
+    BatchTranscriptionRepository,
+    TranscriptionPage,
+    TranscriptionQuery,
+    TranscriptionRepository,
+)
+from src.domain.entities import BatchTranscription, Transcription
+from src.infrastructure.events.event_bus import InProcessEventBus, batch_topic, transcription_topic
+
+
+class PublishingTranscriptionRepository(TranscriptionRepository):
+    """Publishes every saved transcription to its own topic and to its batch's topic."""
+
+    def __init__(self, inner: TranscriptionRepository, bus: InProcessEventBus):
+        self._inner = inner
+        self._bus = bus
+
+    async def save(self, transcription: Transcription) -> None:
+        await self._inner.save(transcription)
+        topics = [transcription_topic(transcription.id)]
+        if transcription.batch_id:
+            topics.append(batch_topic(transcription.batch_id))
+        self._bus.publish(topics, transcription.id, transcription)
+
+    async def get(self, id: UUID) -> Optional[Transcription]:
+        return await self._inner.get(id)
+
+    async def list_all(self) -> list[Transcription]:
+        return await self._inner.list_all()
+
+    async def list_summaries(self, query: TranscriptionQuery) -> TranscriptionPage:
+        return await self._inner.list_summaries(query)
+
+    async def delete(self, id: UUID) -> bool:
+        return await self._inner.delete(id)
+
+
+class PublishingBatchTranscriptionRepository(BatchTranscriptionRepository):
+    """Publishes every saved batch to the batch's topic."""
+
+    def __init__(self, inner: BatchTranscriptionRepository, bus: InProcessEventBus):
+        self._inner = inner
+        self._bus = bus
+
+    async def save(self, batch: BatchTranscription) -> None:
+        await self._inner.save(batch)
+        self._bus.publish([batch_topic(batch.id)], batch.id, batch)
+
+    async def get(self, id: UUID) -> Optional[BatchTranscription]:
+        return await self._inner.get(id)
+
+    async def list_all(self) -> list[BatchTranscription]:
+        return await self._inner.list_all()
+
+    async def delete(self, id: UUID) -> bool:
+        return await self._inner.delete(id)
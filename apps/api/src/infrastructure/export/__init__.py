@@ -0,0 +1,3 @@
+from src.infrastructure.export.transcript_exporter import CONTENT_TYPES, TranscriptExporter
+
+__all__ = ["TranscriptExporter", "CONTENT_TYPES"]
@@ -0,0 +1,157 @@
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+from uuid import UUID
+
+from src.domain.entities import TranscriptionResult
+
+# Rendered text is flushed to the client in blocks of about this many characters
+_BLOCK_SIZE = 64 * 1024
+
+CONTENT_TYPES = {
+    "txt": "text/plain; charset=utf-8",
+    "srt": "application/x-subrip; charset=utf-8",
+    "vtt": "text/vtt; charset=utf-8",
+    "json": "application/json",
+    "tsv": "text/tab-separated-values; charset=utf-8",
+}
+
+
+def _split_millis(seconds: float) -> tuple[int, int, int, int]:
+    total_ms = max(0, round(seconds * 1000))
+    hours, rest = divmod(total_ms, 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    secs, millis = divmod(rest, 1000)
+    return hours, minutes, secs, millis
+
+
+def format_timestamp_srt(seconds: float) -> str:
+    return "{:02d}:{:02d}:{:02d},{:03d}".format(*_split_millis(seconds))
+
+
+def format_timestamp_vtt(seconds: float) -> str:
+    return "{:02d}:{:02d}:{:02d}.{:03d}".format(*_split_millis(seconds))
+
+
+def render_txt(result: TranscriptionResult) -> Iterator[str]:
+    yield result.text
+
+
+def render_srt(result: TranscriptionResult) -> Iterator[str]:
+    for i, seg in enumerate(result.segments, 1):
+        start = format_timestamp_srt(seg.start)
+        end = format_timestamp_srt(seg.end)
+        yield f"{i}\n{start} --> {end}\n{seg.text.strip()}\n\n"
+
+
+def render_vtt(result: TranscriptionResult) -> Iterator[str]:
+    yield "WEBVTT\n\n"
+    for seg in result.segments:
+        start = format_timestamp_vtt(seg.start)
+        end = format_timestamp_vtt(seg.end)
+        yield f"{start} --> {end}\n{seg.text.strip()}\n\n"
+
+
+def render_tsv(result: TranscriptionResult) -> Iterator[str]:
+    yield "start\tend\ttext\n"
+    for seg in result.segments:
+        text = " ".join(seg.text.split())
+        yield f"{round(seg.start * 1000)}\t{round(seg.end * 1000)}\t{text}\n"
+
+
+def render_json(result: TranscriptionResult) -> Iterator[str]:
+    yield '{"text": ' + json.dumps(result.text, ensure_ascii=False)
+    yield ', "language": ' + json.dumps(result.language) + ', "segments": ['
+    for i, seg in enumerate(result.segments):
+        segment = {"start": seg.start, "end": seg.end, "text": seg.text}
+        yield (", " if i else "") + json.dumps(segment, ensure_ascii=False)
+    yield "]}"
+
+
+RENDERERS: dict[str, Callable[[TranscriptionResult], Iterator[str]]] = {
+    "txt": render_txt,
+    "srt": render_srt,
+    "vtt": render_vtt,
+    "json": render_json,
+    "tsv": render_tsv,
+}
+
+
+def _fingerprint(result: TranscriptionResult, completed_at: Optional[datetime]) -> tuple:
+    return (completed_at, len(result.segments), len(result.text))
+
+
+class TranscriptExporter:
+    """Streams rendered exports and memoizes them per transcription and format (LRU by size).
+
+    A memoized export is dropped once the transcription's result no longer matches the one
+    it was rendered from. Rendering runs in whichever thread iterates the stream.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[UUID, str], tuple[tuple, bytes]] = OrderedDict()
+        self._total_bytes = 0
+
+    def stream(
+        self,
+        transcription_id: UUID,
+        result: TranscriptionResult,
+        format: str,
+        completed_at: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        key = (transcription_id, format)
+        fingerprint = _fingerprint(result, completed_at)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == fingerprint:
+                self._entries.move_to_end(key)
+                cached = entry[1]
+            else:
+                cached = None
+
+        if cached is not None:
+            for i in range(0, len(cached), _BLOCK_SIZE):
+                yield cached[i : i + _BLOCK_SIZE]
+            return
+
+        blocks: list[bytes] = []
+        pending: list[str] = []
+        pending_size = 0
+        for piece in RENDERERS[format](result):
+            pending.append(piece)
+            pending_size += len(piece)
+            if pending_size >= _BLOCK_SIZE:
+                block = "".join(pending).encode()
+                blocks.append(block)
+                yield block
+                pending, pending_size = [], 0
+        if pending:
+            block = "".join(pending).encode()
+            blocks.append(block)
+            yield block
+
+        # Only exports streamed to the end are remembered
+        self._put(key, fingerprint, b"".join(blocks))
+
+    def _put(self, key: tuple[UUID, str], fingerprint: tuple, data: bytes) -> None:
+        if len(data) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self._total_bytes -= len(old[1])
+            self._entries[key] = (fingerprint, data)
+            self._total_bytes += len(data)
+            while self._total_bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def invalidate(self, transcription_id: UUID) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == transcription_id]:
+                self._total_bytes -= len(self._entries.pop(key)[1])
@@ -0,0 +1,3 @@
+from src.infrastructure.http.media_downloader import HttpMediaDownloader, TransferInterruptedError
+
+__all__ = ["HttpMediaDownloader", "TransferInterruptedError"]
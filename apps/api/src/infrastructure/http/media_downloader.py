@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlsplit
+
+import aiofiles
+import httpx
+
+from src.application.ports.media_downloader import MediaDownloader
+from src.application.ports.whisper_service import AudioSource
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class TransferInterruptedError(Exception):
+    pass
+
+
+class _Progress:
+    def __init__(self, total: Optional[int], on_progress: Optional[Callable[[float], None]]):
+        self._total = total
+        self._on_progress = on_progress
+        self.done = 0
+
+    def add(self, size: int) -> None:
+        self.done += size
+        if self._on_progress and self._total:
+            self._on_progress(min(self.done / self._total * 100, 100.0))
+
+
+class _Sink:
+    """Where a transfer lands: memory while it fits max_memory_bytes, otherwise a file.
+
+    Parts may arrive out of order, so writes carry their offset. File writes go through
+    aiofiles, off the event loop.
+    """
+
+    def __init__(self, path: str, total: Optional[int], max_memory_bytes: int):
+        self._path = path
+        self._total = total
+        self._max_memory_bytes = max_memory_bytes
+        in_memory = total is None or total <= max_memory_bytes
+        self._buffer: Optional[bytearray] = bytearray(total or 0) if in_memory else None
+        self._file = None
+        self._lock = asyncio.Lock()
+
+    async def write(self, offset: int, data: bytes) -> None:
+        async with self._lock:
+            if self._buffer is not None:
+                end = offset + len(data)
+                if end <= max(len(self._buffer), self._max_memory_bytes):
+                    self._buffer[offset:end] = data
+                    return
+            if self._file is None:
+                await self._open_file()
+            await self._file.seek(offset)
+            await self._file.write(data)
+
+    async def _open_file(self) -> None:
+        self._file = await aiofiles.open(self._path, "wb")
+        if self._total:
+            await self._file.truncate(self._total)
+        if self._buffer:
+            await self._file.write(self._buffer)
+        self._buffer = None
+
+    async def finish(self) -> AudioSource:
+        async with self._lock:
+            if self._buffer is not None:
+                return bytes(self._buffer)
+            if self._file is None:
+                await self._open_file()
+            await self._file.close()
+            return self._path
+
+    async def discard(self) -> None:
+        if self._file is not None:
+            await self._file.close()
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+
+class HttpMediaDownloader(MediaDownloader):
+    """Downloads over one pooled httpx client shared by every transfer.
+
+    Files of range_min_bytes or more are fetched as range_parts parallel Range requests.
+    Every request resumes from the last byte written after a dropped connection or a
+    transient server error, and at most per_host_connections requests hit one host at once.
+    Call close() on shutdown to release the pool.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1024 * 1024,
+        range_parts: int = 4,
+        range_min_bytes: int = 8 * 1024 * 1024,
+        per_host_connections: int = 6,
+        max_retries: int = 3,
+        timeout: float = 120,
+    ):
+        self._chunk_size = chunk_size
+        self._range_parts = max(range_parts, 1)
+        self._range_min_bytes = range_min_bytes
+        self._per_host_connections = per_host_connections
+        self._max_retries = max_retries
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=32),
+        )
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self._per_host_connections)
+        return slot
+
+    async def fetch(
+        self,
+        url: str,
+        output_path: str,
+        max_memory_bytes: int = 0,
+        on_progress: Optional[Callable[[float], None]] = None,
+    ) -> AudioSource:
+        total = await self._retrying(url, lambda: self._probe(url))
+        sink = _Sink(output_path, total, max_memory_bytes)
+        progress = _Progress(total, on_progress)
+        try:
+            if total is None:
+                await self._retrying(url, lambda: self._fetch_whole(url, sink, progress))
+            else:
+                parts = [
+                    asyncio.ensure_future(self._fetch_range(url, sink, start, end, progress))
+                    for start, end in self._plan(total)
+                ]
+                try:
+                    await asyncio.gather(*parts)
+                finally:
+                    for part in parts:
+                        part.cancel()
+                    # Parts still writing must stop before the sink is finished or discarded
+                    await asyncio.gather(*parts, return_exceptions=True)
+            return await sink.finish()
+        except BaseException:
+            await sink.discard()
+            raise
+
+    def _plan(self, total: int) -> list[tuple[int, int]]:
+        parts = self._range_parts if total >= self._range_min_bytes else 1
+        size = max(-(-total // parts), 1)
+        return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+    async def _probe(self, url: str) -> Optional[int]:
+        """Returns the size if the server honours Range requests, else None."""
+        async with self._slot(url):
+            async with self._client.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+                _check_status(response)
+                if response.status_code != 206:
+                    return None
+                await response.aread()
+                _, _, total = response.headers.get("content-range", "").partition("/")
+                return int(total) if total.isdigit() else None
+
+    async def _fetch_whole(self, url: str, sink: _Sink, progress: _Progress) -> None:
+        # Without Range support an interrupted transfer starts over
+        position = 0
+        progress.done = 0
+        async with self._slot(url):
+            async with self._client.stream("GET", url) as response:
+                _check_status(response)
+                async for chunk in response.aiter_bytes(self._chunk_size):
+                    await sink.write(position, chunk)
+                    position += len(chunk)
+                    progress.add(len(chunk))
+
+    async def _fetch_range(
+        self, url: str, sink: _Sink, start: int, end: int, progress: _Progress
+    ) -> None:
+        position = start
+
+        async def resume() -> None:
+            nonlocal position
+            headers = {"Range": f"bytes={position}-{end - 1}"}
+            async with self._slot(url):
+                async with self._client.stream("GET", url, headers=headers) as response:
+                    _check_status(response)
+                    if response.status_code != 206:
+                        raise TransferInterruptedError("Server stopped honouring Range requests")
+                    async for chunk in response.aiter_bytes(self._chunk_size):
+                        chunk = chunk[: end - position]
+                        await sink.write(position, chunk)
+                        position += len(chunk)
+                        progress.add(len(chunk))
+                        if position >= end:
+                            return
+            if position < end:
+                raise TransferInterruptedError(f"Connection closed at byte {position} of {end}")
+
+        await self._retrying(url, resume)
+
+    async def _retrying(self, url: str, attempt: Callable[[], Awaitable]):
+        for retry in range(self._max_retries + 1):
+            try:
+                return await attempt()
+            except (httpx.TransportError, TransferInterruptedError) as e:
+                if retry == self._max_retries:
+                    raise
+                delay = min(0.5 * 2**retry, 8)
+                logger.info(f"Retrying {urlsplit(url).netloc} download in {delay}s: {e}")
+                await asyncio.sleep(delay)
+
+
+def _check_status(response: httpx.Response) -> None:
+    if response.status_code in _RETRYABLE_STATUS:
+        raise TransferInterruptedError(f"Server answered {response.status_code}")
+    response.raise_for_status()
@@ -1,6 +1,9 @@
+import asyncio
 import logging
 import re
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
 
 import httpx
 
@@ -15,10 +18,74 @@ _PROFILE_URL_PATTERN = re.compile(
 _APIFY_BASE_URL = "https://api.apify.com/v2"
 _ACTOR_ID = "apify~instagram-scraper"
 
+_TERMINAL_RUN_STATUSES = {"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"}
+
+
+@dataclass
+class _Listing:
+    created_at: float
+    videos: list[ProfileVideoInfo]
+    complete: bool
+    """True when the scrape covered the whole profile rather than stopping at a limit."""
+
+    def covers(self, max_videos: Optional[int]) -> bool:
+        return self.complete or (max_videos is not None and len(self.videos) >= max_videos)
+
+
+def _check_response(response: httpx.Response) -> None:
+    if response.status_code == 402:
+        raise ValueError("Apify usage limit reached. Check your Apify plan.")
+    if response.status_code == 401:
+        raise ValueError("Invalid Apify API token. Check APIFY_API_TOKEN.")
+    if response.status_code not in (200, 201):
+        raise ValueError(f"Apify request failed (HTTP {response.status_code})")
+
+
+def _to_video(item: dict, username: str) -> Optional[ProfileVideoInfo]:
+    is_video = item.get("isVideo") or item.get("type") == "Video"
+    if not is_video:
+        return None
+
+    shortcode = item.get("shortCode", "")
+    post_url = item.get("url") or f"https://www.instagram.com/p/{shortcode}/"
+
+    owner = item.get("ownerUsername", username)
+
+    return ProfileVideoInfo(
+        url=post_url,
+        title=item.get("caption", shortcode)[:80] if item.get("caption") else shortcode,
+        owner_username=owner,
+        duration_seconds=item.get("videoDuration"),
+        posted_at=None,
+        views_count=item.get("videoPlayCount") or item.get("videoViewCount"),
+        likes_count=item.get("likesCount"),
+        comments_count=item.get("commentsCount"),
+        direct_video_url=item.get("videoUrl"),
+    )
+
 
 class ApifyAdapter(ProfileVideoLister):
-    def __init__(self, api_token: str):
+    """Lists profile videos with the Apify Instagram scraper.
+
+    The actor runs asynchronously; its dataset is paged while the scrape is still going,
+    so videos are yielded as soon as they are scraped. Listings are kept per username for
+    cache_ttl_seconds, so re-running a profile skips the scrape.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        base_url: str = _APIFY_BASE_URL,
+        cache_ttl_seconds: float = 3600,
+        poll_interval: float = 2.0,
+        page_size: int = 100,
+    ):
         self._api_token = api_token
+        self._base_url = base_url.rstrip("/")
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._poll_interval = poll_interval
+        self._page_size = page_size
+        self._listings: dict[str, _Listing] = {}
 
     async def validate_profile_url(self, url: str) -> str:
         url = url.strip().rstrip("/")
@@ -37,8 +104,48 @@ class ApifyAdapter(ProfileVideoLister):
         profile_url: str,
         max_videos: Optional[int] = None,
     ) -> list[ProfileVideoInfo]:
+        return [video async for video in self.stream_videos(profile_url, max_videos)]
+
+    async def stream_videos(
+        self,
+        profile_url: str,
+        max_videos: Optional[int] = None,
+    ) -> AsyncIterator[ProfileVideoInfo]:
         username = await self.validate_profile_url(profile_url)
 
+        listing = self._cached(username)
+        if listing and listing.covers(max_videos):
+            logger.info(f"Using cached listing of {len(listing.videos)} videos for @{username}")
+            for video in listing.videos[:max_videos]:
+                yield video
+            return
+
+        videos: list[ProfileVideoInfo] = []
+        complete = False
+        async for video, run_finished in self._scrape(username, max_videos):
+            if video:
+                videos.append(video)
+                yield video
+            complete = run_finished and not max_videos
+
+        self._listings[username.lower()] = _Listing(time.monotonic(), videos, complete)
+        logger.info(f"Found {len(videos)} videos for @{username} via Apify")
+
+    def _cached(self, username: str) -> Optional[_Listing]:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, listing in self._listings.items()
+            if now - listing.created_at > self._cache_ttl_seconds
+        ]
+        for key in expired:
+            del self._listings[key]
+        return self._listings.get(username.lower())
+
+    async def _scrape(
+        self, username: str, max_videos: Optional[int]
+    ) -> AsyncIterator[tuple[Optional[ProfileVideoInfo], bool]]:
+        """Yields (video, False) while scraping and a final (None, True) if the run succeeded."""
         payload: dict = {
             "directUrls": [f"https://www.instagram.com/{username}/"],
             "resultsType": "posts",
@@ -48,51 +155,66 @@ class ApifyAdapter(ProfileVideoLister):
         if max_videos:
             payload["resultsLimit"] = max_videos
 
-        url = f"{_APIFY_BASE_URL}/acts/{_ACTOR_ID}/run-sync-get-dataset-items"
-
-        async with httpx.AsyncClient(timeout=300) as client:
-            response = await client.post(
-                url,
-                params={"token": self._api_token},
-                json=payload,
-            )
-
-            if response.status_code == 402:
-                raise ValueError("Apify usage limit reached. Check your Apify plan.")
-            if response.status_code == 401:
-                raise ValueError("Invalid Apify API token. Check APIFY_API_TOKEN.")
-            if response.status_code not in (200, 201):
-                raise ValueError(f"Apify request failed (HTTP {response.status_code})")
-
-            items = response.json()
-
-        videos: list[ProfileVideoInfo] = []
-        for item in items:
-            is_video = item.get("isVideo") or item.get("type") == "Video"
-            if not is_video:
-                continue
-
-            shortcode = item.get("shortCode", "")
-            post_url = item.get("url") or f"https://www.instagram.com/p/{shortcode}/"
-
-            owner = item.get("ownerUsername", username)
-
-            videos.append(
-                ProfileVideoInfo(
-                    url=post_url,
-                    title=item.get("caption", shortcode)[:80] if item.get("caption") else shortcode,
-                    owner_username=owner,
-                    duration_seconds=item.get("videoDuration"),
-                    posted_at=None,
-                    views_count=item.get("videoPlayCount") or item.get("videoViewCount"),
-                    likes_count=item.get("likesCount"),
-                    comments_count=item.get("commentsCount"),
-                    direct_video_url=item.get("videoUrl"),
-                )
-            )
-
-            if max_videos and len(videos) >= max_videos:
-                break
-
-        logger.info(f"Found {len(videos)} videos for @{username} via Apify")
-        return videos
+        params = {"token": self._api_token}
+        async with httpx.AsyncClient(base_url=self._base_url, timeout=60) as client:
+            response = await client.post(f"/acts/{_ACTOR_ID}/runs", params=params, json=payload)
+            _check_response(response)
+            run = response.json()["data"]
+            run_id, dataset_id = run["id"], run["defaultDatasetId"]
+
+            found = 0
+            offset = 0
+            finished = False
+            try:
+                while True:
+                    # Read the status before the page, so a page read after a terminal status
+                    # is known to hold the last items
+                    status = await self._run_status(client, run_id)
+                    response = await client.get(
+                        f"/datasets/{dataset_id}/items",
+                        params={**params, "offset": offset, "limit": self._page_size, "clean": 1},
+                    )
+                    _check_response(response)
+                    items = response.json()
+                    offset += len(items)
+
+                    for item in items:
+                        video = _to_video(item, username)
+                        if not video:
+                            continue
+                        found += 1
+                        yield video, False
+                        if max_videos and found >= max_videos:
+                            return
+
+                    if items and len(items) == self._page_size:
+                        continue
+                    if status in _TERMINAL_RUN_STATUSES:
+                        finished = True
+                        if status == "SUCCEEDED":
+                            yield None, True
+                        elif found:
+                            # Keep what was scraped, but never cache it as the full listing
+                            logger.warning(
+                                f"Apify run {run_id} {status.lower()} for @{username} "
+                                f"after {found} videos; the listing is partial"
+                            )
+                        else:
+                            raise ValueError(f"Apify run {status.lower()} for @{username}")
+                        return
+                    await asyncio.sleep(self._poll_interval)
+            finally:
+                if not finished:
+                    await self._abort(client, run_id)
+
+    async def _run_status(self, client: httpx.AsyncClient, run_id: str) -> str:
+        response = await client.get(f"/actor-runs/{run_id}", params={"token": self._api_token})
+        _check_response(response)
+        return response.json()["data"]["status"]
+
+    async def _abort(self, client: httpx.AsyncClient, run_id: str) -> None:
+        """Stops a run whose results are no longer needed, so it stops using credits."""
+        try:
+            await client.post(f"/actor-runs/{run_id}/abort", params={"token": self._api_token})
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not abort Apify run {run_id}: {e}")
@@ -0,0 +1,15 @@
+import re
+from typing import Optional
+
+_POST_URL_PATTERN = re.compile(
+    r"(?:https?://)?(?:www\.|m\.)?instagram\.com/(?:[A-Za-z0-9._]+/)?(?:p|reels?|tv)/"
+    r"([A-Za-z0-9_-]+)/?(?:[?#].*)?$"
+)
+
+
+def canonicalize_instagram_url(url: str) -> Optional[str]:
+    """Returns https://www.instagram.com/p/<shortcode>/ for post, reel and IGTV URLs."""
+    match = _POST_URL_PATTERN.match(url.strip())
+    if not match:
+        return None
+    return f"https://www.instagram.com/p/{match.group(1)}/"
@@ -1,4 +1,19 @@
 from src.infrastructure.persistence.memory_repository import InMemoryTranscriptionRepository
 from src.infrastructure.persistence.memory_batch_repository import InMemoryBatchTranscriptionRepository
+from src.infrastructure.persistence.memory_job_queue import InMemoryJobQueue
+from src.infrastructure.persistence.sqlite_batch_repository import (
+    SqliteBatchTranscriptionRepository,
+)
+from src.infrastructure.persistence.sqlite_database import SqliteDatabase
+from src.infrastructure.persistence.sqlite_job_queue import SqliteJobQueue
+from src.infrastructure.persistence.sqlite_repository import SqliteTranscriptionRepository
 
-__all__ = ["InMemoryTranscriptionRepository", "InMemoryBatchTranscriptionRepository"]
+__all__ = [
+    "InMemoryTranscriptionRepository",
+    "InMemoryBatchTranscriptionRepository",
+    "SqliteDatabase",
+    "SqliteTranscriptionRepository",
+    "SqliteBatchTranscriptionRepository",
+    "InMemoryJobQueue",
+    "SqliteJobQueue",
+]
@@ -0,0 +1,76 @@
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Collection, Optional
+from uuid import UUID, uuid4
+
+from src.application.ports import Job, JobQueue
+
+# Failed jobs kept for inspection; older ones are dropped as new ones fail
+_KEEP_FAILED = 1000
+
+
+@dataclass
+class _Entry:
+    job: Job
+    priority: int
+    seq: int
+    status: str = "queued"
+    lease_until: float = 0.0
+    error: Optional[str] = None
+
+
+class InMemoryJobQueue(JobQueue):
+    def __init__(self, keep_failed: int = _KEEP_FAILED):
+        self._entries: dict[UUID, _Entry] = {}
+        self._seq = itertools.count()
+        self._keep_failed = keep_failed
+        self._failed: deque[UUID] = deque()
+
+    async def enqueue(self, kind: str, payload: dict[str, Any], priority: int = 0) -> UUID:
+        job = Job(id=uuid4(), kind=kind, payload=payload, attempts=0)
+        self._entries[job.id] = _Entry(job=job, priority=priority, seq=next(self._seq))
+        return job.id
+
+    async def claim(
+        self, visibility_timeout: float, kinds: Optional[Collection[str]] = None
+    ) -> Optional[Job]:
+        now = time.monotonic()
+        ready = [
+            e
+            for e in self._entries.values()
+            if (e.status == "queued" or (e.status == "running" and e.lease_until < now))
+            and (kinds is None or e.job.kind in kinds)
+        ]
+        if not ready:
+            return None
+
+        entry = min(ready, key=lambda e: (-e.priority, e.seq))
+        entry.status = "running"
+        entry.lease_until = now + visibility_timeout
+        entry.job.attempts += 1
+        return Job(entry.job.id, entry.job.kind, entry.job.payload, entry.job.attempts)
+
+    async def extend(self, job_id: UUID, visibility_timeout: float) -> None:
+        entry = self._entries.get(job_id)
+        if entry and entry.status == "running":
+            entry.lease_until = time.monotonic() + visibility_timeout
+
+    async def ack(self, job_id: UUID) -> None:
+        self._entries.pop(job_id, None)
+
+    async def fail(self, job_id: UUID, error: str) -> None:
+        entry = self._entries.get(job_id)
+        if entry and entry.status != "failed":
+            entry.status = "failed"
+            entry.error = error
+            self._failed.append(job_id)
+        while len(self._failed) > self._keep_failed:
+            self._entries.pop(self._failed.popleft(), None)
+
+    async def recover(self) -> int:
+        running = [e for e in self._entries.values() if e.status == "running"]
+        for entry in running:
+            entry.status = "queued"
+        return len(running)
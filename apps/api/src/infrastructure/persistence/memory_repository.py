@@ -1,15 +1,27 @@
+import bisect
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from src.application.ports import TranscriptionRepository
+from src.application.ports import (
+    TranscriptionPage,
+    TranscriptionQuery,
+    TranscriptionRepository,
+    TranscriptionSummary,
+)
+from src.application.ports.transcription_repository import decode_cursor, encode_cursor
 from src.domain.entities import Transcription
 
 
 class InMemoryTranscriptionRepository(TranscriptionRepository):
     def __init__(self):
         self._storage: dict[UUID, Transcription] = {}
+        # (created_at, id) of every entry, ascending: pages walk it backwards from the cursor
+        self._order: list[tuple[datetime, str]] = []
 
     async def save(self, transcription: Transcription) -> None:
+        if transcription.id not in self._storage:
+            bisect.insort(self._order, (transcription.created_at, str(transcription.id)))
         self._storage[transcription.id] = transcription
 
     async def get(self, id: UUID) -> Optional[Transcription]:
@@ -18,8 +30,30 @@ class InMemoryTranscriptionRepository(TranscriptionRepository):
     async def list_all(self) -> list[Transcription]:
         return list(self._storage.values())
 
+    async def list_summaries(self, query: TranscriptionQuery) -> TranscriptionPage:
+        end = len(self._order)
+        if query.cursor:
+            created_at, id = decode_cursor(query.cursor)
+            end = bisect.bisect_left(self._order, (created_at, str(id)))
+
+        page: list[Transcription] = []
+        next_cursor = None
+        for index in range(end - 1, -1, -1):
+            t = self._storage[UUID(self._order[index][1])]
+            if not query.matches(t):
+                continue
+            if len(page) == query.limit:
+                next_cursor = encode_cursor(page[-1].created_at, page[-1].id)
+                break
+            page.append(t)
+        return TranscriptionPage(
+            items=[TranscriptionSummary.of(t) for t in page], next_cursor=next_cursor
+        )
+
     async def delete(self, id: UUID) -> bool:
-        if id in self._storage:
-            del self._storage[id]
-            return True
-        return False
+        transcription = self._storage.pop(id, None)
+        if transcription is None:
+            return False
+        key = (transcription.created_at, str(id))
+        del self._order[bisect.bisect_left(self._order, key)]
+        return True
@@ -0,0 +1,83 @@
+import json
+from typing import Optional
+from uuid import UUID
+
+from src.application.ports import BatchTranscriptionRepository
+from src.domain.entities import BatchStatus, BatchTranscription
+from src.infrastructure.persistence.sqlite_database import (
+    Row,
+    SqliteDatabase,
+    WriteBehindStore,
+    from_iso,
+    to_iso,
+)
+
+_TERMINAL = {BatchStatus.COMPLETED, BatchStatus.FAILED, BatchStatus.CANCELLED}
+
+
+def encode_batch(b: BatchTranscription) -> Row:
+    data = {
+        "id": str(b.id),
+        "profile_url": b.profile_url,
+        "profile_username": b.profile_username,
+        "status": b.status.value,
+        "transcription_ids": [str(tid) for tid in b.transcription_ids],
+        "total_videos": b.total_videos,
+        "completed_videos": b.completed_videos,
+        "failed_videos": b.failed_videos,
+        "error_message": b.error_message,
+        "created_at": to_iso(b.created_at),
+        "completed_at": to_iso(b.completed_at),
+    }
+    return Row(
+        id=b.id,
+        columns={"status": b.status.value, "created_at": to_iso(b.created_at)},
+        data=json.dumps(data, ensure_ascii=False),
+    )
+
+
+def decode_batch(raw: str) -> BatchTranscription:
+    data = json.loads(raw)
+    return BatchTranscription(
+        id=UUID(data["id"]),
+        profile_url=data["profile_url"],
+        profile_username=data["profile_username"],
+        status=BatchStatus(data["status"]),
+        transcription_ids=[UUID(tid) for tid in data["transcription_ids"]],
+        total_videos=data["total_videos"],
+        completed_videos=data["completed_videos"],
+        failed_videos=data["failed_videos"],
+        error_message=data["error_message"],
+        created_at=from_iso(data["created_at"]),
+        completed_at=from_iso(data["completed_at"]),
+    )
+
+
+class SqliteBatchTranscriptionRepository(BatchTranscriptionRepository):
+    def __init__(self, db: SqliteDatabase, cache_size: int = 1000, flush_interval: float = 0.5):
+        self._store: WriteBehindStore[BatchTranscription] = WriteBehindStore(
+            db,
+            table="batches",
+            encode=encode_batch,
+            decode=decode_batch,
+            get_id=lambda b: b.id,
+            cache_size=cache_size,
+            flush_interval=flush_interval,
+        )
+
+    async def save(self, batch: BatchTranscription) -> None:
+        immediate = batch.status in _TERMINAL or self._store.cached(batch.id) is None
+        await self._store.save(batch, immediate=immediate)
+
+    async def get(self, id: UUID) -> Optional[BatchTranscription]:
+        return await self._store.get(id)
+
+    async def list_all(self) -> list[BatchTranscription]:
+        batches = await self._store.query("SELECT id, data FROM batches")
+        return sorted(batches, key=lambda b: b.created_at)
+
+    async def delete(self, id: UUID) -> bool:
+        return await self._store.delete(id)
+
+    async def flush(self) -> None:
+        await self._store.flush()
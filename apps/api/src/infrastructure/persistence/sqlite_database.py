@@ -0,0 +1,245 @@
+import asyncio
+import logging
+import os
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcriptions (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    source_type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    batch_id TEXT,
+    summary TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transcriptions_status ON transcriptions (status);
+CREATE INDEX IF NOT EXISTS idx_transcriptions_created_at ON transcriptions (created_at);
+-- Keyset pagination: each filter column followed by the (created_at, id) sort key
+CREATE INDEX IF NOT EXISTS idx_transcriptions_page ON transcriptions (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_transcriptions_status_page
+    ON transcriptions (status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_transcriptions_source_type_page
+    ON transcriptions (source_type, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_transcriptions_batch_page
+    ON transcriptions (batch_id, created_at, id);
+
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_batches_status ON batches (status);
+CREATE INDEX IF NOT EXISTS idx_batches_created_at ON batches (created_at);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_until REAL,
+    error TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority DESC, lease_until);
+"""
+
+
+class SqliteDatabase:
+    """One WAL-mode SQLite connection, driven from a single dedicated thread."""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._conn = self._executor.submit(self._connect, path).result()
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        return conn
+
+    async def run(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, self._conn)
+
+    def close(self) -> None:
+        self._executor.submit(self._conn.close).result()
+        self._executor.shutdown(wait=True)
+
+
+class Row:
+    def __init__(self, id: UUID, columns: dict[str, Optional[str]], data: str):
+        self.id = id
+        self.columns = columns
+        self.data = data
+
+
+class WriteBehindStore(Generic[T]):
+    """Read-through LRU cache plus coalesced, batched writes for one table.
+
+    save() only marks an entity dirty; every dirty entity is written in a single
+    transaction once flush_interval has passed, so rapid progress saves cost one row
+    write per interval. Dirty entities stay pinned in the cache until written. Reads never
+    force a flush: queries see written rows, and callers merge in pending() themselves.
+    """
+
+    def __init__(
+        self,
+        db: SqliteDatabase,
+        table: str,
+        encode: Callable[[T], Row],
+        decode: Callable[[str], T],
+        get_id: Callable[[T], UUID],
+        cache_size: int,
+        flush_interval: float,
+    ):
+        self._db = db
+        self._table = table
+        self._encode = encode
+        self._decode = decode
+        self._get_id = get_id
+        self._cache_size = cache_size
+        self._flush_interval = flush_interval
+        self._cache: OrderedDict[UUID, T] = OrderedDict()
+        self._dirty: dict[UUID, T] = {}
+        self._writing: dict[UUID, T] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_lock = asyncio.Lock()
+
+    def _remember(self, entity: T) -> None:
+        key = self._get_id(entity)
+        self._cache[key] = entity
+        self._cache.move_to_end(key)
+        for old_key in list(self._cache.keys()):
+            if len(self._cache) <= self._cache_size:
+                break
+            if old_key not in self._dirty:
+                del self._cache[old_key]
+
+    async def save(self, entity: T, immediate: bool = False) -> None:
+        self._dirty[self._get_id(entity)] = entity
+        self._remember(entity)
+        if immediate:
+            await self.flush()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(
+                self._flush_interval, lambda: asyncio.ensure_future(self._background_flush())
+            )
+
+    async def _background_flush(self) -> None:
+        try:
+            await self.flush()
+        except sqlite3.Error:
+            pass  # already logged; the rows stay dirty for the next flush
+
+    async def flush(self) -> None:
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+            pending = self._writing = self._dirty
+            self._dirty = {}
+            # Encode on the event loop: entities are mutated there, never mid-serialization
+            rows = [self._encode(entity) for entity in pending.values()]
+
+            try:
+                await self._db.run(lambda conn: self._write(conn, rows))
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write {len(rows)} rows to {self._table}: {e}")
+                for key, entity in pending.items():
+                    self._dirty.setdefault(key, entity)
+                raise
+            finally:
+                self._writing = {}
+
+    def _write(self, conn: sqlite3.Connection, rows: list[Row]) -> None:
+        columns = ["id", *rows[0].columns.keys(), "data"]
+        updates = ", ".join(f"{c} = excluded.{c}" for c in columns[1:])
+        sql = (
+            f"INSERT INTO {self._table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+        with conn:
+            conn.executemany(
+                sql, [(str(row.id), *row.columns.values(), row.data) for row in rows]
+            )
+
+    async def get(self, id: UUID) -> Optional[T]:
+        entity = self._cache.get(id)
+        if entity is not None:
+            self._cache.move_to_end(id)
+            return entity
+
+        def select(conn: sqlite3.Connection):
+            return conn.execute(
+                f"SELECT data FROM {self._table} WHERE id = ?", (str(id),)
+            ).fetchone()
+
+        row = await self._db.run(select)
+        if row is None:
+            return None
+        entity = self._cache.get(id) or self._decode(row[0])
+        self._remember(entity)
+        return entity
+
+    async def query(self, sql: str, params: Iterable[Any] = ()) -> list[T]:
+        """Runs an unfiltered SELECT id, data ... query over the table plus pending entities.
+
+        Stored rows are replaced by live cached entities; pending entities the table has
+        never seen are appended after them.
+        """
+        rows = await self.query_rows(sql, params)
+        entities = [self._cache.get(UUID(row[0])) or self._decode(row[1]) for row in rows]
+        returned = {UUID(row[0]) for row in rows}
+        entities.extend(e for e in self.pending() if self._get_id(e) not in returned)
+        return entities
+
+    async def query_rows(self, sql: str, params: Iterable[Any] = ()) -> list[tuple]:
+        """Runs any SELECT against the rows written so far, returning the raw rows."""
+        return await self._db.run(lambda conn: conn.execute(sql, tuple(params)).fetchall())
+
+    def pending(self) -> list[T]:
+        """Entities saved but not yet written, including those in the write in flight."""
+        return list({**self._writing, **self._dirty}.values())
+
+    def cached(self, id: UUID) -> Optional[T]:
+        return self._cache.get(id)
+
+    async def delete(self, id: UUID) -> bool:
+        self._cache.pop(id, None)
+        was_pending = self._dirty.pop(id, None) is not None
+
+        def remove(conn: sqlite3.Connection) -> int:
+            with conn:
+                return conn.execute(f"DELETE FROM {self._table} WHERE id = ?", (str(id),)).rowcount
+
+        return await self._db.run(remove) > 0 or was_pending
+
+
+def to_iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def from_iso(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
@@ -0,0 +1,102 @@
+import json
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Collection, Optional
+from uuid import UUID, uuid4
+
+from src.application.ports import Job, JobQueue
+from src.infrastructure.persistence.sqlite_database import SqliteDatabase, to_iso
+
+# Failed jobs kept for inspection; older ones are deleted as new ones fail
+_KEEP_FAILED = 1000
+
+
+class SqliteJobQueue(JobQueue):
+    """Job queue in the jobs table. Leases are wall-clock times so they survive restarts."""
+
+    def __init__(self, db: SqliteDatabase, keep_failed: int = _KEEP_FAILED):
+        self._db = db
+        self._keep_failed = keep_failed
+
+    async def enqueue(self, kind: str, payload: dict[str, Any], priority: int = 0) -> UUID:
+        job_id = uuid4()
+
+        def insert(conn: sqlite3.Connection) -> None:
+            with conn:
+                conn.execute(
+                    "INSERT INTO jobs (id, kind, payload, priority, status, attempts, created_at) "
+                    "VALUES (?, ?, ?, ?, 'queued', 0, ?)",
+                    (str(job_id), kind, json.dumps(payload), priority, to_iso(datetime.utcnow())),
+                )
+
+        await self._db.run(insert)
+        return job_id
+
+    async def claim(
+        self, visibility_timeout: float, kinds: Optional[Collection[str]] = None
+    ) -> Optional[Job]:
+        kind_filter = "" if kinds is None else f"AND kind IN ({', '.join('?' for _ in kinds)})"
+
+        def take(conn: sqlite3.Connection):
+            now = time.time()
+            with conn:
+                return conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_until = ? "
+                    "WHERE id = ("
+                    "  SELECT id FROM jobs"
+                    "  WHERE (status = 'queued' OR (status = 'running' AND lease_until < ?))"
+                    f"  {kind_filter}"
+                    "  ORDER BY priority DESC, rowid LIMIT 1"
+                    ") RETURNING id, kind, payload, attempts",
+                    (now + visibility_timeout, now, *(kinds or ())),
+                ).fetchone()
+
+        row = await self._db.run(take)
+        if row is None:
+            return None
+        return Job(id=UUID(row[0]), kind=row[1], payload=json.loads(row[2]), attempts=row[3])
+
+    async def extend(self, job_id: UUID, visibility_timeout: float) -> None:
+        def touch(conn: sqlite3.Connection) -> None:
+            with conn:
+                conn.execute(
+                    "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = 'running'",
+                    (time.time() + visibility_timeout, str(job_id)),
+                )
+
+        await self._db.run(touch)
+
+    async def ack(self, job_id: UUID) -> None:
+        def remove(conn: sqlite3.Connection) -> None:
+            with conn:
+                conn.execute("DELETE FROM jobs WHERE id = ?", (str(job_id),))
+
+        await self._db.run(remove)
+
+    async def fail(self, job_id: UUID, error: str) -> None:
+        def mark(conn: sqlite3.Connection) -> None:
+            with conn:
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, lease_until = NULL "
+                    "WHERE id = ?",
+                    (error, str(job_id)),
+                )
+                conn.execute(
+                    "DELETE FROM jobs WHERE status = 'failed' AND id NOT IN ("
+                    "  SELECT id FROM jobs WHERE status = 'failed' ORDER BY rowid DESC LIMIT ?"
+                    ")",
+                    (self._keep_failed,),
+                )
+
+        await self._db.run(mark)
+
+    async def recover(self) -> int:
+        def requeue(conn: sqlite3.Connection) -> int:
+            with conn:
+                return conn.execute(
+                    "UPDATE jobs SET status = 'queued', lease_until = NULL "
+                    "WHERE status = 'running'"
+                ).rowcount
+
+        return await self._db.run(requeue)
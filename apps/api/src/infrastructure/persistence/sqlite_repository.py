@@ -0,0 +1,246 @@
+import json
+from typing import Optional
+from uuid import UUID
+
+from src.application.ports import (
+    TranscriptionPage,
+    TranscriptionQuery,
+    TranscriptionRepository,
+    TranscriptionSummary,
+)
+from src.application.ports.transcription_repository import decode_cursor, encode_cursor
+from src.domain.entities import Transcription, TranscriptionResult, TranscriptionSegment
+from src.domain.entities.transcription import SourceType, TranscriptionStatus, VideoSource
+from src.infrastructure.persistence.sqlite_database import (
+    Row,
+    SqliteDatabase,
+    WriteBehindStore,
+    from_iso,
+    to_iso,
+)
+
+_TERMINAL = {
+    TranscriptionStatus.COMPLETED,
+    TranscriptionStatus.FAILED,
+    TranscriptionStatus.CANCELLED,
+}
+
+
+def _segment_to_list(segment: TranscriptionSegment) -> list:
+    return [segment.id, segment.start, segment.end, segment.text, segment.confidence]
+
+
+def _segment_from_list(values: list) -> TranscriptionSegment:
+    seg_id, start, end, text, confidence = values
+    return TranscriptionSegment(id=seg_id, start=start, end=end, text=text, confidence=confidence)
+
+
+def encode_transcription(t: Transcription) -> Row:
+    source = t.source
+    data = {
+        "id": str(t.id),
+        "source": {
+            "type": source.type.value,
+            "filename": source.filename,
+            "url": source.url,
+            "title": source.title,
+            "owner_username": source.owner_username,
+            "duration_seconds": source.duration_seconds,
+            "size_bytes": source.size_bytes,
+            "views_count": source.views_count,
+            "likes_count": source.likes_count,
+            "comments_count": source.comments_count,
+        },
+        "status": t.status.value,
+        "progress": t.progress,
+        "result": (
+            {
+                "text": t.result.text,
+                "segments": [_segment_to_list(s) for s in t.result.segments],
+                "language": t.result.language,
+                "duration_seconds": t.result.duration_seconds,
+            }
+            if t.result
+            else None
+        ),
+        "error_message": t.error_message,
+        "model_used": t.model_used,
+        "batch_id": str(t.batch_id) if t.batch_id else None,
+        "device_used": t.device_used,
+        "processing_time_seconds": t.processing_time_seconds,
+        "partial_segments": [_segment_to_list(s) for s in t.partial_segments],
+        "eta_seconds": t.eta_seconds,
+        "realtime_factor": t.realtime_factor,
+        "created_at": to_iso(t.created_at),
+        "completed_at": to_iso(t.completed_at),
+    }
+    return Row(
+        id=t.id,
+        columns={
+            "status": t.status.value,
+            "source_type": source.type.value,
+            "created_at": to_iso(t.created_at),
+            "batch_id": data["batch_id"],
+            "summary": encode_summary(TranscriptionSummary.of(t)),
+        },
+        data=json.dumps(data, ensure_ascii=False),
+    )
+
+
+def encode_summary(s: TranscriptionSummary) -> str:
+    return json.dumps(
+        {
+            "source_name": s.source_name,
+            "progress": s.progress,
+            "language": s.language,
+            "error_message": s.error_message,
+            "model_used": s.model_used,
+            "views_count": s.views_count,
+            "likes_count": s.likes_count,
+            "comments_count": s.comments_count,
+            "completed_at": to_iso(s.completed_at),
+        },
+        ensure_ascii=False,
+    )
+
+
+def decode_summary(
+    id: str, status: str, source_type: str, created_at: str, batch_id: Optional[str], raw: str
+) -> TranscriptionSummary:
+    data = json.loads(raw)
+    return TranscriptionSummary(
+        id=UUID(id),
+        status=TranscriptionStatus(status),
+        source_type=SourceType(source_type),
+        source_name=data["source_name"],
+        progress=data["progress"],
+        language=data["language"],
+        error_message=data["error_message"],
+        model_used=data["model_used"],
+        batch_id=UUID(batch_id) if batch_id else None,
+        views_count=data["views_count"],
+        likes_count=data["likes_count"],
+        comments_count=data["comments_count"],
+        created_at=from_iso(created_at),
+        completed_at=from_iso(data["completed_at"]),
+    )
+
+
+def decode_transcription(raw: str) -> Transcription:
+    data = json.loads(raw)
+    source = data["source"]
+    result = data["result"]
+    return Transcription(
+        id=UUID(data["id"]),
+        source=VideoSource(**{**source, "type": SourceType(source["type"])}),
+        status=TranscriptionStatus(data["status"]),
+        progress=data["progress"],
+        result=(
+            TranscriptionResult(
+                text=result["text"],
+                segments=[_segment_from_list(s) for s in result["segments"]],
+                language=result["language"],
+                duration_seconds=result["duration_seconds"],
+            )
+            if result
+            else None
+        ),
+        error_message=data["error_message"],
+        model_used=data["model_used"],
+        batch_id=UUID(data["batch_id"]) if data.get("batch_id") else None,
+        device_used=data["device_used"],
+        processing_time_seconds=data["processing_time_seconds"],
+        partial_segments=[_segment_from_list(s) for s in data["partial_segments"]],
+        eta_seconds=data["eta_seconds"],
+        realtime_factor=data["realtime_factor"],
+        created_at=from_iso(data["created_at"]),
+        completed_at=from_iso(data["completed_at"]),
+    )
+
+
+class SqliteTranscriptionRepository(TranscriptionRepository):
+    def __init__(self, db: SqliteDatabase, cache_size: int = 1000, flush_interval: float = 0.5):
+        self._store: WriteBehindStore[Transcription] = WriteBehindStore(
+            db,
+            table="transcriptions",
+            encode=encode_transcription,
+            decode=decode_transcription,
+            get_id=lambda t: t.id,
+            cache_size=cache_size,
+            flush_interval=flush_interval,
+        )
+
+    async def save(self, transcription: Transcription) -> None:
+        # Progress saves are batched; state a client must not lose is written right away
+        immediate = (
+            transcription.status in _TERMINAL or self._store.cached(transcription.id) is None
+        )
+        await self._store.save(transcription, immediate=immediate)
+
+    async def get(self, id: UUID) -> Optional[Transcription]:
+        return await self._store.get(id)
+
+    async def list_all(self) -> list[Transcription]:
+        transcriptions = await self._store.query("SELECT id, data FROM transcriptions")
+        return sorted(transcriptions, key=lambda t: t.created_at)
+
+    async def list_summaries(self, query: TranscriptionQuery) -> TranscriptionPage:
+        where, params = [], []
+        if query.status:
+            where.append("status = ?")
+            params.append(query.status.value)
+        if query.source_type:
+            where.append("source_type = ?")
+            params.append(query.source_type.value)
+        if query.batch_id:
+            where.append("batch_id = ?")
+            params.append(str(query.batch_id))
+        if query.cursor:
+            created_at, id = decode_cursor(query.cursor)
+            where.append("(created_at, id) < (?, ?)")
+            params.extend([to_iso(created_at), str(id)])
+
+        # Unwritten saves are merged over the stored rows instead of flushed first: their
+        # stored status may be stale, so those rows are dropped and the live entity is
+        # matched in memory. Over-fetch by one row per pending entity to keep the page full.
+        pending = self._store.pending()
+        pending_ids = {str(t.id) for t in pending}
+        sql = (
+            "SELECT id, status, source_type, created_at, batch_id, summary FROM transcriptions "
+            f"{'WHERE ' + ' AND '.join(where) if where else ''} "
+            "ORDER BY created_at DESC, id DESC LIMIT ?"
+        )
+        rows = await self._store.query_rows(sql, [*params, query.limit + 1 + len(pending)])
+
+        items = []
+        for id, status, source_type, created_at, batch_id, summary in rows:
+            if id in pending_ids:
+                continue
+            live = self._store.cached(UUID(id))
+            if live is not None:
+                items.append(TranscriptionSummary.of(live))
+            else:
+                items.append(
+                    decode_summary(id, status, source_type, created_at, batch_id, summary)
+                )
+
+        after = None
+        if query.cursor:
+            created_at, id = decode_cursor(query.cursor)
+            after = (created_at, str(id))
+        for t in pending:
+            if query.matches(t) and (after is None or (t.created_at, str(t.id)) < after):
+                items.append(TranscriptionSummary.of(t))
+        items.sort(key=lambda s: (s.created_at, str(s.id)), reverse=True)
+
+        next_cursor = None
+        if len(items) > query.limit:
+            items = items[: query.limit]
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return TranscriptionPage(items=items, next_cursor=next_cursor)
+
+    async def delete(self, id: UUID) -> bool:
+        return await self._store.delete(id)
+
+    async def flush(self) -> None:
+        await self._store.flush()
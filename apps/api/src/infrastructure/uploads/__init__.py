@@ -0,0 +1,15 @@
+from src.infrastructure.uploads.upload_store import (
+    StoredUpload,
+    UploadSessionError,
+    UploadSessionNotFoundError,
+    UploadStore,
+    UploadTooLargeError,
+)
+
+__all__ = [
+    "UploadStore",
+    "StoredUpload",
+    "UploadTooLargeError",
+    "UploadSessionError",
+    "UploadSessionNotFoundError",
+]
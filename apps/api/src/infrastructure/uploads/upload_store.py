@@ -0,0 +1,161 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID, uuid4
+
+import aiofiles
+
+logger = logging.getLogger(__name__)
+
+_SESSION_TTL_SECONDS = 24 * 3600
+
+
+class UploadTooLargeError(Exception):
+    pass
+
+
+class UploadSessionError(Exception):
+    pass
+
+
+class UploadSessionNotFoundError(UploadSessionError):
+    pass
+
+
+@dataclass
+class StoredUpload:
+    path: str
+    filename: str
+    size_bytes: int
+    content_hash: str
+
+
+@dataclass
+class UploadSession:
+    id: UUID
+    path: str
+    filename: str
+    total_bytes: Optional[int]
+    offset: int = 0
+    digest: Any = field(default_factory=hashlib.sha256)
+    updated_at: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class UploadStore:
+    """Writes uploads to disk in bounded chunks, hashing them in the same pass.
+
+    Besides one-shot uploads it keeps resumable sessions: a client appends chunks at the
+    current offset and, after a dropped connection, asks for the offset and carries on.
+    Sessions live in memory and do not survive a restart.
+    """
+
+    def __init__(self, upload_dir: str, max_bytes: int, chunk_size: int):
+        self._dir = upload_dir
+        self._max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self._sessions: dict[UUID, UploadSession] = {}
+
+    def _new_path(self, filename: str) -> str:
+        os.makedirs(self._dir, exist_ok=True)
+        ext = os.path.splitext(filename)[1] or ".mp4"
+        return os.path.join(self._dir, f"{uuid4()}{ext}")
+
+    def _check_size(self, size: int) -> None:
+        if size > self._max_bytes:
+            raise UploadTooLargeError(
+                f"Upload exceeds the {self._max_bytes // (1024 * 1024)} MB limit"
+            )
+
+    async def save(self, chunks: AsyncIterator[bytes], filename: str) -> StoredUpload:
+        path = self._new_path(filename)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(path, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    self._check_size(size)
+                    digest.update(chunk)
+                    await f.write(chunk)
+        except BaseException:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+        return StoredUpload(path, filename, size, digest.hexdigest())
+
+    def create_session(self, filename: str, total_bytes: Optional[int] = None) -> UploadSession:
+        if total_bytes is not None:
+            self._check_size(total_bytes)
+        self._expire_sessions()
+
+        session = UploadSession(
+            id=uuid4(),
+            path=self._new_path(filename),
+            filename=filename,
+            total_bytes=total_bytes,
+        )
+        open(session.path, "wb").close()
+        self._sessions[session.id] = session
+        return session
+
+    def get_session(self, session_id: UUID) -> UploadSession:
+        session = self._sessions.get(session_id)
+        if not session:
+            raise UploadSessionNotFoundError("Upload session not found")
+        return session
+
+    async def append(
+        self, session_id: UUID, offset: int, chunks: AsyncIterator[bytes]
+    ) -> UploadSession:
+        """Appends at offset; bytes written before a disconnect are kept for the next call."""
+        session = self.get_session(session_id)
+        if session.lock.locked():
+            raise UploadSessionError("Another request is writing to this upload")
+
+        async with session.lock:
+            if offset != session.offset:
+                raise UploadSessionError(f"Expected offset {session.offset}, got {offset}")
+
+            limit = self._max_bytes if session.total_bytes is None else session.total_bytes
+            async with aiofiles.open(session.path, "ab") as f:
+                async for chunk in chunks:
+                    if session.offset + len(chunk) > limit:
+                        if session.total_bytes is None:
+                            self._check_size(session.offset + len(chunk))
+                        raise UploadSessionError("Upload exceeds its declared size")
+                    await f.write(chunk)
+                    await f.flush()
+                    session.digest.update(chunk)
+                    session.offset += len(chunk)
+                    session.updated_at = time.monotonic()
+        return session
+
+    def finish(self, session_id: UUID) -> StoredUpload:
+        session = self.get_session(session_id)
+        if session.lock.locked():
+            raise UploadSessionError("Another request is writing to this upload")
+        if session.total_bytes is not None and session.offset != session.total_bytes:
+            raise UploadSessionError(
+                f"Upload incomplete: {session.offset} of {session.total_bytes} bytes"
+            )
+        del self._sessions[session_id]
+        return StoredUpload(
+            session.path, session.filename, session.offset, session.digest.hexdigest()
+        )
+
+    def cancel(self, session_id: UUID) -> None:
+        session = self._sessions.pop(session_id, None)
+        if session and os.path.exists(session.path):
+            os.remove(session.path)
+
+    def _expire_sessions(self) -> None:
+        cutoff = time.monotonic() - _SESSION_TTL_SECONDS
+        for session in [s for s in self._sessions.values() if s.updated_at < cutoff]:
+            logger.info(f"Discarding abandoned upload session {session.id}")
+            self.cancel(session.id)
@@ -1,3 +1,18 @@
+from src.infrastructure.whisper.inference_scheduler import (
+    DeviceInferenceScheduler,
+    detect_device,
+    plan_slots,
+    pool_slots,
+)
+from src.infrastructure.whisper.result_cache import CachedWhisperService, WhisperResultCache
 from src.infrastructure.whisper.whisper_adapter import WhisperAdapter
 
-__all__ = ["WhisperAdapter"]
+__all__ = [
+    "WhisperAdapter",
+    "CachedWhisperService",
+    "WhisperResultCache",
+    "DeviceInferenceScheduler",
+    "detect_device",
+    "plan_slots",
+    "pool_slots",
+]
@@ -0,0 +1,125 @@
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+import wave
+from typing import Optional
+
+import numpy as np
+
+from src.application.ports.whisper_service import AudioSource
+from src.infrastructure.whisper.long_form import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+_READ_SIZE = 1024 * 1024
+
+
+class AudioDecodeError(Exception):
+    pass
+
+
+def _ffmpeg_command(input_arg: str, max_seconds: Optional[float] = None) -> list[str]:
+    # float32 output is Whisper's input format, so the pipe's buffer becomes the array as is
+    limit = ["-t", str(max_seconds)] if max_seconds else []
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-threads",
+        "0",
+        *limit,
+        "-i",
+        input_arg,
+        "-f",
+        "f32le",
+        "-ac",
+        "1",
+        "-acodec",
+        "pcm_f32le",
+        "-ar",
+        str(SAMPLE_RATE),
+        "-",
+    ]
+
+
+def _run_ffmpeg(
+    input_arg: str, data: bytes = b"", max_seconds: Optional[float] = None
+) -> np.ndarray:
+    process = subprocess.Popen(
+        _ffmpeg_command(input_arg, max_seconds),
+        stdin=subprocess.PIPE if data else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    errors: list[bytes] = []
+    stderr_reader = threading.Thread(target=lambda: errors.append(process.stderr.read()))
+    stderr_reader.start()
+
+    def feed() -> None:
+        try:
+            process.stdin.write(data)
+        except BrokenPipeError:
+            pass  # ffmpeg gave up early; its exit status says why
+        finally:
+            process.stdin.close()
+
+    writer = threading.Thread(target=feed) if data else None
+    if writer:
+        writer.start()
+
+    samples = bytearray()
+    while chunk := process.stdout.read(_READ_SIZE):
+        samples += chunk
+    if writer:
+        writer.join()
+    stderr_reader.join()
+
+    if process.wait() != 0:
+        message = b"".join(errors).decode(errors="replace").strip().splitlines()
+        raise AudioDecodeError(f"ffmpeg failed: {message[-1] if message else 'no output'}")
+    # The bytearray is writable, so torch.from_numpy can wrap it without copying
+    usable = len(samples) - len(samples) % 4
+    return np.frombuffer(memoryview(samples)[:usable], dtype=np.float32)
+
+
+def _read_pcm_wav(path: str, max_seconds: Optional[float] = None):
+    try:
+        with wave.open(path, "rb") as wav:
+            if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) == (SAMPLE_RATE, 1, 2):
+                count = wav.getnframes()
+                if max_seconds:
+                    count = min(count, int(max_seconds * SAMPLE_RATE))
+                frames = wav.readframes(count)
+                return np.frombuffer(frames, np.int16).astype(np.float32) / 32768.0
+    except (wave.Error, EOFError):
+        pass
+    return None
+
+
+def load_audio(audio: AudioSource, max_seconds: Optional[float] = None) -> np.ndarray:
+    """Decodes a media file or in-memory media to 16 kHz mono float32.
+
+    max_seconds stops decoding after that much audio from the start.
+
+    16 kHz mono 16-bit WAV is already in Whisper's input format, so it is read directly.
+    Everything else is piped through one ffmpeg process straight into the array. In-memory
+    media ffmpeg cannot parse from a pipe (e.g. MP4 with its index at the end) is retried
+    from a temporary file.
+    """
+    if isinstance(audio, str):
+        samples = _read_pcm_wav(audio, max_seconds)
+        return samples if samples is not None else _run_ffmpeg(audio, max_seconds=max_seconds)
+
+    try:
+        return _run_ffmpeg("pipe:0", audio, max_seconds)
+    except AudioDecodeError as e:
+        logger.info(f"Decoding {len(audio)} bytes from a pipe failed, retrying from disk: {e}")
+    fd, path = tempfile.mkstemp(prefix="vidscribe-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio)
+        return _run_ffmpeg(path, max_seconds=max_seconds)
+    finally:
+        os.remove(path)
+
@@ -0,0 +1,197 @@
+"""Compares the CTranslate2 backend against openai-whisper on the same audio.
+
+    python -m src.infrastructure.whisper.backend_comparison a.mp3 b.wav --model base
+
+For every file, both backends transcribe the audio with the same model and language. The
+report shows each backend's wall time and real-time factor. It also shows how far the
+CTranslate2 transcript is from the openai-whisper one: word error rate, detected language,
+segment count and mean drift of segment start times. With --max-wer, the exit status is
+1 when any file differs by more than that.
+"""
+
+import argparse
+import asyncio
+import io
+import re
+import sys
+import time
+import wave
+from dataclasses import dataclass
+from typing import Optional
+
+from src.application.ports.whisper_service import WhisperResult, WhisperService
+from src.domain.entities import TranscriptionSegment
+from src.infrastructure.whisper.audio_loader import load_audio
+from src.infrastructure.whisper.long_form import SAMPLE_RATE
+
+_WORD = re.compile(r"[\w']+")
+
+
+@dataclass
+class Comparison:
+    path: str
+    audio_seconds: float
+    reference_seconds: float
+    candidate_seconds: float
+    word_error_rate: float
+    reference_language: str
+    candidate_language: str
+    reference_segments: int
+    candidate_segments: int
+    start_drift_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_seconds / self.candidate_seconds if self.candidate_seconds else 0
+
+
+def _words(text: str) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level edit distance over the reference length, ignoring case and punctuation."""
+    ref, hyp = _words(reference), _words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref_word != hyp_word))
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def start_drift(
+    reference: list[TranscriptionSegment], candidate: list[TranscriptionSegment]
+) -> float:
+    """Mean distance from each candidate segment start to the nearest reference start."""
+    if not reference or not candidate:
+        return 0.0
+    starts = [segment.start for segment in reference]
+    return sum(min(abs(s.start - start) for start in starts) for s in candidate) / len(candidate)
+
+
+async def _timed(
+    service: WhisperService, path: str, language: Optional[str], model_size: str
+) -> tuple[WhisperResult, float]:
+    start_time = time.perf_counter()
+    result = await service.transcribe(path, language=language, model_size=model_size)
+    return result, time.perf_counter() - start_time
+
+
+def _silence_wav(seconds: float = 1.0) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(b"\0\0" * int(seconds * SAMPLE_RATE))
+    return buffer.getvalue()
+
+
+async def compare(
+    reference: WhisperService,
+    candidate: WhisperService,
+    paths: list[str],
+    model_size: str,
+    language: Optional[str] = None,
+) -> list[Comparison]:
+    """Runs both services on every file, one at a time so timings do not interfere."""
+    # Load both models up front so the first file's timings exclude it
+    for service in (reference, candidate):
+        await service.transcribe(_silence_wav(), language=language, model_size=model_size)
+
+    comparisons = []
+    for path in paths:
+        audio_seconds = load_audio(path).shape[0] / SAMPLE_RATE
+        ref, ref_seconds = await _timed(reference, path, language, model_size)
+        cand, cand_seconds = await _timed(candidate, path, language, model_size)
+        comparisons.append(
+            Comparison(
+                path=path,
+                audio_seconds=audio_seconds,
+                reference_seconds=ref_seconds,
+                candidate_seconds=cand_seconds,
+                word_error_rate=word_error_rate(ref.text, cand.text),
+                reference_language=ref.language,
+                candidate_language=cand.language,
+                reference_segments=len(ref.segments),
+                candidate_segments=len(cand.segments),
+                start_drift_seconds=start_drift(ref.segments, cand.segments),
+            )
+        )
+    return comparisons
+
+
+def _report(comparisons: list[Comparison]) -> str:
+    header = (
+        f"{'file':<32} {'audio s':>8} {'openai s':>9} {'ct2 s':>8} {'speedup':>8} "
+        f"{'WER':>6} {'lang':>9} {'segments':>9} {'drift s':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for c in comparisons:
+        lines.append(
+            f"{c.path[-32:]:<32} {c.audio_seconds:>8.1f} {c.reference_seconds:>9.2f} "
+            f"{c.candidate_seconds:>8.2f} {c.speedup:>7.2f}x {c.word_error_rate:>6.1%} "
+            f"{c.reference_language + '/' + c.candidate_language:>9} "
+            f"{f'{c.reference_segments}/{c.candidate_segments}':>9} "
+            f"{c.start_drift_seconds:>8.2f}"
+        )
+    if comparisons:
+        audio = sum(c.audio_seconds for c in comparisons)
+        ref = sum(c.reference_seconds for c in comparisons)
+        cand = sum(c.candidate_seconds for c in comparisons)
+        lines.append("-" * len(header))
+        lines.append(
+            f"{'total':<32} {audio:>8.1f} {ref:>9.2f} {cand:>8.2f} "
+            f"{ref / cand if cand else 0:>7.2f}x   real-time factor "
+            f"openai {ref / audio if audio else 0:.3f}, ct2 {cand / audio if audio else 0:.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", help="Audio or video files to transcribe")
+    parser.add_argument("--model", default="base", help="Whisper model size for both backends")
+    parser.add_argument("--language", default=None, help="Language code; detected if omitted")
+    parser.add_argument("--compute-type", default="int8", help="CTranslate2 compute type")
+    parser.add_argument("--threads", type=int, default=0, help="CPU threads (0: all cores)")
+    parser.add_argument("--max-wer", type=float, default=None, help="Fail above this WER")
+    args = parser.parse_args(argv)
+
+    import torch
+
+    from src.infrastructure.whisper.faster_whisper_adapter import FasterWhisperAdapter
+    from src.infrastructure.whisper.whisper_adapter import WhisperAdapter
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    reference = WhisperAdapter(model_size=args.model, workers=1)
+    candidate = FasterWhisperAdapter(
+        model_size=args.model,
+        device=reference.get_device(),
+        compute_type=args.compute_type,
+        workers=1,
+        cpu_threads=args.threads,
+    )
+    try:
+        comparisons = asyncio.run(
+            compare(reference, candidate, args.files, args.model, args.language)
+        )
+    finally:
+        reference.close()
+        candidate.close()
+
+    print(_report(comparisons))
+    if args.max_wer is not None and any(c.word_error_rate > args.max_wer for c in comparisons):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from src.application.ports.whisper_service import DecodeProgress
+
+SAMPLE_RATE = 16000
+HOP_LENGTH = 160
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+
+
+class _FrameCounter:
+    """Stand-in for the tqdm bar whisper.transcribe advances by the decoder's seek delta."""
+
+    def __init__(self, total: Optional[int] = None, **_kwargs):
+        self.total = total or 0
+        self.n = 0
+        self._callback: Optional[Callable[[int, int], None]] = getattr(_local, "callback", None)
+
+    def __enter__(self) -> "_FrameCounter":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        return None
+
+    def update(self, n: int = 1) -> None:
+        self.n += n
+        if self._callback:
+            self._callback(self.n, self.total)
+
+
+class _TqdmModule:
+    tqdm = _FrameCounter
+
+
+def install() -> None:
+    """Routes whisper's progress bar through _FrameCounter (once per process)."""
+    global _installed
+    with _install_lock:
+        if not _installed:
+            importlib.import_module("whisper.transcribe").tqdm = _TqdmModule
+            _installed = True
+
+
+@contextmanager
+def report_frames(callback: Optional[Callable[[int, int], None]]) -> Iterator[None]:
+    """Calls callback(frames_done, total_frames) as model.transcribe on this thread seeks."""
+    install()
+    previous = getattr(_local, "callback", None)
+    _local.callback = callback
+    try:
+        yield
+    finally:
+        _local.callback = previous
+
+
+class ProgressTracker:
+    """Aggregates decoder seek positions across windows into progress, ETA and RTF.
+
+    Must be updated from the event loop thread; windows are keyed by their start sample.
+    """
+
+    def __init__(
+        self,
+        total_samples: int,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+    ):
+        self._total_frames = max(1, total_samples // HOP_LENGTH)
+        self._done: dict[int, int] = {}
+        self._on_progress = on_progress
+        self._on_metrics = on_metrics
+        self._started = time.monotonic()
+
+    def update(self, window: int, frames_done: int) -> None:
+        self._done[window] = frames_done
+        done = min(sum(self._done.values()), self._total_frames)
+
+        progress = DecodeProgress(
+            percent=done / self._total_frames * 100,
+            audio_seconds_done=done * HOP_LENGTH / SAMPLE_RATE,
+            audio_seconds_total=self._total_frames * HOP_LENGTH / SAMPLE_RATE,
+            elapsed_seconds=time.monotonic() - self._started,
+        )
+        if self._on_progress:
+            self._on_progress(progress.percent)
+        if self._on_metrics:
+            self._on_metrics(progress)
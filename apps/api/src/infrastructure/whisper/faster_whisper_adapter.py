@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Optional
+
+import numpy as np
+from faster_whisper import WhisperModel
+
+from src.application.ports.inference_scheduler import InferenceSlot
+from src.application.ports.whisper_service import (
+    AudioSource,
+    DecodeProgress,
+    LanguageDetection,
+    WhisperResult,
+    WhisperService,
+)
+from src.domain.entities import TranscriptionSegment
+from src.infrastructure.whisper.audio_loader import load_audio
+from src.infrastructure.whisper.decode_progress import HOP_LENGTH, ProgressTracker
+from src.infrastructure.whisper.long_form import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+_DETECT_SECONDS = 30
+_SIZE_ORDER = ("tiny", "base", "small", "medium", "large", "turbo")
+_STREAM_DONE = object()
+
+# openai-whisper's model.transcribe defaults, so both backends decode the same way:
+# greedy search with temperature fallback, conditioned on the previous window's text.
+# openai leaves best_of unset, which draws one sample per fallback temperature; faster-whisper
+# needs an integer for that.
+_DECODE_OPTIONS = {
+    "beam_size": 1,
+    "best_of": 1,
+    "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+    "condition_on_previous_text": True,
+    "compression_ratio_threshold": 2.4,
+    "log_prob_threshold": -1.0,
+    "no_speech_threshold": 0.6,
+    "vad_filter": False,
+}
+
+
+def _size_rank(model_size: str) -> int:
+    name = model_size.split(".")[0].split("-")[0]
+    return _SIZE_ORDER.index(name) if name in _SIZE_ORDER else len(_SIZE_ORDER)
+
+
+def _ct2_device(device: str) -> tuple[str, int]:
+    """Maps "cuda:1" to CTranslate2's ("cuda", 1); everything else runs on the CPU."""
+    if device.startswith("cuda"):
+        _, _, index = device.partition(":")
+        return "cuda", int(index or 0)
+    return "cpu", 0
+
+
+class FasterWhisperAdapter(WhisperService):
+    """Runs Whisper on CTranslate2 through faster-whisper, with int8 weights by default.
+
+    Produces the same WhisperResults as WhisperAdapter. Each model is loaded once per
+    device and shared by all slots: CTranslate2 runs up to `workers` transcriptions on one
+    model concurrently, each on `cpu_threads` threads. Apple MPS is not supported, so it
+    falls back to the CPU.
+    """
+
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = "cpu",
+        compute_type: str = "int8",
+        workers: int = 2,
+        cpu_threads: int = 0,
+        download_root: Optional[str] = None,
+        detect_model_size: str = "tiny",
+    ):
+        self._model_size = model_size
+        self._device = device if device.startswith("cuda") else "cpu"
+        self._compute_type = compute_type
+        self._workers = max(workers, 1)
+        self._cpu_threads = cpu_threads
+        self._download_root = download_root
+        self._detect_model_size = detect_model_size
+        self._models: dict[tuple[str, str, int], WhisperModel] = {}
+        self._models_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="faster-whisper"
+        )
+        self._detect_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="faster-whisper-detect"
+        )
+
+    def get_device(self) -> str:
+        return self._device
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._detect_executor.shutdown(wait=False)
+
+    def _model(self, model_size: str, device: str) -> WhisperModel:
+        """Loads the model on first use. Blocking: call off the event loop."""
+        ct2_device, device_index = _ct2_device(device)
+        key = (model_size, ct2_device, device_index)
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is None:
+                logger.info(
+                    f"Loading faster-whisper model '{model_size}' "
+                    f"({self._compute_type}) on {ct2_device}:{device_index}"
+                )
+                model = self._models[key] = WhisperModel(
+                    model_size,
+                    device=ct2_device,
+                    device_index=device_index,
+                    compute_type=self._compute_type,
+                    cpu_threads=self._cpu_threads,
+                    num_workers=self._workers,
+                    download_root=self._download_root,
+                )
+            return model
+
+    def _smallest_loaded(self) -> Optional[WhisperModel]:
+        """The smallest multilingual model already loaded on the default device, if any."""
+        device = _ct2_device(self._device)
+        with self._models_lock:
+            loaded = [
+                (_size_rank(size), model)
+                for (size, *model_device), model in self._models.items()
+                if tuple(model_device) == device and not size.endswith(".en")
+            ]
+        return min(loaded, key=lambda item: item[0])[1] if loaded else None
+
+    async def detect_language(self, audio: AudioSource) -> LanguageDetection:
+        loop = asyncio.get_running_loop()
+
+        def run_detection() -> LanguageDetection:
+            samples = load_audio(audio, max_seconds=_DETECT_SECONDS)
+            model = self._smallest_loaded() or self._model(self._detect_model_size, self._device)
+            # transcribe detects the language up front; its segments are decoded lazily,
+            # so nothing beyond detection runs when they are never read
+            _, info = model.transcribe(samples, beam_size=1, vad_filter=False)
+            return LanguageDetection(
+                language=info.language, probability=info.language_probability
+            )
+
+        return await loop.run_in_executor(self._detect_executor, run_detection)
+
+    async def transcribe(
+        self,
+        audio: AudioSource,
+        language: Optional[str] = None,
+        model_size: Optional[str] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+        slot: Optional[InferenceSlot] = None,
+    ) -> WhisperResult:
+        detected = language or "unknown"
+
+        def on_language(value: str) -> None:
+            nonlocal detected
+            detected = value
+
+        segments = [
+            segment
+            async for segment in self.transcribe_stream(
+                audio,
+                language=language,
+                model_size=model_size,
+                on_progress=on_progress,
+                on_language=on_language,
+                on_metrics=on_metrics,
+                slot=slot,
+            )
+        ]
+        return WhisperResult(
+            text=" ".join(segment.text for segment in segments),
+            segments=segments,
+            language=detected,
+        )
+
+    async def transcribe_stream(
+        self,
+        audio: AudioSource,
+        language: Optional[str] = None,
+        model_size: Optional[str] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_language: Optional[Callable[[str], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+        slot: Optional[InferenceSlot] = None,
+    ) -> AsyncIterator[TranscriptionSegment]:
+        model_size = model_size or self._model_size
+        loop = asyncio.get_running_loop()
+        samples: np.ndarray = await loop.run_in_executor(self._executor, load_audio, audio)
+        if not samples.shape[0]:
+            return
+
+        tracker = ProgressTracker(samples.shape[0], on_progress, on_metrics)
+        decoded: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def emit(item) -> None:
+            loop.call_soon_threadsafe(decoded.put_nowait, item)
+
+        def decode() -> None:
+            try:
+                model = self._model(model_size, slot.device if slot else self._device)
+                options = dict(_DECODE_OPTIONS)
+                if language and language != "auto":
+                    options["language"] = language
+                segments, info = model.transcribe(samples, **options)
+                emit(("language", info.language))
+                # The generator decodes one 30 s window at a time as it is consumed
+                for segment in segments:
+                    if stop.is_set():
+                        return
+                    emit(("segment", segment))
+            except Exception as e:
+                emit(("error", e))
+            finally:
+                emit(_STREAM_DONE)
+
+        loop.run_in_executor(self._executor, decode)
+        segment_id = 0
+        try:
+            while (item := await decoded.get()) is not _STREAM_DONE:
+                kind, value = item
+                if kind == "error":
+                    raise value
+                if kind == "language":
+                    if on_language:
+                        on_language(value)
+                    continue
+
+                tracker.update(0, int(value.end * SAMPLE_RATE / HOP_LENGTH))
+                text = value.text.strip()
+                if not text:
+                    continue
+                yield TranscriptionSegment(
+                    id=segment_id,
+                    start=value.start,
+                    end=value.end,
+                    text=text,
+                    confidence=value.avg_logprob,
+                )
+                segment_id += 1
+        finally:
+            stop.set()
+        tracker.update(0, samples.shape[0] // HOP_LENGTH)
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import torch
+
+from src.application.ports.inference_scheduler import InferenceScheduler, InferenceSlot
+
+logger = logging.getLogger(__name__)
+
+
+def detect_device() -> str:
+    if torch.cuda.is_available():
+        return "cuda"
+    elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _threads_per_slot(slots: int) -> int:
+    return max(1, (os.cpu_count() or 1) // slots)
+
+
+def plan_slots(
+    device: str, cpu_slots: int, cuda_slot_mb: int, max_slots_per_gpu: int
+) -> list[InferenceSlot]:
+    """Decides how many transcriptions each device may run at once.
+
+    CPU gets cpu_slots slots sharing the cores evenly. Each CUDA device gets one slot
+    per cuda_slot_mb of memory free at startup (at least one, at most max_slots_per_gpu).
+    MPS gets a single slot: concurrent MPS decoding crashes.
+    """
+    if device == "mps":
+        return [InferenceSlot("mps", 0, _threads_per_slot(1))]
+
+    if device == "cuda":
+        per_device = []
+        for i in range(torch.cuda.device_count()):
+            free_bytes, _ = torch.cuda.mem_get_info(i)
+            count = free_bytes // (cuda_slot_mb * 1024 * 1024)
+            per_device.append((f"cuda:{i}", max(1, min(max_slots_per_gpu, count))))
+        threads = _threads_per_slot(sum(count for _, count in per_device))
+        # Interleaved so consecutive jobs spread across GPUs before doubling up on one
+        return [
+            InferenceSlot(name, index, threads)
+            for index in range(max(count for _, count in per_device))
+            for name, count in per_device
+            if index < count
+        ]
+
+    slots = max(1, cpu_slots)
+    return [InferenceSlot("cpu", i, _threads_per_slot(slots)) for i in range(slots)]
+
+
+def pool_slots(device: str, workers: int) -> list[InferenceSlot]:
+    """One slot per worker process; each worker already limits its own threads."""
+    return [InferenceSlot(device, i, _threads_per_slot(workers)) for i in range(workers)]
+
+
+class DeviceInferenceScheduler(InferenceScheduler):
+    """Hands out a fixed set of device slots first-come, first-served."""
+
+    def __init__(self, slots: list[InferenceSlot]):
+        self.slots = slots
+        self._free: asyncio.Queue[InferenceSlot] = asyncio.Queue()
+        for slot in slots:
+            self._free.put_nowait(slot)
+        logger.info(
+            "Inference slots: "
+            + ", ".join(f"{s.device}#{s.index} ({s.num_threads} threads)" for s in slots)
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[InferenceSlot]:
+        slot = await self._free.get()
+        try:
+            yield slot
+        finally:
+            self._free.put_nowait(slot)
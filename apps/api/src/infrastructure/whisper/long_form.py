@@ -0,0 +1,87 @@
+from typing import Optional
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+_FRAME_SECONDS = 0.1
+
+
+def plan_windows(
+    audio: np.ndarray,
+    window_seconds: float,
+    overlap_seconds: float,
+    search_seconds: float = 10.0,
+) -> list[tuple[int, int]]:
+    """Splits audio into (start, end) sample ranges that end on the quietest nearby frame.
+
+    Each window ends at the lowest-energy frame within the last search_seconds before the
+    nominal window length, so cuts land in pauses instead of mid-word. Consecutive windows
+    overlap by overlap_seconds to give stitching some shared context.
+    """
+    total = audio.shape[0]
+    window = int(window_seconds * SAMPLE_RATE)
+    overlap = int(overlap_seconds * SAMPLE_RATE)
+    search = min(int(search_seconds * SAMPLE_RATE), window // 2)
+    frame = int(_FRAME_SECONDS * SAMPLE_RATE)
+
+    windows: list[tuple[int, int]] = []
+    start = 0
+    while start < total:
+        nominal_end = start + window
+        if nominal_end >= total:
+            windows.append((start, total))
+            break
+
+        region = audio[nominal_end - search : nominal_end]
+        usable = (region.shape[0] // frame) * frame
+        energy = np.sqrt(np.mean(region[:usable].reshape(-1, frame) ** 2, axis=1))
+        cut = nominal_end - search + int(np.argmin(energy)) * frame + frame // 2
+
+        windows.append((start, cut))
+        start = max(cut - overlap, start + 1)
+
+    return windows
+
+
+class WindowStitcher:
+    """Merges per-window Whisper segments into one timeline, one window at a time, in order.
+
+    Segment times are shifted by their window offset. Inside each overlap, the earlier
+    window owns segments that start before the overlap midpoint and the later window owns
+    the rest, so speech in the shared region is emitted exactly once.
+    """
+
+    def __init__(self, windows: list[tuple[int, int]]):
+        self._windows = windows
+        self._last: Optional[dict] = None
+
+    def add(self, index: int, segments: list[dict]) -> list[dict]:
+        windows = self._windows
+        offset = windows[index][0] / SAMPLE_RATE
+        lower = _overlap_midpoint(windows[index - 1], windows[index]) if index > 0 else None
+        upper = (
+            _overlap_midpoint(windows[index], windows[index + 1])
+            if index + 1 < len(windows)
+            else None
+        )
+
+        merged: list[dict] = []
+        for seg in segments:
+            seg_start = seg["start"] + offset
+            if lower is not None and seg_start < lower:
+                continue
+            if upper is not None and seg_start >= upper:
+                continue
+            last = self._last
+            if last and seg["text"].strip() == last["text"].strip():
+                if seg_start - last["end"] < 1.0:
+                    continue
+            seg_start = max(seg_start, last["end"] if last else 0.0)
+            self._last = {**seg, "start": seg_start, "end": max(seg["end"] + offset, seg_start)}
+            merged.append(self._last)
+        return merged
+
+
+def _overlap_midpoint(previous: tuple[int, int], following: tuple[int, int]) -> float:
+    return (following[0] + previous[1]) / 2 / SAMPLE_RATE
@@ -0,0 +1,169 @@
+import gc
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import torch
+import whisper
+
+logger = logging.getLogger(__name__)
+
+# Approximate resident size (fp32 weights) used to plan evictions before a model is loaded.
+# Once loaded, the real parameter footprint replaces the estimate.
+_ESTIMATED_MODEL_MB = {
+    "tiny": 150,
+    "base": 290,
+    "small": 970,
+    "medium": 3060,
+    "large": 6170,
+    "turbo": 3240,
+}
+
+
+def _estimate_mb(model_size: str) -> int:
+    name = model_size.split(".")[0].split("-")[0]
+    return _ESTIMATED_MODEL_MB.get(name, _ESTIMATED_MODEL_MB["large"])
+
+
+def _measure_mb(model: whisper.Whisper) -> int:
+    total = sum(p.numel() * p.element_size() for p in model.parameters())
+    total += sum(b.numel() * b.element_size() for b in model.buffers())
+    return max(1, total // (1024 * 1024))
+
+
+class _Entry:
+    def __init__(self, model: whisper.Whisper, size_mb: int):
+        self.model = model
+        self.size_mb = size_mb
+        self.in_use = 0
+        # openai-whisper installs kv-cache hooks on the shared modules for every decode,
+        # so one model instance can only run one transcription at a time.
+        self.decode_lock = threading.Lock()
+
+
+class WhisperModelRegistry:
+    """Loads Whisper models on demand and keeps the hot ones resident.
+
+    Models are evicted least-recently-used first once the resident set would exceed
+    the memory budget. Models currently running a transcription are never evicted.
+    Replicas of the same model are separate instances, so they can decode concurrently.
+    """
+
+    def __init__(self, device: str, memory_budget_mb: int):
+        self._device = device
+        self._budget_mb = memory_budget_mb
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+
+    @property
+    def resident_models(self) -> list[str]:
+        with self._lock:
+            return list(self._entries.keys())
+
+    @property
+    def resident_mb(self) -> int:
+        with self._lock:
+            return sum(entry.size_mb for entry in self._entries.values())
+
+    @contextmanager
+    def acquire(self, model_size: str, replica: int = 0) -> Iterator[whisper.Whisper]:
+        """Yields the requested model, loading it if needed. Blocking: call off the event loop."""
+        entry = self._checkout(model_size, replica)
+        try:
+            with entry.decode_lock:
+                yield entry.model
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+
+    @contextmanager
+    def acquire_smallest(self, fallback_model_size: str) -> Iterator[whisper.Whisper]:
+        """Yields the smallest idle multilingual model already loaded, else fallback_model_size.
+
+        For short jobs any model can do, such as language detection, so they neither load
+        another model nor wait behind a running transcription.
+        """
+        with self._lock:
+            idle = [
+                (entry.size_mb, key)
+                for key, entry in self._entries.items()
+                if not entry.in_use and entry.model.is_multilingual
+            ]
+            entry = self._hit(min(idle)[1]) if idle else None
+        if entry is None:
+            entry = self._checkout(fallback_model_size, 0)
+        try:
+            with entry.decode_lock:
+                yield entry.model
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+
+    def _checkout(self, model_size: str, replica: int) -> _Entry:
+        if model_size not in whisper.available_models():
+            raise ValueError(f"Unknown Whisper model: {model_size}")
+        key = model_size if replica == 0 else f"{model_size}#{replica}"
+
+        with self._lock:
+            entry = self._hit(key)
+            if entry:
+                return entry
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # One loader per model instance; concurrent requests for it wait for the load.
+        with load_lock:
+            with self._lock:
+                entry = self._hit(key)
+                if entry:
+                    return entry
+                self._evict_for(_estimate_mb(model_size))
+
+            logger.info(f"Loading Whisper model '{key}' on {self._device}")
+            model = whisper.load_model(model_size, device=self._device)
+
+            with self._lock:
+                entry = _Entry(model, _measure_mb(model))
+                entry.in_use += 1
+                self._entries[key] = entry
+                self._evict_for(0)
+                return entry
+
+    def _hit(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry:
+            self._entries.move_to_end(key)
+            entry.in_use += 1
+        return entry
+
+    def _evict_for(self, incoming_mb: int) -> None:
+        """Evicts idle models, oldest first, until incoming_mb fits in the budget."""
+        resident = sum(entry.size_mb for entry in self._entries.values())
+        evicted = False
+        for name in list(self._entries.keys()):
+            if resident + incoming_mb <= self._budget_mb:
+                break
+            entry = self._entries[name]
+            if entry.in_use:
+                continue
+            del self._entries[name]
+            resident -= entry.size_mb
+            evicted = True
+            logger.info(f"Evicted Whisper model '{name}' ({entry.size_mb} MB)")
+
+        if evicted:
+            self._release_memory()
+        if resident + incoming_mb > self._budget_mb:
+            logger.warning(
+                f"Whisper models in use exceed the memory budget "
+                f"({resident + incoming_mb} MB > {self._budget_mb} MB)"
+            )
+
+    def _release_memory(self) -> None:
+        gc.collect()
+        if self._device.startswith("cuda"):
+            torch.cuda.empty_cache()
+        elif self._device == "mps" and hasattr(torch, "mps"):
+            torch.mps.empty_cache()
@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# IPC messages are plain tuples so the pipe only ever carries a few hundred bytes per job;
+# the audio itself travels through shared memory.
+#   parent -> worker: (shm_name, num_samples, model_size, options) or None to stop
+#   worker -> parent: ("progress", frames_done, total_frames) while decoding, then
+#                     ("ok", text, language, [(start, end, text, avg_logprob), ...])
+#                     or ("error", message)
+
+
+def _run_job(
+    conn: Connection,
+    registry,
+    shm: SharedMemory,
+    num_samples: int,
+    model_size: str,
+    options: dict,
+):
+    from src.infrastructure.whisper.decode_progress import report_frames
+
+    def report(frames_done: int, total_frames: int) -> None:
+        conn.send(("progress", frames_done, total_frames))
+
+    audio = np.ndarray((num_samples,), dtype=np.float32, buffer=shm.buf)
+    with report_frames(report), registry.acquire(model_size) as model:
+        result = model.transcribe(audio, **options)
+    segments = [
+        (seg["start"], seg["end"], seg["text"], seg.get("avg_logprob", 0))
+        for seg in result["segments"]
+    ]
+    return ("ok", result["text"], result.get("language", "unknown"), segments)
+
+
+def _worker_main(
+    conn: Connection,
+    model_size: str,
+    device: str,
+    memory_budget_mb: int,
+    num_threads: int,
+) -> None:
+    import torch
+
+    from src.infrastructure.whisper.model_registry import WhisperModelRegistry
+
+    torch.set_num_threads(num_threads)
+    registry = WhisperModelRegistry(device, memory_budget_mb)
+    with registry.acquire(model_size):
+        pass
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+
+        shm_name, num_samples, job_model_size, options = message
+        shm = SharedMemory(name=shm_name)
+        try:
+            reply = _run_job(conn, registry, shm, num_samples, job_model_size, options)
+        except Exception as e:
+            reply = ("error", str(e))
+        finally:
+            shm.close()
+        conn.send(reply)
+
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, process: multiprocessing.Process, conn: Connection):
+        self.process = process
+        self.conn = conn
+
+
+class WhisperProcessPool:
+    """Long-lived worker processes that each keep their own Whisper models resident.
+
+    Inference runs outside the API process, so decoding never contends with the event
+    loop for the GIL and several CPU transcriptions can run side by side.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        model_size: str,
+        device: str,
+        memory_budget_mb: int,
+    ):
+        self._size = max(1, workers)
+        self._model_size = model_size
+        self._device = device
+        # Every process keeps its own models: the budget and the cores are split between them
+        self._memory_budget_mb = max(1, memory_budget_mb // self._size)
+        self._num_threads = max(1, (os.cpu_count() or 1) // self._size)
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: Optional[asyncio.Queue[_Worker]] = None
+        self._workers: list[_Worker] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._size, thread_name_prefix="whisper-ipc"
+        )
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                self._model_size,
+                self._device,
+                self._memory_budget_mb,
+                self._num_threads,
+            ),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self._workers.append(worker)
+        return worker
+
+    async def _ensure_started(self) -> asyncio.Queue[_Worker]:
+        async with self._start_lock:
+            if self._idle is None:
+                idle: asyncio.Queue[_Worker] = asyncio.Queue()
+                for _ in range(self._size):
+                    idle.put_nowait(self._spawn())
+                logger.info(f"Started {self._size} Whisper worker processes on {self._device}")
+                self._idle = idle
+        return self._idle
+
+    async def transcribe(
+        self,
+        audio: np.ndarray,
+        model_size: str,
+        options: dict,
+        on_frames: Optional[Callable[[int, int], None]] = None,
+    ) -> dict:
+        """Decodes audio on an idle worker. on_frames is called from an IPC thread."""
+        idle = await self._ensure_started()
+        worker = await idle.get()
+
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        shm = SharedMemory(create=True, size=max(audio.nbytes, 1))
+        np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+
+        def roundtrip():
+            worker.conn.send((shm.name, audio.shape[0], model_size, options))
+            while True:
+                reply = worker.conn.recv()
+                if reply[0] != "progress":
+                    return reply
+                if on_frames:
+                    on_frames(reply[1], reply[2])
+
+        def release(_=None) -> None:
+            nonlocal worker
+            shm.close()
+            shm.unlink()
+            if not worker.process.is_alive():
+                self._workers.remove(worker)
+                worker = self._spawn()
+            idle.put_nowait(worker)
+
+        future = asyncio.get_running_loop().run_in_executor(self._executor, roundtrip)
+        try:
+            reply = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The worker is still busy with this job; hand it back only once it replies.
+            future.add_done_callback(release)
+            raise
+        except (EOFError, OSError) as e:
+            logger.error(f"Whisper worker {worker.process.pid} died: {e}")
+            worker.process.join(timeout=1)
+            release()
+            raise RuntimeError("Whisper worker process crashed") from e
+        release()
+
+        if reply[0] == "error":
+            raise RuntimeError(reply[1])
+
+        _, text, language, segments = reply
+        return {
+            "text": text,
+            "language": language,
+            "segments": [
+                {"start": start, "end": end, "text": seg_text, "avg_logprob": avg_logprob}
+                for start, end, seg_text, avg_logprob in segments
+            ],
+        }
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+        self._workers.clear()
+        self._idle = None
+        self._executor.shutdown(wait=False)
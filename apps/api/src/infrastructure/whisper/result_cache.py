@@ -0,0 +1,280 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional
+
+from src.application.ports.inference_scheduler import InferenceSlot
+from src.application.ports.whisper_service import (
+    AudioSource,
+    DecodeProgress,
+    LanguageDetection,
+    WhisperResult,
+    WhisperService,
+)
+from src.domain.entities import TranscriptionSegment
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_TASK = "transcribe"
+_MAX_DETECTIONS = 4096
+_MAX_KNOWN_HASHES = 4096
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_audio(audio: AudioSource) -> str:
+    if isinstance(audio, str):
+        return hash_file(audio)
+    return hashlib.sha256(audio).hexdigest()
+
+
+def _serialize(result: WhisperResult) -> bytes:
+    return json.dumps(
+        {
+            "text": result.text,
+            "language": result.language,
+            "segments": [
+                [seg.id, seg.start, seg.end, seg.text, seg.confidence] for seg in result.segments
+            ],
+        },
+        ensure_ascii=False,
+    ).encode()
+
+
+def _deserialize(data: bytes) -> WhisperResult:
+    payload = json.loads(data)
+    return WhisperResult(
+        text=payload["text"],
+        language=payload["language"],
+        segments=[
+            TranscriptionSegment(id=seg_id, start=start, end=end, text=text, confidence=confidence)
+            for seg_id, start, end, text, confidence in payload["segments"]
+        ],
+    )
+
+
+class WhisperResultCache:
+    """Content-addressed WhisperResult store on disk, bounded by total size (LRU).
+
+    File modification times record recency, so the eviction order survives restarts.
+    All methods block on disk I/O and should run off the event loop.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self._dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        files = sorted(self._dir.glob("*/*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            size = path.stat().st_size
+            self._entries[path.stem] = size
+            self._total_bytes += size
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    @staticmethod
+    def make_key(content_hash: str, model_size: str, language: Optional[str]) -> str:
+        raw = f"{content_hash}:{model_size}:{language or 'auto'}:{_TASK}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[WhisperResult]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._total_bytes -= self._entries.pop(key, 0)
+            return None
+        return _deserialize(data)
+
+    def put(self, key: str, result: WhisperResult) -> None:
+        data = _serialize(result)
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total_bytes += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            evicted = []
+            while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+                old_key, size = self._entries.popitem(last=False)
+                self._total_bytes -= size
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            self._path(old_key).unlink(missing_ok=True)
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} cached transcriptions")
+
+
+class CachedWhisperService(WhisperService):
+    """Serves repeat transcriptions of identical audio from a WhisperResultCache.
+
+    Detected languages are kept in memory by content hash.
+    """
+
+    def __init__(self, inner: WhisperService, cache: WhisperResultCache, default_model_size: str):
+        self._inner = inner
+        self._cache = cache
+        self._default_model_size = default_model_size
+        self._detections: OrderedDict[str, LanguageDetection] = OrderedDict()
+        # (device, inode) -> (size, mtime, hash), so hard links to a known file reuse its hash
+        self._known_hashes: OrderedDict[tuple[int, int], tuple[int, int, str]] = OrderedDict()
+
+    def get_device(self) -> str:
+        return self._inner.get_device()
+
+    def remember_hash(self, path: str, content_hash: str) -> None:
+        """Records a hash computed elsewhere (e.g. while receiving an upload) to skip re-reading."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        self._known_hashes[file_id] = (stat.st_size, stat.st_mtime_ns, content_hash)
+        self._known_hashes.move_to_end(file_id)
+        if len(self._known_hashes) > _MAX_KNOWN_HASHES:
+            self._known_hashes.popitem(last=False)
+
+    async def _hash(self, audio: AudioSource) -> str:
+        if isinstance(audio, str):
+            stat = os.stat(audio)
+            known = self._known_hashes.get((stat.st_dev, stat.st_ino))
+            if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+                return known[2]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, hash_audio, audio)
+
+    async def _key(self, audio: AudioSource, language: Optional[str], model_size: Optional[str]):
+        content_hash = await self._hash(audio)
+        return self._cache.make_key(content_hash, model_size or self._default_model_size, language)
+
+    async def _lookup(self, key: str) -> Optional[WhisperResult]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._cache.get, key)
+
+    async def _store(self, key: str, result: WhisperResult) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._cache.put, key, result)
+        except OSError as e:
+            logger.warning(f"Could not cache transcription result: {e}")
+
+    async def detect_language(self, audio: AudioSource) -> LanguageDetection:
+        content_hash = await self._hash(audio)
+        detection = self._detections.get(content_hash)
+        if detection:
+            self._detections.move_to_end(content_hash)
+            return detection
+
+        detection = await self._inner.detect_language(audio)
+        self._detections[content_hash] = detection
+        if len(self._detections) > _MAX_DETECTIONS:
+            self._detections.popitem(last=False)
+        return detection
+
+    async def transcribe(
+        self,
+        audio: AudioSource,
+        language: Optional[str] = None,
+        model_size: Optional[str] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+        slot: Optional[InferenceSlot] = None,
+    ) -> WhisperResult:
+        key = await self._key(audio, language, model_size)
+        cached = await self._lookup(key)
+        if cached:
+            if on_progress:
+                on_progress(100)
+            return cached
+
+        result = await self._inner.transcribe(
+            audio,
+            language=language,
+            model_size=model_size,
+            on_progress=on_progress,
+            on_metrics=on_metrics,
+            slot=slot,
+        )
+        await self._store(key, result)
+        return result
+
+    async def transcribe_stream(
+        self,
+        audio: AudioSource,
+        language: Optional[str] = None,
+        model_size: Optional[str] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_language: Optional[Callable[[str], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+        slot: Optional[InferenceSlot] = None,
+    ) -> AsyncIterator[TranscriptionSegment]:
+        key = await self._key(audio, language, model_size)
+        cached = await self._lookup(key)
+        if cached:
+            if on_language:
+                on_language(cached.language)
+            for segment in cached.segments:
+                yield segment
+            if on_progress:
+                on_progress(100)
+            return
+
+        detected_language = language or "unknown"
+
+        def capture_language(value: str) -> None:
+            nonlocal detected_language
+            detected_language = value
+            if on_language:
+                on_language(value)
+
+        segments: list[TranscriptionSegment] = []
+        async for segment in self._inner.transcribe_stream(
+            audio,
+            language=language,
+            model_size=model_size,
+            on_progress=on_progress,
+            on_language=capture_language,
+            on_metrics=on_metrics,
+            slot=slot,
+        ):
+            segments.append(segment)
+            yield segment
+
+        await self._store(
+            key,
+            WhisperResult(
+                text=" ".join(segment.text for segment in segments),
+                segments=segments,
+                language=detected_language,
+            ),
+        )
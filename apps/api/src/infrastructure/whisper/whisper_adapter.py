@@ -1,76 +1,224 @@
 import asyncio
 import threading
-from typing import Callable, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Optional
 
+import numpy as np
 import torch
 import whisper
 
-from src.application.ports.whisper_service import WhisperResult, WhisperService
+from src.application.ports.inference_scheduler import InferenceSlot
+from src.application.ports.whisper_service import (
+    AudioSource,
+    DecodeProgress,
+    LanguageDetection,
+    WhisperResult,
+    WhisperService,
+)
 from src.domain.entities import TranscriptionSegment
+from src.infrastructure.whisper.audio_loader import load_audio
+from src.infrastructure.whisper.decode_progress import ProgressTracker, report_frames
+from src.infrastructure.whisper.inference_scheduler import detect_device
+from src.infrastructure.whisper.long_form import SAMPLE_RATE, WindowStitcher, plan_windows
+from src.infrastructure.whisper.model_registry import WhisperModelRegistry
+from src.infrastructure.whisper.process_pool import WhisperProcessPool
+
+# Whisper identifies the language from a single 30 s window
+_DETECT_SECONDS = 30
 
 
 class WhisperAdapter(WhisperService):
-    def __init__(self, model_size: str = "base"):
-        self._model_size = model_size
-        self._model: Optional[whisper.Whisper] = None
-        self._device = self._detect_device()
+    def __init__(
+        self,
+        model_size: str = "base",
+        memory_budget_mb: int = 4096,
+        inference_mode: str = "thread",
+        workers: int = 2,
+        long_form_min_seconds: float = 600,
+        chunk_seconds: float = 300,
+        chunk_overlap_seconds: float = 2,
+        long_form_max_parallel: int = 2,
+        stream_window_seconds: float = 30,
+        detect_model_size: str = "tiny",
+    ):
+        if inference_mode not in ("thread", "process"):
+            raise ValueError(f"Unknown inference mode: {inference_mode}")
 
-    def _detect_device(self) -> str:
-        if torch.cuda.is_available():
-            return "cuda"
-        elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-            return "mps"
-        return "cpu"
+        self._model_size = model_size
+        self._device = detect_device()
+        self._memory_budget_mb = memory_budget_mb
+        # One registry per device; slots on the same device use separate model replicas
+        self._registries: dict[str, WhisperModelRegistry] = {}
+        self._registries_lock = threading.Lock()
+        # Dedicated executor so decoding never queues behind yt-dlp in the default pool
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whisper")
+        self._pool = (
+            WhisperProcessPool(workers, model_size, self._device, memory_budget_mb)
+            if inference_mode == "process"
+            else None
+        )
+        self._long_form_min_seconds = long_form_min_seconds
+        self._chunk_seconds = chunk_seconds
+        self._chunk_overlap_seconds = chunk_overlap_seconds
+        self._long_form_max_parallel = max(1, min(long_form_max_parallel, workers))
+        self._stream_window_seconds = stream_window_seconds
+        self._detect_model_size = detect_model_size
+        # Detection runs before a job takes an inference slot, so it must not queue behind decoding
+        self._detect_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whisper-detect"
+        )
 
-    def _load_model(self) -> whisper.Whisper:
-        if self._model is None:
-            self._model = whisper.load_model(self._model_size, device=self._device)
-        return self._model
+    def _registry(self, device: str) -> WhisperModelRegistry:
+        with self._registries_lock:
+            if device not in self._registries:
+                self._registries[device] = WhisperModelRegistry(device, self._memory_budget_mb)
+            return self._registries[device]
 
     def get_device(self) -> str:
         return self._device
 
-    async def transcribe(
+    def close(self) -> None:
+        if self._pool:
+            self._pool.shutdown()
+        self._executor.shutdown(wait=False)
+        self._detect_executor.shutdown(wait=False)
+
+    async def _infer(
         self,
-        audio_path: str,
-        language: Optional[str] = None,
+        audio: np.ndarray,
+        model_size: str,
+        options: dict,
+        on_frames: Optional[Callable[[int], None]] = None,
+        slot: Optional[InferenceSlot] = None,
+    ) -> dict:
+        """Runs one model.transcribe call; on_frames receives the decoder's seek position."""
+        loop = asyncio.get_running_loop()
+
+        def report(frames_done: int, _total: int) -> None:
+            loop.call_soon_threadsafe(on_frames, frames_done)
+
+        if self._pool:
+            return await self._pool.transcribe(
+                audio, model_size, options, on_frames=report if on_frames else None
+            )
+
+        device = slot.device if slot else self._device
+        replica = slot.index if slot else 0
+
+        def run_transcription():
+            if slot:
+                # Intra-op threads are set per decoding thread so concurrent slots share cores
+                torch.set_num_threads(slot.num_threads)
+            with report_frames(report if on_frames else None):
+                with self._registry(device).acquire(model_size, replica) as model:
+                    return model.transcribe(audio, **options)
+
+        return await loop.run_in_executor(self._executor, run_transcription)
+
+    def _is_long_form(self, samples: np.ndarray) -> bool:
+        # Windows only run in parallel across worker processes, each with its own model
+        return self._pool is not None and (
+            samples.shape[0] >= self._long_form_min_seconds * SAMPLE_RATE
+        )
+
+    async def _decode_long_form(
+        self,
+        samples: np.ndarray,
+        model_size: str,
+        options: dict,
         on_progress: Optional[Callable[[float], None]] = None,
-    ) -> WhisperResult:
-        model = self._load_model()
+        on_language: Optional[Callable[[str], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+    ) -> AsyncIterator[dict]:
+        """Decodes overlapping silence-bounded windows in parallel; yields stitched segments.
 
-        loop = asyncio.get_event_loop()
-        done_event = threading.Event()
+        At most long_form_max_parallel windows of one job decode at once, so a long file
+        never takes over the whole worker pool. Segments are yielded in timeline order.
+        """
+        windows = plan_windows(samples, self._chunk_seconds, self._chunk_overlap_seconds)
+        tracker = ProgressTracker(
+            sum(end - start for start, end in windows), on_progress, on_metrics
+        )
+        stitcher = WindowStitcher(windows)
 
-        if on_progress:
-            on_progress(5)
+        def infer_window(index: int, window_options: dict):
+            start, end = windows[index]
+            return self._infer(
+                samples[start:end],
+                model_size,
+                window_options,
+                on_frames=lambda frames: tracker.update(start, frames),
+            )
 
-        async def simulate_progress() -> None:
-            """Increment progress smoothly while transcription runs."""
-            current = 5.0
-            while not done_event.is_set() and current < 90:
-                current = min(current + 2, 90)
-                if on_progress:
-                    on_progress(current)
-                await asyncio.sleep(1)
+        # The first window fixes the language so every window decodes consistently
+        first = await infer_window(0, options)
+        options = {**options, "language": options.get("language") or first.get("language")}
+        if on_language:
+            on_language(options["language"] or "unknown")
+        for seg in stitcher.add(0, first["segments"]):
+            yield seg
 
-        progress_task = asyncio.ensure_future(simulate_progress()) if on_progress else None
+        pending: deque[asyncio.Future] = deque()
+        next_index = 1
+        try:
+            while next_index < len(windows) or pending:
+                while next_index < len(windows) and len(pending) < self._long_form_max_parallel:
+                    pending.append(asyncio.ensure_future(infer_window(next_index, options)))
+                    next_index += 1
+                index = next_index - len(pending)
+                result = await pending.popleft()
+                for seg in stitcher.add(index, result["segments"]):
+                    yield seg
+        finally:
+            for task in pending:
+                task.cancel()
 
-        def run_transcription():
-            try:
-                options: dict = {"verbose": False}
-                if language and language != "auto":
-                    options["language"] = language
-                return model.transcribe(audio_path, **options)
-            finally:
-                done_event.set()
+    async def transcribe(
+        self,
+        audio: AudioSource,
+        language: Optional[str] = None,
+        model_size: Optional[str] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+        slot: Optional[InferenceSlot] = None,
+    ) -> WhisperResult:
+        model_size = model_size or self._model_size
+        loop = asyncio.get_running_loop()
+
+        options: dict = {"verbose": False}
+        if language and language != "auto":
+            options["language"] = language
+
+        samples = await loop.run_in_executor(self._executor, load_audio, audio)
 
-        result = await loop.run_in_executor(None, run_transcription)
+        if self._is_long_form(samples):
+            language_found = options.get("language")
 
-        if progress_task:
-            await progress_task
+            def capture_language(value: str) -> None:
+                nonlocal language_found
+                language_found = value
 
-        if on_progress:
-            on_progress(95)
+            stitched = [
+                seg
+                async for seg in self._decode_long_form(
+                    samples, model_size, options, on_progress, capture_language, on_metrics
+                )
+            ]
+            result = {
+                "text": "".join(seg["text"] for seg in stitched),
+                "segments": stitched,
+                "language": language_found or "unknown",
+            }
+        else:
+            tracker = ProgressTracker(samples.shape[0], on_progress, on_metrics)
+            result = await self._infer(
+                samples,
+                model_size,
+                options,
+                on_frames=lambda frames: tracker.update(0, frames),
+                slot=slot,
+            )
 
         segments = [
             TranscriptionSegment(
@@ -83,11 +231,106 @@ class WhisperAdapter(WhisperService):
             for i, seg in enumerate(result["segments"])
         ]
 
-        if on_progress:
-            on_progress(100)
-
         return WhisperResult(
             text=result["text"].strip(),
             segments=segments,
             language=result.get("language", "unknown"),
         )
+
+    async def detect_language(self, audio: AudioSource) -> LanguageDetection:
+        loop = asyncio.get_running_loop()
+
+        def run_detection() -> LanguageDetection:
+            samples = whisper.pad_or_trim(load_audio(audio, max_seconds=_DETECT_SECONDS))
+            registry = self._registry(self._device)
+            with registry.acquire_smallest(self._detect_model_size) as model:
+                mel = whisper.log_mel_spectrogram(samples, model.dims.n_mels).to(model.device)
+                _, probabilities = model.detect_language(mel)
+            language = max(probabilities, key=probabilities.get)
+            return LanguageDetection(language=language, probability=probabilities[language])
+
+        return await loop.run_in_executor(self._detect_executor, run_detection)
+
+    async def transcribe_stream(
+        self,
+        audio: AudioSource,
+        language: Optional[str] = None,
+        model_size: Optional[str] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_language: Optional[Callable[[str], None]] = None,
+        on_metrics: Optional[Callable[[DecodeProgress], None]] = None,
+        slot: Optional[InferenceSlot] = None,
+    ) -> AsyncIterator[TranscriptionSegment]:
+        model_size = model_size or self._model_size
+        loop = asyncio.get_running_loop()
+        samples = await loop.run_in_executor(self._executor, load_audio, audio)
+
+        options: dict = {"verbose": False}
+        if language and language != "auto":
+            options["language"] = language
+
+        if self._is_long_form(samples):
+            segment_id = 0
+            async for seg in self._decode_long_form(
+                samples, model_size, options, on_progress, on_language, on_metrics
+            ):
+                text = seg["text"].strip()
+                if not text:
+                    continue
+                yield TranscriptionSegment(
+                    id=segment_id,
+                    start=seg["start"],
+                    end=seg["end"],
+                    text=text,
+                    confidence=seg.get("avg_logprob", 0),
+                )
+                segment_id += 1
+            return
+
+        windows = plan_windows(samples, self._stream_window_seconds, 0)
+        if not windows:
+            return
+
+        tracker = ProgressTracker(samples.shape[0], on_progress, on_metrics)
+
+        def infer_window(start: int, end: int, window_options: dict):
+            return self._infer(
+                samples[start:end],
+                model_size,
+                window_options,
+                on_frames=lambda frames: tracker.update(start, frames),
+                slot=slot,
+            )
+
+        first = await infer_window(*windows[0], options)
+        detected = options.get("language") or first.get("language")
+        if detected:
+            options["language"] = detected
+        if on_language:
+            on_language(detected or "unknown")
+
+        # Short audio decodes window by window inside the job's slot, each window
+        # conditioned on the text before it
+        segment_id = 0
+        previous_text = ""
+        for index, (start, end) in enumerate(windows):
+            if index == 0:
+                result = first
+            else:
+                prompt = {"initial_prompt": previous_text[-200:]} if previous_text else {}
+                result = await infer_window(start, end, {**options, **prompt})
+
+            offset = start / SAMPLE_RATE
+            for seg in result["segments"]:
+                text = seg["text"].strip()
+                if not text:
+                    continue
+                yield TranscriptionSegment(
+                    id=segment_id,
+                    start=seg["start"] + offset,
+                    end=seg["end"] + offset,
+                    text=text,
+                    confidence=seg.get("avg_logprob", 0),
+                )
+                segment_id += 1
+            previous_text = result["text"].strip()
@@ -0,0 +1,117 @@
+import html
+import re
+from typing import Optional
+from xml.etree import ElementTree
+
+from src.domain.entities import TranscriptionSegment
+
+CAPTION_FORMATS = ("srv3", "vtt")
+
+_VTT_TIMING = re.compile(
+    r"(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})\s+-->\s+(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})"
+)
+_VTT_TAG = re.compile(r"<[^>]*>")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _matches(track_language: str, language: str) -> bool:
+    return track_language == language or track_language.startswith(f"{language}-")
+
+
+def select_caption_track(
+    info: dict, language: Optional[str], include_automatic: bool
+) -> Optional[tuple[str, dict, bool]]:
+    """Picks a parseable caption track from a yt-dlp info dict.
+
+    Returns (language, format entry, automatic) or None. Without a requested language
+    only the video's own language is used. Automatic captions are only taken in the
+    spoken language: the other automatic tracks are machine translations of it.
+    """
+    spoken = info.get("language")
+    language = language or spoken
+    if not language:
+        return None
+
+    candidates: list[tuple[str, list[dict], bool]] = []
+    for track_language, formats in (info.get("subtitles") or {}).items():
+        if _matches(track_language, language):
+            candidates.append((track_language, formats, False))
+    if include_automatic:
+        automatic = info.get("automatic_captions") or {}
+        original = f"{language}-orig"
+        if original in automatic:
+            candidates.append((original, automatic[original], True))
+        elif spoken and _matches(spoken, language) and language in automatic:
+            candidates.append((language, automatic[language], True))
+
+    for track_language, formats, is_automatic in candidates:
+        by_ext = {f.get("ext"): f for f in formats if f.get("url")}
+        for ext in CAPTION_FORMATS:
+            if ext in by_ext:
+                return language, by_ext[ext], is_automatic
+    return None
+
+
+def _vtt_seconds(hours: Optional[str], minutes: str, seconds: str, millis: str) -> float:
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int(millis) / 1000
+
+
+def parse_vtt(text: str, rolling: bool = False) -> list[TranscriptionSegment]:
+    """Parses WebVTT cues into segments.
+
+    rolling is for YouTube's automatic captions, where every cue repeats the line shown
+    before it; only the lines new to each cue are kept.
+    """
+    segments: list[TranscriptionSegment] = []
+    previous: list[str] = []
+    for block in re.split(r"\n\s*\n", text.replace("\r\n", "\n")):
+        lines = block.strip().split("\n")
+        for i, line in enumerate(lines):
+            timing = _VTT_TIMING.search(line)
+            if timing:
+                break
+        else:
+            continue
+
+        start = _vtt_seconds(*timing.groups()[:4])
+        end = _vtt_seconds(*timing.groups()[4:])
+        body = [
+            _WHITESPACE.sub(" ", html.unescape(_VTT_TAG.sub("", line))).strip()
+            for line in lines[i + 1 :]
+        ]
+        body = [line for line in body if line]
+        if rolling:
+            new = [line for line in body if line not in previous]
+            previous = body
+            body = new
+        if body:
+            segments.append(
+                TranscriptionSegment(id=len(segments), start=start, end=end, text=" ".join(body))
+            )
+    return segments
+
+
+def parse_srv3(text: str) -> list[TranscriptionSegment]:
+    """Parses YouTube's timedtext format 3 (<p t="ms" d="ms">) into segments."""
+    segments: list[TranscriptionSegment] = []
+    for p in ElementTree.fromstring(text).iter("p"):
+        body = _WHITESPACE.sub(" ", "".join(p.itertext())).strip()
+        if not body:
+            continue
+        start = int(p.get("t", 0)) / 1000
+        end = start + int(p.get("d", 0)) / 1000
+        segments.append(TranscriptionSegment(id=len(segments), start=start, end=end, text=body))
+
+    # Automatic captions keep a line on screen while the next one is spoken
+    for segment, following in zip(segments, segments[1:]):
+        if segment.start < following.start < segment.end:
+            segment.end = following.start
+    return segments
+
+
+def parse_captions(ext: str, text: str, automatic: bool = False) -> list[TranscriptionSegment]:
+    if ext == "srv3":
+        return parse_srv3(text)
+    if ext == "vtt":
+        return parse_vtt(text, rolling=automatic)
+    raise ValueError(f"Unsupported caption format: {ext}")
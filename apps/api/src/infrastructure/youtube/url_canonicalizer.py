@@ -0,0 +1,56 @@
+import re
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_YOUTUBE_HOSTS = {
+    "youtube.com",
+    "www.youtube.com",
+    "m.youtube.com",
+    "music.youtube.com",
+    "youtube-nocookie.com",
+    "www.youtube-nocookie.com",
+}
+_PATH_PREFIXES = ("/shorts/", "/embed/", "/live/", "/v/")
+
+
+def extract_youtube_video_id(url: str) -> Optional[str]:
+    parsed = urlparse(url.strip() if "://" in url else f"https://{url.strip()}")
+    host = (parsed.hostname or "").lower()
+
+    candidate: Optional[str] = None
+    if host == "youtu.be":
+        candidate = parsed.path.lstrip("/").split("/")[0]
+    elif host in _YOUTUBE_HOSTS:
+        if parsed.path == "/watch":
+            candidate = parse_qs(parsed.query).get("v", [None])[0]
+        else:
+            for prefix in _PATH_PREFIXES:
+                if parsed.path.startswith(prefix):
+                    candidate = parsed.path[len(prefix) :].split("/")[0]
+                    break
+
+    if candidate and _VIDEO_ID.match(candidate):
+        return candidate
+    return None
+
+
+def canonicalize_youtube_url(url: str) -> Optional[str]:
+    """Returns https://www.youtube.com/watch?v=<id> for any single-video YouTube URL form."""
+    video_id = extract_youtube_video_id(url)
+    if not video_id:
+        return None
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+_COLLECTION_PREFIXES = ("/@", "/channel/", "/c/", "/user/")
+
+
+def is_youtube_collection_url(url: str) -> bool:
+    """True for playlist and channel URLs, which list many videos rather than naming one."""
+    parsed = urlparse(url.strip() if "://" in url else f"https://{url.strip()}")
+    if (parsed.hostname or "").lower() not in _YOUTUBE_HOSTS:
+        return False
+    if parsed.path == "/playlist":
+        return bool(parse_qs(parsed.query).get("list"))
+    return parsed.path.startswith(_COLLECTION_PREFIXES)
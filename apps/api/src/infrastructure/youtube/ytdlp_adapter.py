@@ -1,28 +1,181 @@
 import asyncio
-from typing import Callable, Optional
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Optional
 
 import yt_dlp
 
+from src.application.ports.caption_source import CaptionSource
+from src.application.ports.playlist_video_lister import PlaylistVideoLister
+from src.application.ports.profile_video_lister import ProfileVideoInfo
 from src.application.ports.video_downloader import VideoDownloader, VideoInfo
+from src.application.ports.whisper_service import WhisperResult
+from src.infrastructure.instagram.url_canonicalizer import canonicalize_instagram_url
+from src.infrastructure.youtube.captions import parse_captions, select_caption_track
+from src.infrastructure.youtube.url_canonicalizer import (
+    canonicalize_youtube_url,
+    extract_youtube_video_id,
+    is_youtube_collection_url,
+)
 
+logger = logging.getLogger(__name__)
 
-class YtdlpAdapter(VideoDownloader):
-    async def get_info(self, url: str) -> VideoInfo:
-        loop = asyncio.get_event_loop()
+_SAMPLE_RATE = 16000
 
-        def extract_info():
+AUDIO_FORMATS = ("original", "wav")
+
+_LISTING_DONE = object()
+
+
+class _InfoCache:
+    """Resolved info dicts by video id, for ttl_seconds and at most max_entries.
+
+    The TTL must stay well below the lifetime of the signed media URLs in the dicts.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, info = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return info
+
+    def put(self, key: str, info: dict) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+def _entry_to_video(entry: dict) -> ProfileVideoInfo:
+    video_id = entry.get("id")
+    url = entry.get("url") or entry.get("webpage_url") or ""
+    if not url.startswith("http"):
+        url = f"https://www.youtube.com/watch?v={video_id}"
+    return ProfileVideoInfo(
+        url=canonicalize_youtube_url(url) or url,
+        title=entry.get("title") or video_id or url,
+        owner_username=entry.get("channel") or entry.get("uploader"),
+        duration_seconds=entry.get("duration"),
+        views_count=entry.get("view_count"),
+    )
+
+
+class YtdlpAdapter(VideoDownloader, PlaylistVideoLister, CaptionSource):
+    """Downloads with yt-dlp.
+
+    audio_format "original" keeps the downloaded audio stream as is, with no transcode;
+    "wav" converts it once to 16 kHz mono PCM, Whisper's input format.
+
+    Each video is extracted once: get_info caches the resolved info dict, and download_audio
+    downloads from it without resolving the URL again. Every executor thread keeps one
+    configured YoutubeDL, since instances are not safe to share between threads.
+
+    Playlists and channels are listed with flat extraction, which reads the listing pages
+    without resolving each video; entries are yielded page by page as they are fetched.
+
+    Captions come from the same cached info dict, so checking them costs one subtitle
+    request on top of the extraction get_info already does.
+    """
+
+    def __init__(
+        self,
+        audio_format: str = "original",
+        info_cache_ttl_seconds: float = 1800,
+        info_cache_size: int = 512,
+    ):
+        if audio_format not in AUDIO_FORMATS:
+            raise ValueError(f"Unknown audio format: {audio_format}")
+        self._audio_format = audio_format
+        self._info_cache = _InfoCache(info_cache_ttl_seconds, info_cache_size)
+        self._local = threading.local()
+
+    def canonical_url(self, url: str) -> str:
+        return canonicalize_youtube_url(url) or canonicalize_instagram_url(url) or url.strip()
+
+    def _cache_key(self, url: str) -> str:
+        return extract_youtube_video_id(url) or self.canonical_url(url)
+
+    def _ydl(self) -> yt_dlp.YoutubeDL:
+        """This thread's YoutubeDL; progress goes to whatever callback the thread set last."""
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            ydl_opts = {
+                "format": "bestaudio/best",
+                "quiet": True,
+                "no_warnings": True,
+                "progress_hooks": [self._progress_hook],
+            }
+            if self._audio_format == "wav":
+                # Resample once here so Whisper can read the samples without decoding
+                ydl_opts["postprocessors"] = [
+                    {"key": "FFmpegExtractAudio", "preferredcodec": "wav"}
+                ]
+                ydl_opts["postprocessor_args"] = {
+                    "extractaudio": ["-ar", str(_SAMPLE_RATE), "-ac", "1", "-c:a", "pcm_s16le"]
+                }
+            ydl = self._local.ydl = yt_dlp.YoutubeDL(ydl_opts)
+        return ydl
+
+    def _flat_ydl(self) -> yt_dlp.YoutubeDL:
+        ydl = getattr(self._local, "flat_ydl", None)
+        if ydl is None:
             ydl_opts = {
                 "quiet": True,
                 "no_warnings": True,
-                "extract_flat": False,
+                "extract_flat": "in_playlist",
+                "lazy_playlist": True,
             }
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return VideoInfo(
-                    title=info.get("title", "Unknown"),
-                    duration_seconds=info.get("duration", 0),
-                    url=url,
-                )
+            ydl = self._local.flat_ydl = yt_dlp.YoutubeDL(ydl_opts)
+        return ydl
+
+    def _progress_hook(self, d: dict) -> None:
+        on_progress = getattr(self._local, "on_progress", None)
+        if on_progress and d["status"] == "downloading":
+            total = d.get("total_bytes") or d.get("total_bytes_estimate", 0)
+            downloaded = d.get("downloaded_bytes", 0)
+            if total > 0:
+                on_progress((downloaded / total) * 100)
+
+    def _extract(self, url: str) -> dict:
+        key = self._cache_key(url)
+        info = self._info_cache.get(key)
+        if info is None:
+            info = self._ydl().extract_info(url, download=False)
+            self._info_cache.put(key, info)
+        return info
+
+    async def get_info(self, url: str) -> VideoInfo:
+        loop = asyncio.get_event_loop()
+
+        def extract_info():
+            info = self._extract(url)
+            return VideoInfo(
+                title=info.get("title", "Unknown"),
+                duration_seconds=info.get("duration", 0),
+                url=url,
+            )
 
         return await loop.run_in_executor(None, extract_info)
 
@@ -34,33 +187,116 @@ class YtdlpAdapter(VideoDownloader):
     ) -> str:
         loop = asyncio.get_event_loop()
 
-        def progress_hook(d):
-            if on_progress and d["status"] == "downloading":
-                total = d.get("total_bytes") or d.get("total_bytes_estimate", 0)
-                downloaded = d.get("downloaded_bytes", 0)
-                if total > 0:
-                    on_progress((downloaded / total) * 100)
+        def download_from(ydl: yt_dlp.YoutubeDL, info: dict) -> dict:
+            # process_ie_result fills in the dict, so the cached copy stays untouched
+            return ydl.process_ie_result(copy.deepcopy(info), download=True)
 
         def download():
             output_template = output_path.rsplit(".", 1)[0]
-            ydl_opts = {
-                "format": "bestaudio/best",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "192",
-                    }
-                ],
-                "outtmpl": output_template,
-                "quiet": True,
-                "no_warnings": True,
-                "progress_hooks": [progress_hook],
-            }
+            ydl = self._ydl()
+            ydl.params["outtmpl"] = {"default": f"{output_template}.%(ext)s"}
+            self._local.on_progress = on_progress
+            try:
+                try:
+                    info = download_from(ydl, self._extract(url))
+                except yt_dlp.utils.DownloadError as e:
+                    # The cached media URLs may have expired; resolve the video again
+                    logger.info(f"Download from cached info failed, re-extracting {url}: {e}")
+                    key = self._cache_key(url)
+                    self._info_cache.discard(key)
+                    info = download_from(ydl, self._extract(url))
+            finally:
+                self._local.on_progress = None
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-
-            return f"{output_template}.mp3"
+            if self._audio_format == "wav":
+                return f"{output_template}.wav"
+            return ydl.prepare_filename(info)
 
         return await loop.run_in_executor(None, download)
+
+    async def get_captions(
+        self,
+        url: str,
+        language: Optional[str] = None,
+        include_automatic: bool = False,
+    ) -> Optional[WhisperResult]:
+        loop = asyncio.get_event_loop()
+
+        def fetch_captions():
+            track = select_caption_track(self._extract(url), language, include_automatic)
+            if track is None:
+                return None
+            track_language, caption_format, automatic = track
+            with self._ydl().urlopen(caption_format["url"]) as response:
+                text = response.read().decode("utf-8")
+            segments = parse_captions(caption_format["ext"], text, automatic)
+            return WhisperResult(
+                text=" ".join(segment.text for segment in segments),
+                segments=segments,
+                language=track_language,
+            )
+
+        return await loop.run_in_executor(None, fetch_captions)
+
+    def is_playlist_url(self, url: str) -> bool:
+        return is_youtube_collection_url(url)
+
+    async def stream_videos(
+        self,
+        playlist_url: str,
+        max_videos: Optional[int] = None,
+    ) -> AsyncIterator[ProfileVideoInfo]:
+        loop = asyncio.get_running_loop()
+        found: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def emit(item) -> None:
+            try:
+                loop.call_soon_threadsafe(found.put_nowait, item)
+            except RuntimeError:
+                stop.set()  # The event loop is gone; nobody is listening
+
+        def walk(ydl: yt_dlp.YoutubeDL, result: dict) -> None:
+            if "entries" not in result:
+                emit(_entry_to_video(result))
+                return
+            # With lazy_playlist the entries are a generator that fetches the next page
+            # only when the previous one is used up
+            for entry in result["entries"]:
+                if stop.is_set():
+                    return
+                if not entry:
+                    continue
+                if entry.get("_type") == "playlist" or entry.get("ie_key") == "YoutubeTab":
+                    # Channel pages list their tabs (Videos, Shorts, Live) as nested playlists
+                    if "entries" not in entry:
+                        try:
+                            entry = ydl.extract_info(entry["url"], download=False, process=False)
+                        except yt_dlp.utils.DownloadError as e:
+                            logger.info(f"Skipping {entry['url']} while listing: {e}")
+                            continue
+                    walk(ydl, entry)
+                else:
+                    emit(_entry_to_video(entry))
+
+        def enumerate_entries() -> None:
+            try:
+                ydl = self._flat_ydl()
+                walk(ydl, ydl.extract_info(playlist_url, download=False, process=False))
+            except Exception as e:
+                emit(e)
+            finally:
+                emit(_LISTING_DONE)
+
+        loop.run_in_executor(None, enumerate_entries)
+        count = 0
+        try:
+            while (item := await found.get()) is not _LISTING_DONE:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+                count += 1
+                if max_videos and count >= max_videos:
+                    return
+        finally:
+            stop.set()
@@ -0,0 +1,339 @@
+import dataclasses
+import logging
+import os
+from typing import Optional
+from uuid import UUID
+
+from src.application.ports import Job, TranscriptionQuery
+from src.application.use_cases.coalescing import TranscriptionFlights
+from src.application.use_cases.job_workers import JobLane, JobWorkers
+from src.application.use_cases.language_routing import LanguageRouting
+from src.application.use_cases.prefetch_pipeline import PrefetchPipeline
+from src.application.use_cases.transcribe_instagram_profile import (
+    TranscribeInstagramProfileInput,
+    TranscribeInstagramProfileUseCase,
+)
+from src.application.use_cases.transcribe_video import TranscribeVideoInput, TranscribeVideoUseCase
+from src.application.use_cases.transcribe_youtube import (
+    TranscribeYoutubeInput,
+    TranscribeYoutubeUseCase,
+)
+from src.application.use_cases.transcribe_youtube_batch import (
+    TranscribeYoutubeBatchInput,
+    TranscribeYoutubeBatchUseCase,
+)
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.events import (
+    InProcessEventBus,
+    PublishingBatchTranscriptionRepository,
+    PublishingTranscriptionRepository,
+)
+from src.infrastructure.export import TranscriptExporter
+from src.infrastructure.http import HttpMediaDownloader
+from src.infrastructure.instagram import ApifyAdapter
+from src.infrastructure.persistence import (
+    InMemoryBatchTranscriptionRepository,
+    InMemoryJobQueue,
+    InMemoryTranscriptionRepository,
+    SqliteBatchTranscriptionRepository,
+    SqliteDatabase,
+    SqliteJobQueue,
+    SqliteTranscriptionRepository,
+)
+from src.infrastructure.uploads import UploadStore
+from src.infrastructure.whisper import (
+    CachedWhisperService,
+    DeviceInferenceScheduler,
+    WhisperAdapter,
+    WhisperResultCache,
+    detect_device,
+    plan_slots,
+    pool_slots,
+)
+from src.infrastructure.youtube import YtdlpAdapter
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+if settings.persistence_backend == "sqlite":
+    database: Optional[SqliteDatabase] = SqliteDatabase(
+        os.path.join(settings.data_dir, "vidscribe.db")
+    )
+    transcription_store = SqliteTranscriptionRepository(
+        database,
+        cache_size=settings.sqlite_cache_size,
+        flush_interval=settings.sqlite_flush_interval_ms / 1000,
+    )
+    batch_store = SqliteBatchTranscriptionRepository(
+        database,
+        cache_size=settings.sqlite_cache_size,
+        flush_interval=settings.sqlite_flush_interval_ms / 1000,
+    )
+    job_queue = SqliteJobQueue(database)
+else:
+    logger.warning(
+        "PERSISTENCE_BACKEND=memory: queued jobs and transcriptions are lost on restart"
+    )
+    database = None
+    transcription_store = InMemoryTranscriptionRepository()
+    batch_store = InMemoryBatchTranscriptionRepository()
+    job_queue = InMemoryJobQueue()
+event_bus = InProcessEventBus(
+    throttle_interval=settings.progress_throttle_ms / 1000,
+    max_pending=settings.progress_subscriber_buffer,
+)
+repository = PublishingTranscriptionRepository(transcription_store, event_bus)
+batch_repository = PublishingBatchTranscriptionRepository(batch_store, event_bus)
+use_process_pool = (
+    settings.whisper_backend == "openai" and settings.whisper_inference_mode == "process"
+)
+if use_process_pool:
+    inference_slots = pool_slots(detect_device(), settings.whisper_workers)
+else:
+    inference_slots = plan_slots(
+        detect_device(),
+        cpu_slots=settings.whisper_workers,
+        cuda_slot_mb=settings.inference_cuda_slot_mb,
+        max_slots_per_gpu=settings.inference_max_slots_per_gpu,
+    )
+inference_scheduler = DeviceInferenceScheduler(inference_slots)
+if settings.whisper_backend == "openai":
+    whisper_adapter = WhisperAdapter(
+        model_size=settings.whisper_model_size,
+        memory_budget_mb=settings.whisper_model_memory_budget_mb,
+        inference_mode=settings.whisper_inference_mode,
+        workers=settings.whisper_workers if use_process_pool else len(inference_slots),
+        long_form_min_seconds=settings.whisper_long_form_min_seconds,
+        chunk_seconds=settings.whisper_chunk_seconds,
+        chunk_overlap_seconds=settings.whisper_chunk_overlap_seconds,
+        long_form_max_parallel=settings.whisper_long_form_max_parallel,
+        stream_window_seconds=settings.whisper_stream_window_seconds,
+        detect_model_size=settings.whisper_detect_model_size,
+    )
+elif settings.whisper_backend == "ctranslate2":
+    # Optional dependency: pip install -e ".[ctranslate2]"
+    from src.infrastructure.whisper.faster_whisper_adapter import FasterWhisperAdapter
+
+    whisper_adapter = FasterWhisperAdapter(
+        model_size=settings.whisper_model_size,
+        device=detect_device(),
+        compute_type=settings.whisper_compute_type,
+        workers=len(inference_slots),
+        cpu_threads=inference_slots[0].num_threads,
+        download_root=settings.models_dir,
+        detect_model_size=settings.whisper_detect_model_size,
+    )
+else:
+    raise ValueError(f"Unknown Whisper backend: {settings.whisper_backend}")
+cached_whisper_service = (
+    CachedWhisperService(
+        whisper_adapter,
+        WhisperResultCache(
+            # Results are kept per backend, so switching backends never serves the other's
+            os.path.join(
+                settings.data_dir,
+                "whisper_cache"
+                if settings.whisper_backend == "openai"
+                else f"whisper_cache_{settings.whisper_backend}",
+            ),
+            max_bytes=settings.whisper_cache_max_mb * 1024 * 1024,
+        ),
+        default_model_size=settings.whisper_model_size,
+    )
+    if settings.whisper_cache_enabled
+    else None
+)
+whisper_service = cached_whisper_service or whisper_adapter
+language_routing = LanguageRouting(
+    models=settings.whisper_language_models_map,
+    allowed_languages=settings.whisper_allowed_languages_list,
+)
+youtube_downloader = YtdlpAdapter(
+    audio_format=settings.youtube_audio_format,
+    info_cache_ttl_seconds=settings.youtube_info_cache_ttl_seconds,
+    info_cache_size=settings.youtube_info_cache_size,
+)
+media_downloader = HttpMediaDownloader(
+    chunk_size=settings.download_chunk_size_kb * 1024,
+    range_parts=settings.download_range_parts,
+    range_min_bytes=settings.download_range_min_mb * 1024 * 1024,
+    per_host_connections=settings.download_per_host_connections,
+    max_retries=settings.download_max_retries,
+)
+transcript_exporter = TranscriptExporter(max_bytes=settings.export_cache_max_mb * 1024 * 1024)
+upload_store = UploadStore(
+    settings.upload_dir,
+    max_bytes=settings.upload_max_mb * 1024 * 1024,
+    chunk_size=settings.upload_chunk_size_kb * 1024,
+)
+transcription_flights = TranscriptionFlights()
+prefetch_pipeline = PrefetchPipeline(
+    download_concurrency=settings.batch_download_concurrency,
+    buffer_depth=settings.batch_prefetch_depth,
+    max_buffered_bytes=settings.batch_prefetch_max_mb * 1024 * 1024,
+)
+instagram_lister = (
+    ApifyAdapter(
+        api_token=settings.apify_api_token,
+        base_url=settings.apify_base_url,
+        cache_ttl_seconds=settings.apify_cache_ttl_seconds,
+        poll_interval=settings.apify_poll_interval_seconds,
+    )
+    if settings.apify_api_token
+    else None
+)
+
+TRANSCRIBE_VIDEO = "transcribe_video"
+TRANSCRIBE_YOUTUBE = "transcribe_youtube"
+TRANSCRIBE_INSTAGRAM_PROFILE = "transcribe_instagram_profile"
+TRANSCRIBE_YOUTUBE_BATCH = "transcribe_youtube_batch"
+
+# Single videos are claimed ahead of batches that are waiting for a worker
+SINGLE_PRIORITY = 10
+BATCH_PRIORITY = 0
+
+
+def job_payload(entity_id: UUID, input_data) -> dict:
+    return {"id": str(entity_id), "input": dataclasses.asdict(input_data)}
+
+
+async def _prepare_transcription_retry(job: Job) -> bool:
+    """Resets a transcription whose job was interrupted; False if it should not run again."""
+    transcription = await repository.get(UUID(job.payload["id"]))
+    if not transcription:
+        return False
+    if job.attempts > settings.job_max_attempts:
+        transcription.fail("Interrupted too many times")
+        await repository.save(transcription)
+        return False
+    transcription.restart()
+    await repository.save(transcription)
+    return True
+
+
+async def _prepare_batch_retry(job: Job) -> bool:
+    """Resets an interrupted batch and drops the transcriptions its last run created."""
+    batch = await batch_repository.get(UUID(job.payload["id"]))
+    if not batch:
+        return False
+    if job.attempts > settings.job_max_attempts:
+        batch.fail("Interrupted too many times")
+        await batch_repository.save(batch)
+        return False
+
+    while True:
+        page = await repository.list_summaries(TranscriptionQuery(limit=200, batch_id=batch.id))
+        for summary in page.items:
+            await repository.delete(summary.id)
+        if not page.next_cursor:
+            break
+    batch.restart()
+    await batch_repository.save(batch)
+    return True
+
+
+async def run_transcribe_video(job: Job) -> None:
+    if job.attempts > 1 and not await _prepare_transcription_retry(job):
+        return
+    input_data = TranscribeVideoInput(**job.payload["input"])
+    if cached_whisper_service and input_data.content_hash:
+        # The upload was hashed while it was received; the cache need not read it again
+        cached_whisper_service.remember_hash(input_data.file_path, input_data.content_hash)
+    use_case = TranscribeVideoUseCase(
+        whisper_service,
+        repository,
+        flights=transcription_flights,
+        scheduler=inference_scheduler,
+        language_routing=language_routing,
+    )
+    await use_case.execute(UUID(job.payload["id"]), input_data)
+
+
+async def run_transcribe_youtube(job: Job) -> None:
+    if job.attempts > 1 and not await _prepare_transcription_retry(job):
+        return
+    use_case = TranscribeYoutubeUseCase(
+        whisper_service,
+        youtube_downloader,
+        repository,
+        settings.upload_dir,
+        flights=transcription_flights,
+        scheduler=inference_scheduler,
+        caption_source=youtube_downloader if settings.youtube_use_captions else None,
+        include_automatic_captions=settings.youtube_use_automatic_captions,
+        language_routing=language_routing,
+    )
+    await use_case.execute(UUID(job.payload["id"]), TranscribeYoutubeInput(**job.payload["input"]))
+
+
+async def run_transcribe_instagram_profile(job: Job) -> None:
+    if not instagram_lister:
+        raise RuntimeError("Instagram batch transcription requires APIFY_API_TOKEN")
+    if job.attempts > 1 and not await _prepare_batch_retry(job):
+        return
+    os.makedirs(settings.upload_dir, exist_ok=True)
+    use_case = TranscribeInstagramProfileUseCase(
+        profile_video_lister=instagram_lister,
+        video_downloader=youtube_downloader,
+        media_downloader=media_downloader,
+        whisper_service=whisper_service,
+        transcription_repository=repository,
+        batch_repository=batch_repository,
+        upload_dir=settings.upload_dir,
+        flights=transcription_flights,
+        scheduler=inference_scheduler,
+        pipeline=prefetch_pipeline,
+        memory_budget_bytes=settings.media_memory_budget_mb * 1024 * 1024,
+        language_routing=language_routing,
+    )
+    await use_case.execute(
+        UUID(job.payload["id"]), TranscribeInstagramProfileInput(**job.payload["input"])
+    )
+
+
+async def run_transcribe_youtube_batch(job: Job) -> None:
+    if job.attempts > 1 and not await _prepare_batch_retry(job):
+        return
+    os.makedirs(settings.upload_dir, exist_ok=True)
+    use_case = TranscribeYoutubeBatchUseCase(
+        video_downloader=youtube_downloader,
+        whisper_service=whisper_service,
+        transcription_repository=repository,
+        batch_repository=batch_repository,
+        upload_dir=settings.upload_dir,
+        flights=transcription_flights,
+        scheduler=inference_scheduler,
+        pipeline=prefetch_pipeline,
+        playlist_lister=youtube_downloader,
+        caption_source=youtube_downloader if settings.youtube_use_captions else None,
+        include_automatic_captions=settings.youtube_use_automatic_captions,
+        language_routing=language_routing,
+    )
+    await use_case.execute(
+        UUID(job.payload["id"]), TranscribeYoutubeBatchInput(**job.payload["input"])
+    )
+
+
+job_workers = JobWorkers(
+    job_queue,
+    handlers={
+        TRANSCRIBE_VIDEO: run_transcribe_video,
+        TRANSCRIBE_YOUTUBE: run_transcribe_youtube,
+        TRANSCRIBE_INSTAGRAM_PROFILE: run_transcribe_instagram_profile,
+        TRANSCRIBE_YOUTUBE_BATCH: run_transcribe_youtube_batch,
+    },
+    workers=settings.job_workers,
+    visibility_timeout=settings.job_visibility_timeout_seconds,
+    poll_interval=settings.job_poll_interval_seconds,
+    # Batches get workers of their own so a few long batches cannot hold every worker
+    lanes=(
+        [
+            JobLane(
+                kinds=frozenset({TRANSCRIBE_INSTAGRAM_PROFILE, TRANSCRIBE_YOUTUBE_BATCH}),
+                workers=settings.job_batch_workers,
+            )
+        ]
+        if settings.job_batch_workers > 0
+        else []
+    ),
+)
@@ -0,0 +1,125 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+
+class MultipartError(Exception):
+    pass
+
+
+@dataclass
+class MultipartPart:
+    name: str
+    filename: Optional[str]
+    """None for plain form fields."""
+
+
+class MultipartReader:
+    """Reads multipart/form-data parts straight off a request body stream.
+
+    Nothing is spooled: part data is handed out as it arrives, so a file can be written,
+    hashed and size-checked while the client is still sending it. Parts are read in order
+    with next_part(), then read() or read_text().
+    """
+
+    def __init__(self, stream: AsyncIterator[bytes], content_type: str):
+        mime_type, params = parse_options_header(content_type)
+        boundary = params.get(b"boundary")
+        if mime_type != b"multipart/form-data" or not boundary:
+            raise MultipartError("Expected a multipart/form-data body")
+
+        self._stream = stream.__aiter__()
+        self._exhausted = False
+        self._finished = False
+        self._events: deque[tuple] = deque()
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_end": self._on_end,
+            },
+        )
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        self._events.append(("part", self._headers))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._events.append(("data", bytes(data[start:end])))
+
+    def _on_part_end(self) -> None:
+        self._events.append(("end",))
+
+    def _on_end(self) -> None:
+        self._finished = True
+
+    async def _next_event(self) -> Optional[tuple]:
+        while not self._events:
+            if self._exhausted:
+                if not self._finished:
+                    raise MultipartError("Multipart body ended early")
+                return None
+            try:
+                chunk = await self._stream.__anext__()
+            except StopAsyncIteration:
+                self._exhausted = True
+                continue
+            try:
+                self._parser.write(chunk)
+            except MultipartParseError as e:
+                raise MultipartError(f"Malformed multipart body: {e}") from e
+        return self._events.popleft()
+
+    async def next_part(self) -> Optional[MultipartPart]:
+        """Skips what is left of the current part; returns the next one, or None at the end."""
+        while (event := await self._next_event()) is not None:
+            if event[0] != "part":
+                continue
+            _, options = parse_options_header(event[1].get(b"content-disposition", b""))
+            filename = options.get(b"filename")
+            return MultipartPart(
+                name=options.get(b"name", b"").decode("utf-8", "replace"),
+                filename=filename.decode("utf-8", "replace") if filename is not None else None,
+            )
+        return None
+
+    async def read(self) -> AsyncIterator[bytes]:
+        """Yields the current part's data as it arrives."""
+        while (event := await self._next_event()) is not None:
+            if event[0] == "end":
+                return
+            if event[0] == "data":
+                yield event[1]
+
+    async def read_text(self, max_bytes: int) -> str:
+        data = b""
+        async for chunk in self.read():
+            data += chunk
+            if len(data) > max_bytes:
+                raise MultipartError(f"Form field exceeds {max_bytes} bytes")
+        return data.decode("utf-8", "replace")
@@ -0,0 +1,122 @@
+import json
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+
+from src.application.ports import TranscriptionQuery
+from src.domain.entities import BatchTranscription
+from src.infrastructure.events import EventJournal, JournalGapError, batch_topic
+from src.interface_adapters.api.dependencies import (
+    batch_repository,
+    event_bus,
+    repository,
+    settings,
+)
+
+router = APIRouter()
+
+_KEEPALIVE_SECONDS = 15
+_RETRY_MS = 3000
+
+
+def batch_counters(batch: BatchTranscription) -> dict:
+    return {
+        "id": str(batch.id),
+        "status": batch.status.value,
+        "progress": batch.progress,
+        "total_videos": batch.total_videos,
+        "completed_videos": batch.completed_videos,
+        "failed_videos": batch.failed_videos,
+        "error": batch.error_message,
+    }
+
+
+def batch_delta(item: Any) -> dict:
+    """One changed entity: the batch counters, or a single video's status and progress."""
+    if isinstance(item, BatchTranscription):
+        return {"event": "batch", "data": batch_counters(item)}
+    return {
+        "event": "transcription",
+        "data": {
+            "id": str(item.id),
+            "status": item.status.value,
+            "progress": item.progress,
+            "error": item.error_message,
+        },
+    }
+
+
+batch_journal = EventJournal(
+    event_bus,
+    render=batch_delta,
+    capacity=settings.batch_event_history,
+    retention_seconds=settings.batch_event_retention_seconds,
+)
+
+
+def _sse(event: str, data: dict, event_id: str) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _snapshot(batch_id: UUID, event_id: str) -> str:
+    batch = await batch_repository.get(batch_id)
+    items = []
+    cursor: Optional[str] = None
+    while True:
+        page = await repository.list_summaries(
+            TranscriptionQuery(limit=200, cursor=cursor, batch_id=batch_id)
+        )
+        items.extend(
+            {
+                "id": str(s.id),
+                "status": s.status.value,
+                "progress": s.progress,
+                "error": s.error_message,
+            }
+            for s in page.items
+        )
+        cursor = page.next_cursor
+        if not cursor:
+            break
+    data = {"batch": batch_counters(batch) if batch else None, "transcriptions": items}
+    return _sse("snapshot", data, event_id)
+
+
+async def _stream(batch_id: UUID, last_event_id: Optional[str]) -> AsyncIterator[str]:
+    yield f"retry: {_RETRY_MS}\n\n"
+    resume = last_event_id
+    while True:
+        try:
+            async with batch_journal.open(batch_topic(batch_id), resume) as reader:
+                if resume is None:
+                    yield await _snapshot(batch_id, reader.position)
+                while True:
+                    events = await reader.next(timeout=_KEEPALIVE_SECONDS)
+                    if not events:
+                        yield ": keepalive\n\n"
+                    for event_id, event in events:
+                        yield _sse(event["event"], event["data"], event_id)
+        except JournalGapError:
+            # Missed events are gone; start over from a full snapshot
+            resume = None
+
+
+@router.get("/transcriptions/batch/{batch_id}/events")
+async def stream_batch_events(
+    batch_id: UUID, last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")
+):
+    """Server-Sent Events: a snapshot on connect, then only what changed.
+
+    Reconnecting with Last-Event-ID resumes after that event when it is still retained,
+    and falls back to a new snapshot otherwise.
+    """
+    if not await batch_repository.get(batch_id):
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    return StreamingResponse(
+        _stream(batch_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
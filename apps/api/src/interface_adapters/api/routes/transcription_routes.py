@@ -1,37 +1,67 @@
 import os
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-import aiofiles
-from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Form, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from src.application.use_cases.transcribe_video import TranscribeVideoInput, TranscribeVideoUseCase
-from src.application.use_cases.transcribe_youtube import TranscribeYoutubeInput, TranscribeYoutubeUseCase
-from src.application.use_cases.transcribe_instagram_profile import (
-    TranscribeInstagramProfileInput,
-    TranscribeInstagramProfileUseCase,
+from src.application.ports import TranscriptionQuery, TranscriptionSummary
+from src.application.use_cases.transcribe_instagram_profile import TranscribeInstagramProfileInput
+from src.application.use_cases.transcribe_video import TranscribeVideoInput
+from src.application.use_cases.transcribe_youtube import TranscribeYoutubeInput
+from src.application.use_cases.transcribe_youtube_batch import TranscribeYoutubeBatchInput
+from src.domain.entities import BatchTranscription, Transcription
+from src.domain.entities.transcription import SourceType, TranscriptionStatus, VideoSource
+from src.infrastructure.export import CONTENT_TYPES
+from src.infrastructure.uploads import (
+    StoredUpload,
+    UploadSessionError,
+    UploadSessionNotFoundError,
+    UploadTooLargeError,
 )
-from src.application.use_cases.transcribe_youtube_batch import (
-    TranscribeYoutubeBatchInput,
-    TranscribeYoutubeBatchUseCase,
+from src.interface_adapters.api.dependencies import (
+    BATCH_PRIORITY,
+    SINGLE_PRIORITY,
+    TRANSCRIBE_INSTAGRAM_PROFILE,
+    TRANSCRIBE_VIDEO,
+    TRANSCRIBE_YOUTUBE,
+    TRANSCRIBE_YOUTUBE_BATCH,
+    batch_repository,
+    instagram_lister,
+    job_payload,
+    job_workers,
+    repository,
+    transcript_exporter,
+    upload_store,
+    youtube_downloader,
 )
-from src.domain.entities import BatchTranscription, Transcription
-from src.domain.entities.transcription import SourceType, VideoSource
-from src.infrastructure.config.settings import get_settings
-from src.infrastructure.instagram import ApifyAdapter
-from src.infrastructure.persistence import InMemoryBatchTranscriptionRepository, InMemoryTranscriptionRepository
-from src.infrastructure.whisper import WhisperAdapter
-from src.infrastructure.youtube import YtdlpAdapter
+from src.interface_adapters.api.multipart import MultipartError, MultipartReader
 
 router = APIRouter()
 
-settings = get_settings()
-repository = InMemoryTranscriptionRepository()
-batch_repository = InMemoryBatchTranscriptionRepository()
-whisper_service = WhisperAdapter(model_size=settings.whisper_model_size)
-youtube_downloader = YtdlpAdapter()
-instagram_lister = ApifyAdapter(api_token=settings.apify_api_token or "") if settings.apify_api_token else None
+# Form fields other than the file are short strings
+_MAX_FIELD_BYTES = 64 * 1024
+
+_TRANSCRIPTION_FORM = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                        "youtube_url": {"type": "string"},
+                        "upload_id": {"type": "string", "format": "uuid"},
+                        "language": {"type": "string", "default": "auto"},
+                        "model_size": {"type": "string", "default": "base"},
+                    },
+                }
+            }
+        },
+    }
+}
 
 
 class TranscriptionResponse(BaseModel):
@@ -41,8 +71,11 @@ class TranscriptionResponse(BaseModel):
     source_name: Optional[str] = None
     progress: float = 0.0
     text: Optional[str] = None
+    partial_text: Optional[str] = None
     language: Optional[str] = None
     error: Optional[str] = None
+    eta_seconds: Optional[float] = None
+    realtime_factor: Optional[float] = None
     views_count: Optional[int] = None
     likes_count: Optional[int] = None
     comments_count: Optional[int] = None
@@ -51,6 +84,28 @@ class TranscriptionResponse(BaseModel):
         from_attributes = True
 
 
+class TranscriptionSummaryResponse(BaseModel):
+    id: str
+    status: str
+    source_type: str
+    source_name: Optional[str] = None
+    progress: float = 0.0
+    language: Optional[str] = None
+    error: Optional[str] = None
+    model_used: str
+    batch_id: Optional[str] = None
+    views_count: Optional[int] = None
+    likes_count: Optional[int] = None
+    comments_count: Optional[int] = None
+    created_at: str
+    completed_at: Optional[str] = None
+
+
+class TranscriptionPageResponse(BaseModel):
+    items: list[TranscriptionSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
 class BatchTranscriptionResponse(BaseModel):
     id: str
     status: str
@@ -77,57 +132,122 @@ def transcription_to_response(t: Transcription) -> TranscriptionResponse:
         source_name=name,
         progress=t.progress,
         text=t.result.text if t.result else None,
+        partial_text=t.partial_text,
         language=t.result.language if t.result else None,
         error=t.error_message,
+        eta_seconds=t.eta_seconds,
+        realtime_factor=t.realtime_factor,
         views_count=t.source.views_count,
         likes_count=t.source.likes_count,
         comments_count=t.source.comments_count,
     )
 
 
-@router.post("/transcriptions", response_model=TranscriptionResponse)
-async def create_transcription(
-    background_tasks: BackgroundTasks,
-    file: Optional[UploadFile] = File(None),
-    youtube_url: Optional[str] = Form(None),
-    language: str = Form("auto"),
-    model_size: str = Form("base"),
-):
-    if not file and not youtube_url:
-        raise HTTPException(status_code=400, detail="Provide either a file or youtube_url")
+def summary_to_response(s: TranscriptionSummary) -> TranscriptionSummaryResponse:
+    return TranscriptionSummaryResponse(
+        id=str(s.id),
+        status=s.status.value,
+        source_type=s.source_type.value,
+        source_name=s.source_name,
+        progress=s.progress,
+        language=s.language,
+        error=s.error_message,
+        model_used=s.model_used,
+        batch_id=str(s.batch_id) if s.batch_id else None,
+        views_count=s.views_count,
+        likes_count=s.likes_count,
+        comments_count=s.comments_count,
+        created_at=s.created_at.isoformat(),
+        completed_at=s.completed_at.isoformat() if s.completed_at else None,
+    )
+
+
+async def receive_transcription_form(
+    request: Request,
+) -> tuple[dict[str, str], Optional[StoredUpload]]:
+    """Reads the form fields and streams the file part, if any, straight into the upload store.
+
+    The body is parsed as it arrives, so the size limit applies while the file is still
+    being received and the file is hashed in the same single pass to disk.
+    """
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("multipart/"):
+        form = await request.form()
+        return {key: value for key, value in form.items() if isinstance(value, str)}, None
+
+    fields: dict[str, str] = {}
+    upload: Optional[StoredUpload] = None
+    try:
+        reader = MultipartReader(request.stream(), content_type)
+        while part := await reader.next_part():
+            if part.filename is None:
+                fields[part.name] = await reader.read_text(_MAX_FIELD_BYTES)
+            elif part.name == "file" and part.filename and not upload:
+                upload = await upload_store.save(reader.read(), part.filename)
+    except BaseException as e:
+        if upload and os.path.exists(upload.path):
+            os.remove(upload.path)
+        if isinstance(e, UploadTooLargeError):
+            raise HTTPException(status_code=413, detail=str(e))
+        if isinstance(e, MultipartError):
+            raise HTTPException(status_code=400, detail=str(e))
+        raise
+    return fields, upload
+
+
+def finish_upload_session(upload_id: UUID) -> StoredUpload:
+    try:
+        return upload_store.finish(upload_id)
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except UploadSessionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
-    lang = language if language != "auto" else None
 
-    if file:
-        upload_dir = settings.upload_dir
-        os.makedirs(upload_dir, exist_ok=True)
+@router.post(
+    "/transcriptions", response_model=TranscriptionResponse, openapi_extra=_TRANSCRIPTION_FORM
+)
+async def create_transcription(request: Request):
+    fields, file_upload = await receive_transcription_form(request)
+    youtube_url = fields.get("youtube_url") or None
+    language = fields.get("language") or "auto"
+    model_size = fields.get("model_size") or "base"
+    try:
+        upload_id = UUID(fields["upload_id"]) if fields.get("upload_id") else None
+    except ValueError:
+        raise HTTPException(status_code=422, detail="upload_id must be a UUID")
 
-        file_ext = os.path.splitext(file.filename)[1] if file.filename else ".mp4"
-        file_path = os.path.join(upload_dir, f"{uuid4()}{file_ext}")
+    if not file_upload and not youtube_url and not upload_id:
+        raise HTTPException(
+            status_code=400, detail="Provide either a file, an upload_id or youtube_url"
+        )
 
-        async with aiofiles.open(file_path, "wb") as f:
-            content = await file.read()
-            await f.write(content)
+    lang = language if language != "auto" else None
+
+    if file_upload or upload_id:
+        upload = file_upload or finish_upload_session(upload_id)
 
         transcription = Transcription(
             source=VideoSource(
                 type=SourceType.UPLOAD,
-                filename=file.filename,
-                size_bytes=len(content),
+                filename=upload.filename,
+                size_bytes=upload.size_bytes,
             ),
             model_used=model_size,
         )
         await repository.save(transcription)
 
-        use_case = TranscribeVideoUseCase(whisper_service, repository)
         input_data = TranscribeVideoInput(
-            file_path=file_path,
-            filename=file.filename or "unknown",
-            file_size=len(content),
+            file_path=upload.path,
+            filename=upload.filename,
+            file_size=upload.size_bytes,
             language=lang,
             model_size=model_size,
+            content_hash=upload.content_hash,
+        )
+        await job_workers.enqueue(
+            TRANSCRIBE_VIDEO, job_payload(transcription.id, input_data), SINGLE_PRIORITY
         )
-        background_tasks.add_task(use_case.execute, transcription.id, input_data)
 
         return transcription_to_response(transcription)
 
@@ -140,19 +260,32 @@ async def create_transcription(
     )
     await repository.save(transcription)
 
-    use_case = TranscribeYoutubeUseCase(
-        whisper_service, youtube_downloader, repository, settings.upload_dir
-    )
     input_data = TranscribeYoutubeInput(url=youtube_url, language=lang, model_size=model_size)
-    background_tasks.add_task(use_case.execute, transcription.id, input_data)
+    await job_workers.enqueue(
+        TRANSCRIBE_YOUTUBE, job_payload(transcription.id, input_data), SINGLE_PRIORITY
+    )
 
     return transcription_to_response(transcription)
 
 
-@router.get("/transcriptions", response_model=list[TranscriptionResponse])
-async def list_transcriptions():
-    transcriptions = await repository.list_all()
-    return [transcription_to_response(t) for t in transcriptions]
+@router.get("/transcriptions", response_model=TranscriptionPageResponse)
+async def list_transcriptions(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    status: Optional[TranscriptionStatus] = None,
+    source_type: Optional[SourceType] = None,
+    batch_id: Optional[UUID] = None,
+):
+    query = TranscriptionQuery(
+        limit=limit, cursor=cursor, status=status, source_type=source_type, batch_id=batch_id
+    )
+    try:
+        page = await repository.list_summaries(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return TranscriptionPageResponse(
+        items=[summary_to_response(s) for s in page.items], next_cursor=page.next_cursor
+    )
 
 
 @router.get("/transcriptions/{transcription_id}", response_model=TranscriptionResponse)
@@ -166,6 +299,7 @@ async def get_transcription(transcription_id: UUID):
 @router.delete("/transcriptions/{transcription_id}")
 async def delete_transcription(transcription_id: UUID):
     deleted = await repository.delete(transcription_id)
+    transcript_exporter.invalidate(transcription_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Transcription not found")
     return {"status": "deleted"}
@@ -180,59 +314,17 @@ async def export_transcription(transcription_id: UUID, format: str = "txt"):
     if not transcription.result:
         raise HTTPException(status_code=400, detail="Transcription not completed")
 
-    if format == "txt":
-        return {"content": transcription.result.text, "format": "txt"}
-
-    elif format == "srt":
-        srt_content = ""
-        for i, seg in enumerate(transcription.result.segments, 1):
-            start = format_timestamp_srt(seg.start)
-            end = format_timestamp_srt(seg.end)
-            srt_content += f"{i}\n{start} --> {end}\n{seg.text}\n\n"
-        return {"content": srt_content, "format": "srt"}
-
-    elif format == "vtt":
-        vtt_content = "WEBVTT\n\n"
-        for seg in transcription.result.segments:
-            start = format_timestamp_vtt(seg.start)
-            end = format_timestamp_vtt(seg.end)
-            vtt_content += f"{start} --> {end}\n{seg.text}\n\n"
-        return {"content": vtt_content, "format": "vtt"}
-
-    elif format == "json":
-        return {
-            "content": {
-                "text": transcription.result.text,
-                "language": transcription.result.language,
-                "segments": [
-                    {
-                        "start": seg.start,
-                        "end": seg.end,
-                        "text": seg.text,
-                    }
-                    for seg in transcription.result.segments
-                ],
-            },
-            "format": "json",
-        }
-
-    raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
-
-
-def format_timestamp_srt(seconds: float) -> str:
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
-
-
-def format_timestamp_vtt(seconds: float) -> str:
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    if format not in CONTENT_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+
+    filename = f"transcription-{transcription.id}.{format}"
+    return StreamingResponse(
+        transcript_exporter.stream(
+            transcription.id, transcription.result, format, transcription.completed_at
+        ),
+        media_type=CONTENT_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 def batch_to_response(b: BatchTranscription) -> BatchTranscriptionResponse:
@@ -252,7 +344,6 @@ def batch_to_response(b: BatchTranscription) -> BatchTranscriptionResponse:
 
 @router.post("/transcriptions/batch/instagram", response_model=BatchTranscriptionResponse)
 async def create_instagram_batch(
-    background_tasks: BackgroundTasks,
     profile_url: str = Form(...),
     language: str = Form("auto"),
     model_size: str = Form("base"),
@@ -277,40 +368,39 @@ async def create_instagram_batch(
     )
     await batch_repository.save(batch)
 
-    os.makedirs(settings.upload_dir, exist_ok=True)
-
-    use_case = TranscribeInstagramProfileUseCase(
-        profile_video_lister=instagram_lister,
-        video_downloader=youtube_downloader,
-        whisper_service=whisper_service,
-        transcription_repository=repository,
-        batch_repository=batch_repository,
-        upload_dir=settings.upload_dir,
-    )
     input_data = TranscribeInstagramProfileInput(
         profile_url=profile_url,
         language=lang,
         model_size=model_size,
         max_videos=max_videos,
     )
-    background_tasks.add_task(use_case.execute, batch.id, input_data)
+    await job_workers.enqueue(
+        TRANSCRIBE_INSTAGRAM_PROFILE, job_payload(batch.id, input_data), BATCH_PRIORITY
+    )
 
     return batch_to_response(batch)
 
 
 @router.post("/transcriptions/batch/youtube", response_model=BatchTranscriptionResponse)
 async def create_youtube_batch(
-    background_tasks: BackgroundTasks,
     urls: str = Form(...),
     language: str = Form("auto"),
     model_size: str = Form("base"),
+    max_videos: Optional[int] = Form(None),
 ):
+    """Accepts video, playlist and channel URLs; playlists and channels are expanded."""
     url_list = [u.strip() for u in urls.split("\n") if u.strip()]
     if not url_list:
         raise HTTPException(status_code=400, detail="Provide at least one YouTube URL")
 
     lang = language if language != "auto" else None
-    label = f"{len(url_list)} YouTube videos"
+    playlists = sum(youtube_downloader.is_playlist_url(u) for u in url_list)
+    if not playlists:
+        label = f"{len(url_list)} YouTube videos"
+    elif len(url_list) == 1:
+        label = "YouTube playlist"
+    else:
+        label = f"{len(url_list)} YouTube links"
 
     batch = BatchTranscription(
         profile_url="youtube",
@@ -318,21 +408,15 @@ async def create_youtube_batch(
     )
     await batch_repository.save(batch)
 
-    os.makedirs(settings.upload_dir, exist_ok=True)
-
-    use_case = TranscribeYoutubeBatchUseCase(
-        video_downloader=youtube_downloader,
-        whisper_service=whisper_service,
-        transcription_repository=repository,
-        batch_repository=batch_repository,
-        upload_dir=settings.upload_dir,
-    )
     input_data = TranscribeYoutubeBatchInput(
         urls=url_list,
         language=lang,
         model_size=model_size,
+        max_videos=max_videos,
+    )
+    await job_workers.enqueue(
+        TRANSCRIBE_YOUTUBE_BATCH, job_payload(batch.id, input_data), BATCH_PRIORITY
     )
-    background_tasks.add_task(use_case.execute, batch.id, input_data)
 
     return batch_to_response(batch)
 
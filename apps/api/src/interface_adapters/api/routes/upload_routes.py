@@ -0,0 +1,76 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from pydantic import BaseModel
+
+from src.infrastructure.uploads import (
+    UploadSessionError,
+    UploadSessionNotFoundError,
+    UploadTooLargeError,
+)
+from src.infrastructure.uploads.upload_store import UploadSession
+from src.interface_adapters.api.dependencies import upload_store
+
+router = APIRouter()
+
+
+class CreateUploadRequest(BaseModel):
+    filename: str
+    size_bytes: Optional[int] = None
+
+
+class UploadSessionResponse(BaseModel):
+    id: str
+    filename: str
+    offset: int
+    size_bytes: Optional[int] = None
+
+
+def session_to_response(s: UploadSession) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        id=str(s.id), filename=s.filename, offset=s.offset, size_bytes=s.total_bytes
+    )
+
+
+def _http_error(e: Exception) -> HTTPException:
+    if isinstance(e, UploadTooLargeError):
+        return HTTPException(status_code=413, detail=str(e))
+    if isinstance(e, UploadSessionNotFoundError):
+        return HTTPException(status_code=404, detail=str(e))
+    return HTTPException(status_code=409, detail=str(e))
+
+
+@router.post("/uploads", response_model=UploadSessionResponse)
+async def create_upload(request: CreateUploadRequest):
+    try:
+        session = upload_store.create_session(request.filename, request.size_bytes)
+    except UploadTooLargeError as e:
+        raise _http_error(e)
+    return session_to_response(session)
+
+
+@router.get("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload(upload_id: UUID):
+    try:
+        session = upload_store.get_session(upload_id)
+    except UploadSessionError as e:
+        raise _http_error(e)
+    return session_to_response(session)
+
+
+@router.patch("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def append_upload(upload_id: UUID, request: Request, upload_offset: int = Header(...)):
+    """Appends the raw request body at Upload-Offset; after a dropped connection, GET the
+    upload for the offset that was kept and resume from there."""
+    try:
+        session = await upload_store.append(upload_id, upload_offset, request.stream())
+    except (UploadSessionError, UploadTooLargeError) as e:
+        raise _http_error(e)
+    return session_to_response(session)
+
+
+@router.delete("/uploads/{upload_id}")
+async def cancel_upload(upload_id: UUID):
+    upload_store.cancel(upload_id)
+    return {"status": "deleted"}
@@ -1,50 +1,111 @@
 import asyncio
-from typing import Dict
+from typing import Any, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from src.domain.entities import BatchTranscription, Transcription
+from src.infrastructure.events import (
+    Subscription,
+    SubscriptionOverflowError,
+    batch_topic,
+    transcription_topic,
+)
+from src.interface_adapters.api.dependencies import batch_repository, event_bus, repository
+
 router = APIRouter()
 
-connections: Dict[UUID, list[WebSocket]] = {}
-progress_updates: Dict[UUID, dict] = {}
+# Close code asking the client to reconnect, which resends the current state
+_TRY_AGAIN_LATER = 1013
 
 
-def notify_progress(transcription_id: UUID, transcription) -> None:
-    progress_updates[transcription_id] = {
+def progress_event(transcription: Transcription, include_text: bool = True) -> dict:
+    return {
         "type": "progress",
         "data": {
-            "id": str(transcription_id),
+            "id": str(transcription.id),
             "status": transcription.status.value,
             "progress": transcription.progress,
-            "text": transcription.result.text if transcription.result else None,
+            "eta_seconds": transcription.eta_seconds,
+            "error": transcription.error_message,
+            "text": (
+                transcription.result.text if include_text and transcription.result else None
+            ),
         },
     }
 
-    if transcription_id in connections:
-        for ws in connections[transcription_id]:
-            try:
-                asyncio.create_task(ws.send_json(progress_updates[transcription_id]))
-            except Exception:
-                pass
 
+def batch_event(batch: BatchTranscription) -> dict:
+    return {
+        "type": "batch",
+        "data": {
+            "id": str(batch.id),
+            "status": batch.status.value,
+            "progress": batch.progress,
+            "total_videos": batch.total_videos,
+            "completed_videos": batch.completed_videos,
+            "failed_videos": batch.failed_videos,
+            "error": batch.error_message,
+        },
+    }
 
-@router.websocket("/ws/transcriptions/{transcription_id}/progress")
-async def websocket_progress(websocket: WebSocket, transcription_id: UUID):
-    await websocket.accept()
 
-    if transcription_id not in connections:
-        connections[transcription_id] = []
-    connections[transcription_id].append(websocket)
+def _render(item: Any, include_text: bool) -> dict:
+    if isinstance(item, BatchTranscription):
+        return batch_event(item)
+    return progress_event(item, include_text)
+
 
+async def _forward(
+    websocket: WebSocket,
+    subscription: Subscription,
+    initial: Optional[Any],
+    include_text: bool,
+) -> None:
+    """Sends updates one at a time until the client leaves; slow clients get merged updates."""
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(websocket))
     try:
-        if transcription_id in progress_updates:
-            await websocket.send_json(progress_updates[transcription_id])
+        if initial is not None:
+            await websocket.send_json(_render(initial, include_text))
+        while True:
+            updates = asyncio.ensure_future(subscription.get())
+            done, _ = await asyncio.wait(
+                {updates, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if updates not in done:
+                updates.cancel()
+                return
+            for item in updates.result():
+                await websocket.send_json(_render(item, include_text))
+    except SubscriptionOverflowError:
+        await websocket.close(code=_TRY_AGAIN_LATER)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+
 
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    try:
         while True:
             await websocket.receive_text()
-
     except WebSocketDisconnect:
-        connections[transcription_id].remove(websocket)
-        if not connections[transcription_id]:
-            del connections[transcription_id]
+        pass
+
+
+@router.websocket("/ws/transcriptions/{transcription_id}/progress")
+async def websocket_progress(websocket: WebSocket, transcription_id: UUID):
+    await websocket.accept()
+    # Subscribe before reading the current state so no update falls in between
+    with event_bus.subscribe(transcription_topic(transcription_id)) as subscription:
+        transcription = await repository.get(transcription_id)
+        await _forward(websocket, subscription, transcription, include_text=True)
+
+
+@router.websocket("/ws/batches/{batch_id}/progress")
+async def websocket_batch_progress(websocket: WebSocket, batch_id: UUID):
+    """Streams the batch's counters and the progress of each of its videos."""
+    await websocket.accept()
+    with event_bus.subscribe(batch_topic(batch_id)) as subscription:
+        batch = await batch_repository.get(batch_id)
+        await _forward(websocket, subscription, batch, include_text=False)
@@ -3,7 +3,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.infrastructure.config.settings import get_settings
-from src.interface_adapters.api.routes import health_routes, transcription_routes
+from src.interface_adapters.api import dependencies
+from src.interface_adapters.api.routes import (
+    batch_event_routes,
+    health_routes,
+    transcription_routes,
+    upload_routes,
+)
+from src.interface_adapters.api.websocket import progress_handler
 
 
 @asynccontextmanager
@@ -11,8 +18,16 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     settings = get_settings()
     print(f"Starting VidScribe API with Whisper model: {settings.whisper_model_size}")
+    await dependencies.job_workers.start()
     yield
     print("Shutting down VidScribe API")
+    await dependencies.job_workers.stop()
+    await dependencies.media_downloader.close()
+    dependencies.whisper_adapter.close()
+    if dependencies.database:
+        await dependencies.transcription_store.flush()
+        await dependencies.batch_store.flush()
+        dependencies.database.close()
 
 
 app = FastAPI(
@@ -34,3 +49,6 @@ app.add_middleware(
 
 app.include_router(health_routes.router, prefix="/api/v1", tags=["Health"])
 app.include_router(transcription_routes.router, prefix="/api/v1", tags=["Transcription"])
+app.include_router(upload_routes.router, prefix="/api/v1", tags=["Uploads"])
+app.include_router(batch_event_routes.router, prefix="/api/v1", tags=["Transcription"])
+app.include_router(progress_handler.router, tags=["Progress"])
@@ -14,8 +14,11 @@ export interface Transcription {
   source_name?: string;
   progress: number;
   text?: string;
+  partial_text?: string;
   language?: string;
   error?: string;
+  eta_seconds?: number;
+  realtime_factor?: number;
   views_count?: number;
   likes_count?: number;
   comments_count?: number;
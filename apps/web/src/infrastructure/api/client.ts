@@ -9,9 +9,10 @@ interface StatusResponse {
   gpu_available: boolean;
 }
 
-interface ExportResponse {
-  content: string | object;
-  format: string;
+export interface TranscriptExport {
+  text: string;
+  language: string;
+  segments: { start: number; end: number; text: string }[];
 }
 
 class ApiClient {
@@ -67,14 +68,19 @@ class ApiClient {
     return res.json();
   }
 
-  async exportTranscription(
-    id: string,
-    format: string
-  ): Promise<ExportResponse> {
+  async exportTranscription(id: string, format: string): Promise<Blob> {
     const res = await fetch(
       `${this.baseUrl}/api/v1/transcriptions/${id}/export?format=${format}`
     );
     if (!res.ok) throw new Error("Failed to export transcription");
+    return res.blob();
+  }
+
+  async exportTranscriptionJson(id: string): Promise<TranscriptExport> {
+    const res = await fetch(
+      `${this.baseUrl}/api/v1/transcriptions/${id}/export?format=json`
+    );
+    if (!res.ok) throw new Error("Failed to export transcription");
     return res.json();
   }
 
@@ -228,8 +228,8 @@ export function BatchResult({
       const files = [];
       for (const t of completed) {
         try {
-          const exported = await api.exportTranscription(t.id, "json");
-          const data = { source_name: t.source_name, ...((exported.content as object) || {}) };
+          const exported = await api.exportTranscriptionJson(t.id);
+          const data = { source_name: t.source_name, ...exported };
           files.push({
             content: JSON.stringify(data, null, 2),
             filename: `${(t.source_name || t.id).replace(/[^a-zA-Z0-9_-]/g, "_").slice(0, 60)}.json`,
@@ -243,13 +243,13 @@ export function BatchResult({
         const results = [];
         for (const t of items) {
           try {
-            const exported = await api.exportTranscription(t.id, "json");
+            const exported = await api.exportTranscriptionJson(t.id);
             results.push({
               source_name: t.source_name,
               views_count: t.views_count,
               likes_count: t.likes_count,
               comments_count: t.comments_count,
-              ...((exported.content as object) || {}),
+              ...exported,
             });
           } catch {
             results.push({ source_name: t.source_name, text: t.text });
@@ -10,7 +10,7 @@ interface TranscriptionResultProps {
   onReset: () => void;
 }
 
-type ExportFormat = "txt" | "srt" | "vtt" | "json";
+type ExportFormat = "txt" | "srt" | "vtt" | "json" | "tsv";
 
 export function TranscriptionResult({
   transcription,
@@ -30,11 +30,7 @@ export function TranscriptionResult({
   const handleExport = async (format: ExportFormat) => {
     setExporting(format);
     try {
-      const result = await api.exportTranscription(transcription.id, format);
-      const content =
-        format === "json" ? JSON.stringify(result.content, null, 2) : String(result.content);
-
-      const blob = new Blob([content], { type: "text/plain" });
+      const blob = await api.exportTranscription(transcription.id, format);
       const url = URL.createObjectURL(blob);
       const a = document.createElement("a");
       a.href = url;
@@ -99,8 +95,8 @@ export function TranscriptionResult({
 
       <div className="bg-[#1a1a1a] rounded-xl p-6">
         <h3 className="text-white font-medium mb-4">Export Options</h3>
-        <div className="grid grid-cols-2 sm:grid-cols-4 gap-3">
-          {(["txt", "srt", "vtt", "json"] as ExportFormat[]).map((format) => (
+        <div className="grid grid-cols-2 sm:grid-cols-5 gap-3">
+          {(["txt", "srt", "vtt", "json", "tsv"] as ExportFormat[]).map((format) => (
             <button
               key={format}
               onClick={() => handleExport(format)}
@@ -113,7 +109,7 @@ export function TranscriptionResult({
           ))}
         </div>
         <p className="mt-4 text-gray-600 text-xs">
-          SRT and VTT formats include timestamps for subtitles
+          SRT and VTT formats include timestamps for subtitles; TSV has millisecond timings
         </p>
       </div>
     </div>